@@ -6,10 +6,11 @@ from runtime.threading.core.auto_clear_event import AutoClearEvent
 from runtime.threading.core.lock import Lock
 from runtime.threading.core.semaphore import Semaphore
 from runtime.threading.core.helpers import acquire_or_fail, signal_after
+from runtime.threading.core.timer_wheel import TimerWheel, Timer
 from runtime.threading.core.interrupt_signal import InterruptSignal
 from runtime.threading.core.interrupt import Interrupt
 from runtime.threading.core.defaults import (
-    DEFAULT_PARALLELISM, TASK_SUSPEND_AFTER, TASK_KEEP_ALIVE, POLL_INTERVAL
+    DEFAULT_PARALLELISM, TASK_SUSPEND_AFTER, TASK_KEEP_ALIVE, POLL_INTERVAL, TIMER_RESOLUTION, STREAM_BUFFER_SIZE
 )
 
 def sleep(time: float, /, interrupt: Interrupt | None = None) -> None:
@@ -26,6 +27,8 @@ __all__ = [
     'InterruptSignal',
     'Interrupt',
     'InterruptException',
+    'TimerWheel',
+    'Timer',
     'acquire_or_fail',
     'signal_after',
     'sleep',
@@ -33,4 +36,6 @@ __all__ = [
     'TASK_SUSPEND_AFTER',
     'TASK_KEEP_ALIVE',
     'POLL_INTERVAL',
+    'TIMER_RESOLUTION',
+    'STREAM_BUFFER_SIZE',
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from runtime.threading.core.concurrent.queue import Queue
+from runtime.threading.core.concurrent.priority_queue import PriorityQueue
 
 __all__ = (
     'Queue',
-)
\ No newline at end of file
+    'PriorityQueue',
+)
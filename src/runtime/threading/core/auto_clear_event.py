@@ -1,9 +1,34 @@
-from runtime.threading.core.event import Event
+from threading import Event as TEvent
+
+from runtime.threading.core.event import Event, Purpose
 
 class AutoClearEvent(Event):
     """ The AutoClearEvent class extends the basic Event by automatically clearing after being awaited.
+    In wake-one mode, each signal wakes a single waiter (like a semaphore holding at most one permit) instead of every waiter.
     """
+    __slots__ = [ "__wake_one" ]
+
+    def __init__(self, internal_event: TEvent | None = None, *, purpose: Purpose = "USER", wake_one: bool = False):
+        """Creates a new AutoClearEvent.
+
+        Args:
+            internal_event (TEvent | None, optional): A preexisting builtin event instance. Defaults to None.
+            purpose (Purpose, optional): The event purpose (used for testing). Defaults to "USER".
+            wake_one (bool, optional): Wake a single waiter per signal. Defaults to False.
+        """
+        super().__init__(internal_event, purpose = purpose)
+        self.__wake_one = wake_one
+
+    @property
+    def wake_one(self) -> bool:
+        """Indicates if each signal wakes a single waiter.
+        """
+        return self.__wake_one
+
+    @property
+    def _wakes_one(self) -> bool:
+        return self.__wake_one
 
     def _after_wait(self) -> None:
         if self.is_signaled:
-            super().clear()
\ No newline at end of file
+            super().clear()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import Sequence, Callable, TYPE_CHECKING
+
+from runtime.threading.core.continuation import Continuation
+from runtime.threading.core.continue_when import ContinueWhen
+
+if TYPE_CHECKING: # pragma: no cover
+    from runtime.threading.core.event import Event
+
+class CallbackContinuation(Continuation):
+    """A continuation which invokes a callback once, when one or all of the events are signaled.
+    The callback is invoked while the signaling event is locked, so it must be short and non-blocking.
+    """
+    __slots__ = [ "__callback", "__done" ]
+
+    def __init__(
+        self,
+        when: ContinueWhen,
+        events: Sequence[Event],
+        callback: Callable[[], None]
+    ):
+        super().__init__(when, events, None)
+        self.__callback = callback
+        self.__done = False
+
+    def try_continue(self, event: Event | None = None) -> bool:
+        with super().synchronization_lock:
+            if self.__done:
+                return True
+            elif not super().try_continue(event):
+                return False # pragma: no cover -- callback continuations are only used for single events
+            else:
+                self.__done = True
+                callback = self.__callback
+                del self.__callback
+                callback()
+                return True
@@ -0,0 +1,247 @@
+from __future__ import annotations
+from typing import TypeVar, Iterable, Iterator, Callable, Any, cast
+from heapq import heappush, heappop, heapify
+from itertools import count
+from time import time, perf_counter
+
+from runtime.threading.core.auto_clear_event import AutoClearEvent
+from runtime.threading.core.lock import Lock
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.parallel.pipeline.p_iterable import PIterator
+
+T = TypeVar("T")
+Tinput = TypeVar("Tinput")
+Toutput = TypeVar("Toutput")
+
+def default_priority(item: Any) -> float:
+    return 0
+
+class PriorityQueue(Iterable[T]):
+    """The PriorityQueue class is a thread-safe heap based priority queue, in which items with a higher
+    priority are dequeued first, and items with the same priority are dequeued in FIFO order.
+    With aging enabled, waiting items gain one priority level every 'aging' seconds, so that low
+    priority items are not starved by a steady flow of high priority items.
+    """
+    __slots__ = ["__heap", "__counter", "__priority", "__aging", "__epoch", "__lock", "__notify_event"]
+
+    def __init__(
+        self,
+        priority: Callable[[T], float] = default_priority,
+        aging: float | None = None
+    ):
+        """Creates a new PriorityQueue instance.
+
+        Args:
+            priority (Callable[[T], float], optional): A function returning the priority of an item (higher is more urgent). Defaults to 0 for all items.
+            aging (float | None, optional): The no. of seconds an item must wait to gain one priority level. Defaults to None (no aging).
+        """
+        if aging is not None and aging <= 0:
+            raise ValueError("Argument aging must be greater than 0")
+
+        self.__heap: list[tuple[float, int, T]] = []
+        self.__counter = count()
+        self.__priority = priority
+        self.__aging = aging
+        self.__epoch = perf_counter()
+        self.__lock = Lock()
+        self.__notify_event = AutoClearEvent(purpose = "CONCURRENT_QUEUE_NOTIFY", wake_one = True)
+
+    @property
+    def synchronization_lock(self) -> Lock: # pragma: no cover
+        """The internal lock used for synchronization
+        """
+        return self.__lock
+
+    @property
+    def aging(self) -> float | None:
+        """The no. of seconds an item must wait to gain one priority level (if any).
+        """
+        return self.__aging
+
+    @property
+    def is_empty(self) -> bool:
+        """Indicates if the queue is empty (at the time of the call).
+        """
+        return not self.__heap
+
+    @staticmethod
+    def from_items(items: Iterable[Tinput], priority: Callable[[Tinput], float] = default_priority, aging: float | None = None) -> PriorityQueue[Tinput]:
+        """Creates a new priority queue with preexisting items in it.
+
+        Args:
+            items (Iterable[Tinput]): The items to add.
+            priority (Callable[[Tinput], float], optional): A function returning the priority of an item. Defaults to 0 for all items.
+            aging (float | None, optional): The no. of seconds an item must wait to gain one priority level. Defaults to None.
+
+        Returns:
+            PriorityQueue[Tinput]: Returns a new priority queue.
+        """
+        queue: PriorityQueue[Tinput] = PriorityQueue(priority, aging)
+        for item in items:
+            queue.enqueue(item)
+        return queue
+
+    def enqueue(self, item: T) -> None:
+        """Adds an item to the queue according to its priority.
+
+        Args:
+            item (T): The item.
+        """
+        # the sort key is static: waiting one aging period is equivalent to being enqueued one priority level
+        # higher, which is the same as enqueueing later items one level lower - hence no re-sorting is needed
+        key = -self.__priority(item)
+        if self.__aging is not None:
+            key += (perf_counter() - self.__epoch) / self.__aging
+
+        with self.__lock:
+            heappush(self.__heap, (key, next(self.__counter), item))
+
+        self.__notify_event.signal()
+
+    def enqueue_many(self, items: Iterable[T]) -> None:
+        """Adds multiple items to the queue according to their priority, with a single lock acquisition and notification.
+
+        Args:
+            items (Iterable[T]): The items.
+        """
+        offset = (perf_counter() - self.__epoch) / self.__aging if self.__aging is not None else 0
+        keyed = [ (offset - self.__priority(item), item) for item in items ]
+
+        if not keyed:
+            return
+
+        with self.__lock:
+            for key, item in keyed:
+                heappush(self.__heap, (key, next(self.__counter), item))
+
+        self.__notify_event.signal()
+
+    def requeue(self, item: T) -> None:
+        """Adds an item to the beginning of the queue, regardless of its priority. This is used in cases when
+        a consumer is unsuccessful processing an item, and that item should be processed asap by another.
+
+        Args:
+            item (T): The item.
+        """
+        with self.__lock:
+            heappush(self.__heap, (float("-inf"), next(self.__counter), item))
+
+        self.__notify_event.signal()
+
+    def try_dequeue(self, timeout: float | None = None, interrupt: Interrupt | None = None) -> tuple[T | None, bool]:
+        """Tries to dequeue the item with the highest priority. If queue is empty or a timeout occurs, a default value or 'None, False' is returned.
+
+        Args:
+            timeout (float | None, optional): The operation timout. Defaults to None.
+            interrupt (Interrupt, optional): The Interrupt. Defaults to None.
+
+        Returns:
+            tuple[T | None, bool]: Returns a tuple containing the dequeued item and the operation result.
+        """
+        if self.__lock.acquire(timeout, interrupt = interrupt):
+            try:
+                if not self.__heap:
+                    return None, False
+
+                _, _, item = heappop(self.__heap)
+                remaining = len(self.__heap) > 0
+            finally:
+                self.__lock.release()
+
+            if remaining:
+                # a signal only wakes a single waiter, so the wakeup is passed on while items remain
+                self.__notify_event.signal()
+            return item, True
+        else:
+            return None, False # pragma: no cover
+
+    def dequeue(self, timeout: float | None = None, interrupt: Interrupt | None = None) -> T:
+        """Dequeues the item with the highest priority. If queue is empty, operation waits for an item to be added.
+
+        Args:
+            timeout (float | None, optional): The operation timout. Defaults to None.
+            interrupt (Interrupt, optional): The Interrupt. Defaults to None.
+
+        Raises:
+            TimeoutError: Raises a TimeoutError if operation times out.
+        """
+        t_start = time()
+        while True:
+            timeout = max(0, timeout-(time()-t_start)) if timeout is not None else None
+            result, success = self.try_dequeue(timeout, interrupt)
+
+            if success:
+                return cast(T, result)
+            elif timeout is None or timeout > 0:
+                self.__notify_event.wait(timeout, interrupt)
+                if interrupt is not None:
+                    interrupt.raise_if_signaled()
+            else:
+                raise TimeoutError
+
+    def remove(self, item: T) -> bool:
+        """Removes the first occurrence of an item from the queue, leaving the remaining items in place.
+
+        Args:
+            item (T): The item.
+
+        Returns:
+            bool: Returns True if the item was found and removed. Otherwise False.
+        """
+        with self.__lock:
+            for index, entry in enumerate(self.__heap):
+                if entry[2] == item:
+                    last = self.__heap.pop()
+                    if index < len(self.__heap):
+                        self.__heap[index] = last
+                        heapify(self.__heap)
+                    return True
+            return False
+
+    def try_remove_oldest(self, predicate: Callable[[T], bool]) -> tuple[T | None, bool]:
+        """Tries to remove the oldest (ie. first enqueued) item matching the predicate, regardless of its priority.
+
+        Args:
+            predicate (Callable[[T], bool]): A function returning True for items which may be removed.
+
+        Returns:
+            tuple[T | None, bool]: Returns a tuple containing the removed item and the operation result.
+        """
+        with self.__lock:
+            oldest: int | None = None
+            for index, entry in enumerate(self.__heap):
+                if predicate(entry[2]) and ( oldest is None or entry[1] < self.__heap[oldest][1] ):
+                    oldest = index
+
+            if oldest is None:
+                return None, False
+
+            _, _, item = self.__heap[oldest]
+            last = self.__heap.pop()
+            if oldest < len(self.__heap):
+                self.__heap[oldest] = last
+                heapify(self.__heap)
+            return item, True
+
+    def __iter__(self) -> Iterator[T]:
+        return PriorityQueue.Iterator[T](self)
+
+    def __repr__(self) -> str:
+        with self.__lock:
+            return f"({', '.join(str(item) for _, _, item in sorted(self.__heap))})"
+
+    class Iterator(PIterator[Toutput]):
+        __slots__ = ["__queue"]
+
+        def __init__(self, queue: PriorityQueue[Toutput]):
+            self.__queue = queue
+
+        def __next__(self) -> Toutput:
+            return self.next()
+
+        def next(self, timeout: float | None = None, interrupt: Interrupt | None = None) -> Toutput:
+            result, success = self.__queue.try_dequeue(timeout, interrupt)
+            if success:
+                return cast(Toutput, result)
+            else:
+                raise StopIteration
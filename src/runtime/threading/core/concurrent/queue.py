@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypeVar, Iterable, Iterator, cast
+from typing import TypeVar, Iterable, Iterator, Callable, Any, cast
 from time import time
 
 from runtime.threading.core.auto_clear_event import AutoClearEvent
@@ -12,22 +12,31 @@ Tinput = TypeVar("Tinput")
 Toutput = TypeVar("Toutput")
 
 class Queue(Iterable[T]):
-    """The Queue class is a thread-safe doubly linked FIFO queue.
+    """The Queue class is a thread-safe linked FIFO queue. Items are added and removed at opposite ends
+    of the queue under separate locks, so that producers and consumers don't contend with each other.
     """
-    __slots__ = ["__head", "__tail", "__lock", "__notify_event"]
+    __slots__ = ["__first", "__last", "__enqueue_lock", "__lock", "__notify_event"]
 
     def __init__(self):
-        self.__head: Queue.Node | None = None
-        self.__tail: Queue.Node | None = None
+        # the first node is always a dummy node, whose successor holds the next item to be dequeued
+        self.__first = Queue.Node(None)
+        self.__last = self.__first
+        self.__enqueue_lock = Lock()
         self.__lock = Lock()
-        self.__notify_event = AutoClearEvent(purpose = "CONCURRENT_QUEUE_NOTIFY")
+        self.__notify_event = AutoClearEvent(purpose = "CONCURRENT_QUEUE_NOTIFY", wake_one = True)
 
     @property
     def synchronization_lock(self) -> Lock: # pragma: no cover
-        """The internal lock used for synchronization
+        """The internal lock used for synchronization (of the dequeuing end)
         """
         return self.__lock
 
+    @property
+    def is_empty(self) -> bool:
+        """Indicates if the queue is empty (at the time of the call).
+        """
+        return self.__first.next is None
+
     @staticmethod
     def from_items(items: Iterable[Tinput]) -> Queue[Tinput]:
         """Creates a new queue with preexisting items in it.
@@ -49,13 +58,31 @@ class Queue(Iterable[T]):
         Args:
             item (T): The item.
         """
-        with self.__lock:
-            node = Queue.Node(item, None, self.__head)
-            if self.__head:
-                self.__head.set_previous(node)
-            self.__head = node
-            if not self.__tail:
-                self.__tail = self.__head
+        node = Queue.Node(item)
+
+        with self.__enqueue_lock:
+            self.__last.next = node
+            self.__last = node
+
+        self.__notify_event.signal()
+
+    def enqueue_many(self, items: Iterable[T]) -> None:
+        """Adds multiple items to the end of the queue, with a single lock acquisition and notification.
+
+        Args:
+            items (Iterable[T]): The items.
+        """
+        first = last = Queue.Node(None)
+        for item in items:
+            last.next = Queue.Node(item)
+            last = last.next
+
+        if ( node := first.next ) is None:
+            return
+
+        with self.__enqueue_lock:
+            self.__last.next = node
+            self.__last = last
 
         self.__notify_event.signal()
 
@@ -66,13 +93,13 @@ class Queue(Iterable[T]):
         Args:
             item (T): The item.
         """
-        with self.__lock:
-            node = Queue.Node(item, self.__tail, None)
-            if self.__tail:
-                self.__tail.set_next(node)
-            self.__tail = node
-            if not self.__head:
-                self.__head = self.__tail
+        node = Queue.Node(item)
+
+        with self.__enqueue_lock, self.__lock:
+            node.next = self.__first.next
+            self.__first.next = node
+            if self.__last is self.__first:
+                self.__last = node
 
         self.__notify_event.signal()
 
@@ -88,22 +115,20 @@ class Queue(Iterable[T]):
         """
         if self.__lock.acquire(timeout, interrupt = interrupt):
             try:
-                if self.__tail:
-                    node = self.__tail
-                    if node.previous:
-                        self.__tail = node.previous
-                        node.previous.set_next(None)
-                    else:
-                        self.__tail = None
-                        self.__head = None
-
-                    value = node.clear()
-
-                    return value, True
-                else:
+                if ( node := self.__first.next ) is None:
                     return None, False
+
+                # the dequeued node becomes the new dummy node
+                self.__first = node
+                value, node.value = node.value, None
+                remaining = node.next is not None
             finally:
                 self.__lock.release()
+
+            if remaining:
+                # a signal only wakes a single waiter, so the wakeup is passed on while items remain
+                self.__notify_event.signal()
+            return value, True
         else:
             return None, False # pragma: no cover
 
@@ -124,23 +149,66 @@ class Queue(Iterable[T]):
 
             if success:
                 return cast(T, result)
-            elif timeout is None or ( timeout > 0 and self.__notify_event.wait(timeout, interrupt) ):
+            elif timeout is None or timeout > 0:
+                self.__notify_event.wait(timeout, interrupt)
                 if interrupt is not None:
                     interrupt.raise_if_signaled()
             else:
                 raise TimeoutError
 
+    def remove(self, item: T) -> bool:
+        """Removes the first occurrence of an item from the queue, leaving the remaining items in place.
+
+        Args:
+            item (T): The item.
+
+        Returns:
+            bool: Returns True if the item was found and removed. Otherwise False.
+        """
+        with self.__enqueue_lock, self.__lock:
+            previous = self.__first
+            while ( node := previous.next ) is not None:
+                if node.value == item:
+                    previous.next = node.next
+                    if node is self.__last:
+                        self.__last = previous
+                    node.next = node.value = None
+                    return True
+                previous = node
+            return False
+
+    def try_remove_oldest(self, predicate: Callable[[T], bool]) -> tuple[T | None, bool]:
+        """Tries to remove the oldest item matching the predicate, leaving the remaining items in place.
+
+        Args:
+            predicate (Callable[[T], bool]): A function returning True for items which may be removed.
+
+        Returns:
+            tuple[T | None, bool]: Returns a tuple containing the removed item and the operation result.
+        """
+        with self.__enqueue_lock, self.__lock:
+            previous = self.__first
+            while ( node := previous.next ) is not None:
+                if predicate(node.value):
+                    previous.next = node.next
+                    if node is self.__last:
+                        self.__last = previous
+                    value, node.next, node.value = node.value, None, None
+                    return value, True
+                previous = node
+            return None, False
+
     def __iter__(self) -> Iterator[T]:
         return Queue.Iterator[T](self)
 
     def __repr__(self) -> str:
-        with self.__lock:
+        with self.__enqueue_lock, self.__lock:
             nodes: list[str] = []
-            node = self.__tail
+            node = self.__first.next
 
             while node:
                 nodes.append(str(node.value))
-                node = node.previous
+                node = node.next
 
             return f"({', '.join(nodes)})"
 
@@ -162,37 +230,11 @@ class Queue(Iterable[T]):
 
 
     class Node:
-        __slots__ = [ "__value", "__previous", "__next" ]
-
-        def __init__(self, value: T, previous: Queue.Node | None, next: Queue.Node | None):
-            self.__value = value
-            self.__previous = previous
-            self.__next = next
-
-        @property
-        def previous(self) -> Queue.Node | None: # pragma: no cover
-
-            return self.__previous
-        @property
-        def next(self) -> Queue.Node | None: # pragma: no cover
-            return self.__next
-
-        @property
-        def value(self) -> T: # pragma: no cover
-            return self.__value # pyright: ignore[reportReturnType]
-
-        def set_previous(self, node: Queue.Node | None):
-            self.__previous = node
-
-        def set_next(self, node: Queue.Node | None):
-            self.__next = node
+        __slots__ = [ "value", "next" ]
 
-        def clear(self) -> T:
-            value = self.__value
-            self.__previous = None
-            self.__next = None
-            self.__value = None
-            return value # pyright: ignore[reportReturnType]
+        def __init__(self, value: Any):
+            self.value = value
+            self.next: Queue.Node | None = None
 
         def __repr__(self):
-            return str(self.__value) # pragma: no cover
+            return str(self.value) # pragma: no cover
@@ -9,7 +9,7 @@ if TYPE_CHECKING: # pragma: no cover
     from runtime.threading.core.interrupt import Interrupt
 
 class Continuation:
-    __slots__ = [ "__lock", "__when", "__what", "__done", "__interrupt", "__referrer__" ]
+    __slots__ = [ "__lock", "__when", "__what", "__done", "__interrupt", "__remaining", "__counted", "__trigger", "__referrer__", "__weakref__" ]
 
     def __init__(
         self,
@@ -18,13 +18,28 @@ class Continuation:
         interrupt: Interrupt | None
     ):
         self.__lock = Lock()
+        self.__counted: set[Event] = set()
+        self._reset(when, events, interrupt)
+
+    def _reset(
+        self,
+        when: ContinueWhen,
+        events: Sequence[Event],
+        interrupt: Interrupt | None
+    ) -> None:
+        """Resets the state of the continuation, which allows reusing it for awaiting other events.
+        """
         self.__when = when
         self.__what = tuple(events)
         self.__done = False
         self.__interrupt = interrupt
+        self.__counted.clear()
+        # no. of distinct events not yet counted as signaled (only used when awaiting all events)
+        self.__remaining = len(self.__what) if len(self.__what) < 2 or when == ContinueWhen.ANY else len(set(self.__what))
+        self.__trigger: Event | None = None
 
-        if interrupt and interrupt.wait_event not in events:
-            self.__what = ( interrupt.wait_event, *events )
+        if interrupt and interrupt.wait_event not in self.__what:
+            self.__what = ( interrupt.wait_event, *self.__what )
 
     @property
     def synchronization_lock(self) -> Lock:
@@ -43,10 +58,26 @@ class Continuation:
         return self.__interrupt
 
     @property
-    def is_done(self) -> bool: # pragma: no cover
+    def is_done(self) -> bool:
         return self.__done
 
-    def try_continue(self) -> bool:
+    @property
+    def trigger(self) -> Event | None:
+        """The event which completed the continuation (if any).
+        """
+        return self.__trigger
+
+    def try_continue(self, event: Event | None = None) -> bool:
+        """Checks if the continuation should continue, after the specified event was signaled.
+        Each signaled event is counted once, so that the check is O(1) until all events are counted,
+        at which point the events are rescanned, since some may have been cleared in the meantime.
+
+        Args:
+            event (Event | None, optional): The signaled event. Defaults to None (rescan all events).
+
+        Returns:
+            bool: Returns True if the continuation should continue. Otherwise False.
+        """
         with self.__lock:
             if self.__interrupt:
                 interrupt_event = self.__interrupt.wait_event
@@ -58,20 +89,38 @@ class Continuation:
 
             if self.__done:
                 return True
-
-            missing = len(
-                tuple(
-                    event
-                    for event in self.__what
-                    if event is not interrupt_event and  not event.is_signaled
-                )
-            )
-
-            if (
-                self.__when == ContinueWhen.ALL and missing == 0 or
-                self.__when == ContinueWhen.ANY and missing < len(self.__what)
-            ):
+            elif event is None or event is interrupt_event:
+                return self.__rescan(interrupt_event)
+            elif not event.is_signaled:
+                return False
+            elif self.__when == ContinueWhen.ANY:
                 self.__done = True
+                self.__trigger = event
                 return True
-            else:
+
+            if event not in self.__counted:
+                self.__counted.add(event)
+                self.__remaining -= 1
+
+            if self.__remaining > 0:
                 return False
+            else:
+                return self.__rescan(interrupt_event)
+
+    def __rescan(self, interrupt_event: Event | None) -> bool:
+        events = [ event for event in self.__what if event is not interrupt_event ]
+        signaled = [ event for event in events if event.is_signaled ]
+        counted = set(signaled)
+
+        if (
+            self.__when == ContinueWhen.ALL and len(counted) == len(set(events)) or
+            self.__when == ContinueWhen.ANY and counted
+        ):
+            self.__done = True
+            self.__trigger = signaled[0] if self.__when == ContinueWhen.ANY else None
+            self.__counted.clear()
+            return True
+        else:
+            self.__counted = counted
+            self.__remaining = len(set(events)) - len(counted)
+            return False
@@ -1,6 +1,16 @@
+import sys
 from multiprocessing import cpu_count
 
-DEFAULT_PARALLELISM = min(4, max(2, cpu_count())) # due to the fact that Python isn't truly multithreaded, a max of 4 shouldn't be exceeded for the default value
+GIL_ENABLED: bool = getattr(sys, "_is_gil_enabled", lambda: True)() # False on free-threaded (no-GIL) builds of Python 3.13+
+
+if GIL_ENABLED:
+    DEFAULT_PARALLELISM = min(4, max(2, cpu_count())) # due to the fact that Python isn't truly multithreaded, a max of 4 shouldn't be exceeded for the default value
+else:
+    DEFAULT_PARALLELISM = max(2, cpu_count()) # pragma: no cover -- threads run truly parallel without the GIL
 TASK_SUSPEND_AFTER = 0.1 # any less than 0.1 may cause stack owerflow
 TASK_KEEP_ALIVE = 0.1
-POLL_INTERVAL = 0.1
\ No newline at end of file
+POLL_INTERVAL = 0.1
+TASK_PRIORITY_AGING = 1.0
+DEFAULT_PROCESS_PARALLELISM = cpu_count() # worker processes aren't limited by the GIL
+TIMER_RESOLUTION = 0.001 # the precision (seconds) of timers held by the TimerWheel
+STREAM_BUFFER_SIZE = 1024 # the max. no. of items buffered by streaming tasks
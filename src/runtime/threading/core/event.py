@@ -2,13 +2,14 @@ from __future__ import annotations
 import sys
 from threading import Event as TEvent, current_thread, main_thread
 from typing import Sequence, Any, Literal, Annotated, overload, cast, TYPE_CHECKING
+from weakref import WeakSet
 from signal import signal, SIGTERM, SIGINT
 from time import time
 
 from runtime.threading.core.lock import Lock
 from runtime.threading.core.defaults import TASK_SUSPEND_AFTER, POLL_INTERVAL
 from runtime.threading.core.continuation import Continuation
-from runtime.threading.core.event_continuation import EventContinuation
+from runtime.threading.core.waiter import Waiter
 from runtime.threading.core.continue_when import ContinueWhen
 from runtime.threading.core.threading_exception import ThreadingException
 from runtime.threading.core.interrupt_exception import InterruptException
@@ -18,14 +19,15 @@ if TYPE_CHECKING:
     from runtime.threading.core.interrupt import Interrupt
 
 DEBUGGING = False
+NO_CONTINUATIONS: frozenset[Continuation] = frozenset() # shared by events until a continuation is added
 
 Purpose = Literal[ "USER", "TERMINATE", "CONTINUATION", "INTERRUPT_NOTIFY",
-                   "CONCURRENT_TASK_SCHEDULER_CLOSE", "TASK_NOTIFY",
-                   "CONCURRENT_QUEUE_NOTIFY", "PRODUCER_CONSUMER_QUEUE_NOTIFY" ]
+                   "CONCURRENT_TASK_SCHEDULER_CLOSE", "CONCURRENT_TASK_SCHEDULER_NOT_FULL", "WORK_STEALING_TASK_SCHEDULER_CLOSE", "ASYNCIO_TASK_SCHEDULER_CLOSE",
+                   "TASK_NOTIFY", "TASK_GROUP_JOIN", "CONCURRENT_QUEUE_NOTIFY", "PRODUCER_CONSUMER_QUEUE_NOTIFY", "PRODUCER_CONSUMER_QUEUE_NOT_FULL" ]
 class Event:
     """The Event class is used for synchronization between threads.
     """
-    __slots__ = [ "__id", "__lock", "__purpose", "__internal_event", "__continuations", "__weakref__" ]
+    __slots__ = [ "__id", "__lock", "__purpose", "__internal_event", "__continuations", "__weak_continuations", "__has_continuations", "__weakref__" ]
 
     @overload
     def __init__(self) -> None:
@@ -61,7 +63,9 @@ class Event:
         self.__lock = Lock()
         self.__purpose = purpose or "USER"
         self.__internal_event = internal_event or TEvent()
-        self.__continuations: set[Continuation] = set()
+        self.__continuations: set[Continuation] | frozenset[Continuation] = NO_CONTINUATIONS
+        self.__weak_continuations: WeakSet[Continuation] | None = None # continuations interruptible by this event
+        self.__has_continuations = False # read without locking, so that signaling an event nobody waits on is cheap
 
     @property
     def is_signaled(self) -> bool:
@@ -69,6 +73,13 @@ class Event:
         """
         return self.__internal_event.is_set()
 
+    @property
+    def continuation_count(self) -> int:
+        """The no. of continuations currently registered on the event (ie. pending waits and continuations).
+        """
+        with self.__lock:
+            return len(self.__continuations) + len(self.__weak_continuations or ())
+
     @property
     def purpose(self) -> Purpose: # pragma: no cover
         """Returns the event purpose (for testing).
@@ -79,20 +90,29 @@ class Event:
     def _internal_event(self) -> TEvent:
         return self.__internal_event # pragma: no cover
 
+    @property
+    def _wakes_one(self) -> bool:
+        """Indicates if each signal wakes only a single waiter, which consumes it. Overridable.
+        """
+        return False
+
 
     def signal(self) -> None:
         """Signals the event.
         """
-        with self.__lock:
-            self.__internal_event.set()
-            if self.__continuations:
-                self.__notify_continuations()
+        self.__internal_event.set()
+
+        # the flag is checked after setting the event, while continuations check the event after setting the flag,
+        # so a continuation added concurrently is always notified by one or the other
+        if self.__has_continuations:
+            with self.__lock:
+                if self.__continuations or self.__weak_continuations:
+                    self.__notify_continuations()
 
     def clear(self) -> None:
         """Clears the event flag rendering it not signaled.
         """
-        with self.__lock:
-            self.__internal_event.clear()
+        self.__internal_event.clear()
 
     def wait(
         self,
@@ -109,7 +129,9 @@ class Event:
             bool: A boolean value indicating if event was signaled or a timeout occurred
         """
 
-        if interrupt is not None:
+        if self._wakes_one:
+            return self.__wait_one(timeout, interrupt)
+        elif interrupt is not None:
             if Event.wait_any((self,), timeout, interrupt):
                 result = not interrupt.is_signaled # check if it was the event or the interrupt that was signaled
             else:
@@ -121,6 +143,29 @@ class Event:
             self._after_wait()
         return result
 
+    def __wait_one(self, timeout: float | None, interrupt: Interrupt | None) -> bool:
+        # a signal is either consumed here (if no one was waiting when it was signaled),
+        # or handed to a single waiter and consumed by the signaling thread
+        with self.__lock:
+            if self.__internal_event.is_set():
+                self._after_wait()
+                return True
+
+        if interrupt and interrupt.is_signaled:
+            return False
+
+        waiter = Waiter.acquire()
+        try:
+            if Event.__park(waiter, ContinueWhen.ANY, (self,), timeout, interrupt) and waiter.trigger is self:
+                if interrupt and interrupt.is_signaled:
+                    self.signal() # pass the signal on to another waiter
+                    return False
+                return True
+            else:
+                return False
+        finally:
+            waiter.release()
+
 
     @staticmethod
     def wait_any(
@@ -139,25 +184,39 @@ class Event:
             bool: Returns True if any of the events were signaled. Otherwise False.
         """
 
-        if interrupt and interrupt.is_signaled:
-            return False
+        return Event.wait_any_index(events, timeout, interrupt) is not None
 
-        combined_event = Event(purpose = "CONTINUATION")
+    @staticmethod
+    def wait_any_index(
+        events: Sequence[Event],
+        timeout: float | None = None, /,
+        interrupt: Interrupt | None = None
+    ) -> int | None:
+        """Waits for any of the specified events to be signaled, and returns the index of the first one signaled.
 
-        Event._add_continuation(
-            events,
-            EventContinuation(
-                ContinueWhen.ANY,
-                events,
-                combined_event,
-                interrupt
-            )
-        )
+        Args:
+            events (Sequence[Event]): The awaited events.
+            timeout (float | None, optional): Timeout (seconds) before returning None. Defaults to None.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
 
-        if Event.__int_wait(combined_event.__internal_event, timeout):
-            return not interrupt or not interrupt.is_signaled
-        else:
-            return False
+        Returns:
+            int | None: Returns the index of the event signaled, or None if a timeout occurred or the interrupt was signaled.
+        """
+
+        if interrupt and interrupt.is_signaled:
+            return None
+
+        waiter = Waiter.acquire()
+        try:
+            if Event.__park(waiter, ContinueWhen.ANY, events, timeout, interrupt) and ( trigger := waiter.trigger ) is not None:
+                if interrupt and interrupt.is_signaled:
+                    return None # pragma: no cover
+
+                return next(index for index, event in enumerate(events) if event is trigger)
+            else:
+                return None
+        finally:
+            waiter.release()
 
 
     @staticmethod
@@ -180,59 +239,114 @@ class Event:
         if interrupt and interrupt.is_signaled:
             return False
 
-        combined_event = Event(purpose = "CONTINUATION")
+        waiter = Waiter.acquire()
+        try:
+            if Event.__park(waiter, ContinueWhen.ALL, events, timeout, interrupt):
+                return not interrupt or not interrupt.is_signaled
+            else:
+                return False
+        finally:
+            waiter.release()
 
-        Event._add_continuation(
-            events,
-            EventContinuation(
-                ContinueWhen.ALL,
-                events,
-                combined_event,
-                interrupt
-            )
-        )
+    @staticmethod
+    def __park(
+        waiter: Waiter,
+        when: ContinueWhen,
+        events: Sequence[Event],
+        timeout: float | None,
+        interrupt: Interrupt | None
+    ) -> bool:
+        # the waiter of the current thread is reused for every wait, so no event or continuation is allocated
+        waiter.arm(when, events, interrupt)
+        Event._add_continuation(events, waiter)
 
-        if Event.__int_wait(combined_event.__internal_event, timeout):
-            return not interrupt or not interrupt.is_signaled
-        else:
-            return False
+        try:
+            Event.__int_wait(waiter.parker, timeout)
+        finally:
+            Event._remove_continuation(waiter)
+
+        # the wait may have been completed after timing out, but before the waiter was removed
+        return waiter.disarm()
 
     @staticmethod
     def _add_continuation(events: Sequence[Event], continuation: Continuation) -> None:
-        if continuation.interrupt and continuation.interrupt not in events:
-            events = ( continuation.interrupt.wait_event, *events )
+        # interrupts are often long-lived (or never signaled), so they only hold continuations weakly,
+        # and abandoned continuations are released once the awaited events are
+        if continuation.interrupt and ( interrupt_event := continuation.interrupt.wait_event ) not in events:
+            events = ( interrupt_event, *events )
+        else:
+            interrupt_event = None
 
         for event in events:
+            if continuation.is_done:
+                break # completed by an event already signaled, so there's no need to register on the rest
+
             if DEBUGGING and ( debugger := get_events_debugger() ): # pragma: no cover
                 debugger.register_continuation(event, continuation)
 
             with event.__lock:
-                event.__continuations.add(continuation)
+                if event is interrupt_event:
+                    if event.__weak_continuations is None:
+                        event.__weak_continuations = WeakSet()
+                    event.__weak_continuations.add(continuation)
+                else:
+                    if event.__continuations is NO_CONTINUATIONS:
+                        event.__continuations = set()
+                    cast(set[Continuation], event.__continuations).add(continuation)
+
+                event.__has_continuations = True
+
                 if event.__internal_event.is_set():
                     event.__notify_continuations()
 
 
+    @staticmethod
+    def _remove_continuation(continuation: Continuation) -> None:
+        for event in continuation.events:
+            with event.__lock:
+                event.__discard_continuation(continuation)
+
+    def __discard_continuation(self, continuation: Continuation) -> None:
+        if continuation in self.__continuations:
+            cast(set[Continuation], self.__continuations).remove(continuation)
+        elif self.__weak_continuations is not None and continuation in self.__weak_continuations:
+            self.__weak_continuations.remove(continuation)
+        else:
+            return
+
+        self.__has_continuations = bool(self.__continuations) or bool(self.__weak_continuations)
+
+        if DEBUGGING and ( debugger := get_events_debugger() ): # pragma: no cover
+            debugger.unregister_continuation(self, continuation)
+
+
     def __notify_continuations(self) -> None:
         with self.__lock:
             expedited: list[Continuation] = []
-            for continuation in self.__continuations.copy():
+            woken = False
+            wake_one = self._wakes_one
+            for continuation in ( *self.__continuations, *( self.__weak_continuations or () ) ):
+                if isinstance(continuation, Waiter) and ( continuation.is_completed or wake_one and woken ):
+                    continue # the waiter is already woken, or the signal was handed to another waiter
+
                 try:
-                    if continuation.try_continue():
-                        expedited.append(continuation)
+                    if continuation.try_continue(self):
+                        if isinstance(continuation, Waiter):
+                            woken = True # waiters are removed by their owners, since they're reused
+                        else:
+                            expedited.append(continuation)
 
                 except InterruptException:
-                    expedited.append(continuation)
+                    if not isinstance(continuation, Waiter): # waiters woken by their interrupt don't consume the signal
+                        expedited.append(continuation)
 
                 finally:
                     pass
 
         for continuation in expedited:
-            if DEBUGGING and ( debugger := get_events_debugger() ): # pragma: no cover
-                debugger.unregister_continuation(self, continuation)
-
             with self.__lock:
-                if continuation in self.__continuations: # required because events may remove continuations from other events (further down)
-                    self.__continuations.remove(continuation)
+                # required because events may remove continuations from other events (further down)
+                self.__discard_continuation(continuation)
 
         if DEBUGGING and ( debugger := get_events_debugger() ): # pragma: no cover
             debugger.unregister_continuation(self)
@@ -247,16 +361,14 @@ class Event:
                         try:
                             if continuation_event.is_signaled:
                                 continuation_event._after_wait()
-                            if continuation in continuation_event.__continuations: # check again since continuation might have been removed before acquiring the lock
-                                continuation_event.__continuations.remove(continuation)
-                                if DEBUGGING and ( debugger := get_events_debugger() ): # pragma: no cover
-                                    debugger.unregister_continuation(continuation_event, continuation)
+                            # check again since continuation might have been removed before acquiring the lock
+                            continuation_event.__discard_continuation(continuation)
                         finally:
                             continuation_event.__lock._internal_lock.release() # pyright: ignore[reportPrivateUsage]
                     else:
                         pass
 
-        if expedited: # only trigger after_wait if any continuations were expedited
+        if expedited or woken: # only trigger after_wait if any continuations were expedited
             self._after_wait()
 
 
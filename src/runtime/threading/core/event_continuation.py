@@ -10,7 +10,7 @@ if TYPE_CHECKING: # pragma: no cover
     from runtime.threading.core.interrupt import Interrupt
 
 class EventContinuation(Continuation):
-    __slots__ = [ "__event", "__done", "__weakref__" ]
+    __slots__ = [ "__event", "__done" ]
 
     def __init__(
         self,
@@ -23,12 +23,12 @@ class EventContinuation(Continuation):
         self.__event = then
         self.__done = False
 
-    def try_continue(self) -> bool:
+    def try_continue(self, event: Event | None = None) -> bool:
         with super().synchronization_lock:
             try:
                 if self.__done:
                     return True
-                elif not super().try_continue():
+                elif not super().try_continue(event):
                     return False
                 else:
                     self.__event.signal()
@@ -1,28 +1,24 @@
 from typing import Callable, ContextManager
 from types import TracebackType
-from threading import Thread
 
-from runtime.threading.core.event import terminate_event
 from runtime.threading.core.lock import Lock
 from runtime.threading.core.semaphore import Semaphore
 from runtime.threading.core.interrupt import Interrupt
 from runtime.threading.core.interrupt_signal import InterruptSignal
+from runtime.threading.core.timer_wheel import TimerWheel, Timer
 
-def signal_after(signal: InterruptSignal, time: float) -> None:
-    """Creates a task which signals an InterruptSignal instance after a certain
-    amount of time (seconds).
+def signal_after(signal: InterruptSignal, time: float) -> Timer:
+    """Signals an InterruptSignal instance after a certain amount of time (seconds).
+    The signal is held by the default TimerWheel, so no thread is occupied while waiting.
 
     Args:
         signal (InterruptSignal): The InterruptSignal instance to signal.
         time (float): The amount of time (seconds) before signaling.
-    """
-    def fn_signal():
-        terminate_event.wait(time)
-        signal.signal()
 
-    t = Thread(target = fn_signal)
-    t.start()
-    t.join()
+    Returns:
+        Timer: Returns the timer, which may be used to cancel the signal.
+    """
+    return TimerWheel.default().schedule(time, signal.signal)
 
 
 def acquire_or_fail(
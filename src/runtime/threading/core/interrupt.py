@@ -28,15 +28,13 @@ class Interrupt:
     def is_signaled(self) -> bool:
         """Indicates if Interrupt has been signaled.
         """
-        with self.__lock:
-            return self.__signal is not None
+        return self.__signal is not None # the signal is only ever set once, so reading it requires no lock
 
     @property
     def signal_id(self) -> int | None:
         """The id of the signal (if signaled).
         """
-        with self.__lock:
-            return self.__signal
+        return self.__signal
 
     @property
     def wait_event(self) -> Event:
@@ -68,10 +66,12 @@ class Interrupt:
     def none() -> Interrupt:
         """Returns a default interrupt which will never be signaled.
         """
-        with LOCK:
-            if Interrupt.__none__ is None:
-                Interrupt.__none__ = Interrupt()
-            return Interrupt.__none__
+        if ( none := Interrupt.__none__ ) is None:
+            with LOCK:
+                if Interrupt.__none__ is None:
+                    Interrupt.__none__ = Interrupt()
+                none = Interrupt.__none__
+        return none
 
     @staticmethod
     def _create(*linked_interrupts: Interrupt) -> tuple[Interrupt, Callable[[int], None]]:
@@ -103,9 +103,9 @@ class Interrupt:
     def raise_if_signaled(self) -> None:
         """Raises an InterruptException if signaled.
         """
-        with self.__lock:
-            if self.signal_id is not None and self.__ex:
-                raise self.__ex
+        # the exception is set before the signal, so it's always available once signaled
+        if self.__signal is not None and ( ex := self.__ex ):
+            raise ex
 
     def wait(
         self,
@@ -1,24 +1,29 @@
 from __future__ import annotations
 from threading import RLock, Lock as TLock, Semaphore
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 from types import TracebackType
 from datetime import datetime
+from collections import deque
+from contextlib import ExitStack
 
-from runtime.threading.core.defaults import TASK_SUSPEND_AFTER, POLL_INTERVAL
+from runtime.threading.core.defaults import TASK_SUSPEND_AFTER
 from runtime.threading.core.testing.debug import get_locks_debugger
 
 if TYPE_CHECKING: # pragma: no cover
     from runtime.threading.core.interrupt import Interrupt
+    from runtime.threading.core.waiter import Waiter
 
 DEBUGGING = False
+WAITERS_LOCK = TLock() # guards the lazy creation of waiter queues
 
 class LockBase:
     """The LockBase is the base class for locks and semaphores which share much of the the same logic.
     """
-    __slots__ = [ "__internal_lock" ]
+    __slots__ = [ "__internal_lock", "__waiters" ]
 
     def __init__(self, lock: RLock | TLock | Semaphore):
         self.__internal_lock = lock
+        self.__waiters: deque[Waiter] | None = None # threads awaiting the lock with an interrupt (created when needed)
 
     @property
     def _internal_lock(self) -> RLock | TLock | Semaphore:
@@ -47,13 +52,19 @@ class LockBase:
             if DEBUGGING and ( debugger := get_locks_debugger() ): # pragma: no cover
                 debugger.register_lock_wait(self.__internal_lock)
 
-            start_time = datetime.now()
             if timeout and timeout < 0: # pragma: no cover
                 raise ValueError("'timeout' must be a non-negative number")
 
             if interrupt is not None:
                 interrupt.raise_if_signaled()
 
+                if self.__internal_lock.acquire(False):
+                    return True
+                elif timeout == 0:
+                    return False
+                else:
+                    return self.__acquire_interruptibly(timeout, interrupt)
+
             if timeout is not None and timeout <= TASK_SUSPEND_AFTER:
                 return self.__internal_lock.acquire(True, timeout)
             else:
@@ -62,29 +73,89 @@ class LockBase:
                 elif timeout:
                     timeout -= TASK_SUSPEND_AFTER
 
+            start_time = datetime.now() # the remaining timeout is measured from here
             from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
             with TaskScheduler.current().suspend():
-                if interrupt is not None:
-                    while not interrupt.is_signaled:
-                        if self.__internal_lock.acquire(True, min(POLL_INTERVAL, timeout or POLL_INTERVAL)):
-                            return True
-                        elif timeout and (datetime.now()-start_time).total_seconds() >= timeout:
-                            return False
-
-                    interrupt.raise_if_signaled() # pragma: no cover
-                    return False # pragma: no cover
-                else:
-                    return self.__internal_lock.acquire(True, timeout or -1)
+                return self.__internal_lock.acquire(True, timeout or -1)
 
         finally:
             if DEBUGGING and ( debugger := get_locks_debugger() ): # pragma: no cover
                 debugger.unregister_lock_wait(self.__internal_lock)
 
+    def __acquire_interruptibly(self, timeout: float | None, interrupt: Interrupt) -> bool:
+        # the builtin lock cannot be awaited together with the interrupt, so the thread is parked on a waiter instead,
+        # which is woken either by a release of the lock or by the interrupt
+        from runtime.threading.core.event import Event
+        from runtime.threading.core.continue_when import ContinueWhen
+        from runtime.threading.core.waiter import Waiter
+        from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
+
+        if ( waiters := self.__waiters ) is None:
+            with WAITERS_LOCK:
+                if ( waiters := self.__waiters ) is None:
+                    waiters = self.__waiters = deque()
+
+        # a new waiter is used rather than the one of the thread, since a release may wake it after the wait is over
+        waiter = Waiter()
+        waiter.arm(ContinueWhen.ANY, (), interrupt)
+        Event._add_continuation((), waiter) # pyright: ignore[reportPrivateUsage]
+        start_time = datetime.now()
+        acquired = False
+
+        try:
+            with ExitStack() as suspension:
+                # the waiter is queued before trying the lock, so that a concurrent release is never missed
+                waiters.append(waiter)
+                suspended = False
+
+                while True:
+                    if self.__internal_lock.acquire(False):
+                        acquired = True
+                        return True
+                    elif interrupt.is_signaled:
+                        interrupt.raise_if_signaled()
+
+                    elapsed = (datetime.now()-start_time).total_seconds()
+                    if timeout is not None and elapsed >= timeout:
+                        return False
+                    elif not suspended and elapsed >= TASK_SUSPEND_AFTER:
+                        suspension.enter_context(TaskScheduler.current().suspend())
+                        suspended = True
+
+                    remaining = timeout - elapsed if timeout is not None else None
+                    if not suspended:
+                        remaining = min(remaining, TASK_SUSPEND_AFTER - elapsed) if remaining is not None else TASK_SUSPEND_AFTER - elapsed
+
+                    if waiter.parker.wait(remaining):
+                        waiter.parker.clear()
+                        if not interrupt.is_signaled:
+                            waiters.append(waiter) # woken by a release, which dequeued the waiter
+
+        finally:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                if not acquired:
+                    self.__wake_next() # the waiter was woken by a release, so the wakeup is passed on
+
+            Event._remove_continuation(waiter) # pyright: ignore[reportPrivateUsage]
+
+    def __wake_next(self) -> None:
+        try:
+            waiter = cast(deque["Waiter"], self.__waiters).popleft()
+        except IndexError: # pragma: no cover
+            return # the last waiter left in the meantime
+
+        waiter.wake()
+
     def release(self):
         """Releases the lock.
         """
         self.__internal_lock.release()
 
+        if self.__waiters: # wakes a single thread awaiting the lock with an interrupt (if any)
+            self.__wake_next()
+
 
 
 
@@ -122,29 +122,25 @@ class PContext():
     def root() -> PContext:
         """Returns the root parallel context. This is created automatically on a per-thread basis.
         """
-        with LOCK:
-            return STACK.get()[0]
+        return STACK.get()[0] # the stack is thread-local, hence no locking
 
     @staticmethod
     def current() -> PContext:
         """Returns the current parallel context. Defaults to the root context.
         """
-        with LOCK:
-            return STACK.get()[-1]
+        return STACK.get()[-1]
 
     @staticmethod
     def _register(parent: PContext) -> bool:
         """Used internally by tasks to register the context that the task was created in
         as a child context to the thread used by the task."""
-        with LOCK:
-            return STACK.try_register(parent)
+        return STACK.try_register(parent)
 
     @staticmethod
     def _unregister(parent: PContext) -> bool:
         """Used internally by tasks to unregister the context that the task was created in
         as a child context to the thread used by the task."""
-        with LOCK:
-            return STACK.try_unregister(parent)
+        return STACK.try_unregister(parent)
 
     def __enter__(self) -> PContext:
         with LOCK:
@@ -23,30 +23,47 @@ class ProducerConsumerQueue(Generic[T]):
     The workflow is as follows: The producer thread is responsible for putting items into the queue, and subsequently calline `complete()` when done, while the consumer merely
     consumes the items by either calling `try_take()` repeatedly or iterating over the iterator created by calling `get_iterator()`.
     """
-    __slots__ = [ "__lock", "__async_put_done", "__queue", "__notify_event", "__is_complete", "__is_failed", "__fail", "__is_async" ]
+    __slots__ = [
+        "__lock", "__async_put_done", "__queue", "__notify_event", "__is_complete", "__is_failed", "__fail", "__is_async",
+        "__max_size", "__count", "__not_full"
+    ]
 
     @overload
-    def __init__(self) -> None:
+    def __init__(self, *, max_size: int | None = None) -> None:
         """Creates a new empty ProducerConsumerQueue.
+
+        Args:
+            max_size (int | None, optional): The max. no. of items in the queue, before producers are blocked. Defaults to None (unbounded).
         """
         ...
     @overload
-    def __init__(self, data: Iterable[T]) -> None:
+    def __init__(self, data: Iterable[T], *, max_size: int | None = None) -> None:
         """Creates a new ProducerConsumerQueue with existing work.
 
         Args:
             data (Iterable[T]): Any preexisting work to be added to the queue.
+            max_size (int | None, optional): The max. no. of items in the queue, before producers are blocked. Defaults to None (unbounded).
         """
         ...
-    def __init__(self, data: Iterable[T] | None = None):
+    def __init__(self, data: Iterable[T] | None = None, *, max_size: int | None = None):
+        if max_size is not None and max_size < 1:
+            raise ValueError("Argument max_size must be greater than 0")
+
         self.__lock = Lock()
         self.__async_put_done = Event()
         self.__queue: Queue[T] = Queue()
-        self.__notify_event = AutoClearEvent(purpose = "PRODUCER_CONSUMER_QUEUE_NOTIFY")
+        self.__notify_event = AutoClearEvent(purpose = "PRODUCER_CONSUMER_QUEUE_NOTIFY", wake_one = True)
         self.__is_complete = False
         self.__is_failed = False
         self.__is_async = False
         self.__fail: Exception | None = None
+        self.__max_size = max_size
+        self.__count = 0 # no. of items in a bounded queue
+        self.__not_full: Event | None = None
+
+        if max_size is not None:
+            self.__not_full = Event(purpose = "PRODUCER_CONSUMER_QUEUE_NOT_FULL")
+            self.__not_full.signal()
 
         if data is not None:
             from runtime.threading.core.parallel.producer_consumer_queue_iterator import ProducerConsumerQueueIterator
@@ -58,6 +75,8 @@ class ProducerConsumerQueue(Generic[T]):
 
                 self.__put_many_async(cast(Iterable[T], data)).continue_with(ContinuationOptions.DEFAULT, complete)
                 self.__is_async = True
+            elif max_size is not None:
+                raise ValueError("Preexisting work cannot be added to a bounded queue, unless it's a ProducerConsumerQueueIterator")
             else:
                 self.put_many(data)
                 self.__is_complete = True
@@ -87,6 +106,12 @@ class ProducerConsumerQueue(Generic[T]):
         """
         return self.__is_async
 
+    @property
+    def max_size(self) -> int | None:
+        """The max. no. of items in the queue, before producers are blocked (None means unbounded).
+        """
+        return self.__max_size
+
     @property
     def wait_event(self) -> Event:
         """The internal event, signaled when items are added.
@@ -94,25 +119,26 @@ class ProducerConsumerQueue(Generic[T]):
         return self.__notify_event
 
 
-    def put(self, item: T) -> None:
-        """Adds an item to the queue.
+    def put(self, item: T, /, interrupt: Interrupt | None = None) -> None:
+        """Adds an item to the queue. If the queue is bounded and full, the call blocks until an item is taken.
 
         Args:
             item (T): The item.
+            interrupt (Interrupt, optional): The Interrupt. Defaults to None.
         """
         if self.__is_async:
             raise QueueLinkedToAnotherQueueError
         if self.__is_complete:
             raise QueueCompletedError
 
-        self.__queue.enqueue(item)
-        self.__notify_event.signal()
+        self.__enqueue(item, interrupt)
 
-    def put_many(self, items: Iterable[T]) -> None:
-        """Adds multiple items to the queue.
+    def put_many(self, items: Iterable[T], /, interrupt: Interrupt | None = None) -> None:
+        """Adds multiple items to the queue. If the queue is bounded and full, the call blocks until an item is taken.
 
         Args:
             items (Iterable[T]): The items.
+            interrupt (Interrupt, optional): The Interrupt. Defaults to None.
         """
         if self.__is_async:
             raise QueueLinkedToAnotherQueueError
@@ -120,14 +146,35 @@ class ProducerConsumerQueue(Generic[T]):
             raise QueueCompletedError
 
         for item in items:
-            self.__queue.enqueue(item)
-            self.__notify_event.signal()
+            self.__enqueue(item, interrupt)
+
+    def __enqueue(self, item: T, interrupt: Interrupt | None) -> None:
+        if ( not_full := self.__not_full ) is not None: # ie. bounded
+            while True:
+                with self.__lock:
+                    if self.__is_complete:
+                        raise QueueCompletedError
+                    elif self.__count < cast(int, self.__max_size):
+                        self.__count += 1
+                        if self.__count == self.__max_size:
+                            not_full.clear()
+                        break
+
+                if not not_full.wait(None, interrupt) and interrupt is not None:
+                    interrupt.raise_if_signaled()
+
+        self.__queue.enqueue(item)
+        self.__notify_event.signal()
+
+    def __dequeued(self) -> None:
+        with self.__lock:
+            self.__count -= 1
+            cast(Event, self.__not_full).signal()
 
     def __put_many_async(self, items: Iterable[T]) -> Task[Any]:
         def async_fill(task: Task[Any]):
             for item in items:
-                self.__queue.enqueue(item)
-                self.__notify_event.signal()
+                self.__enqueue(item, task.interrupt)
 
             self.__async_put_done.signal()
             self.__notify_event.signal()
@@ -159,10 +206,18 @@ class ProducerConsumerQueue(Generic[T]):
             timeout = max(0, timeout-(time()-t_start)) if timeout is not None else None
             try:
                 if self.__is_failed:
+                    # the failure is passed on to other consumers, since a signal only wakes one of them
+                    self.__notify_event.signal()
                     raise cast(Exception, self.__fail)
 
                 result = self.__queue.dequeue(timeout = timeout or 0, interrupt=interrupt)
 
+                if self.__max_size is not None:
+                    self.__dequeued()
+                if not self.__queue.is_empty:
+                    # likewise, the wakeup is passed on while items remain
+                    self.__notify_event.signal()
+
                 return result
             except TimeoutError:
                 if interrupt is not None:
@@ -171,13 +226,18 @@ class ProducerConsumerQueue(Generic[T]):
                 if self.__lock.acquire(0):
                     try:
                         if self.is_complete:
+                            # the notification of completion is passed on to other consumers, since the event
+                            # is cleared by the first consumer awaiting it, which may not be this one
+                            self.__notify_event.signal()
+
                             # if queue was completed in another thread, it may not be empty at this point,
                             # so we need to try to dequeue one more time just to make sure
+                            result = self.__queue.dequeue(0, interrupt = interrupt)
+
+                            if self.__max_size is not None:
+                                self.__dequeued() # pragma: no cover
 
-                            if result := self.__queue.dequeue(0, interrupt = interrupt):
-                                return result # pragma: no cover
-                            else:
-                                raise # pragma: no cover
+                            return result # pragma: no cover
 
                     except TimeoutError:
                         raise
@@ -223,6 +283,8 @@ class ProducerConsumerQueue(Generic[T]):
 
             self.__is_complete = True
         self.__notify_event.signal()
+        if self.__not_full is not None:
+            self.__not_full.signal() # blocked producers will fail
 
 
     def fail(self, error: Exception) -> None:
@@ -265,6 +327,8 @@ class ProducerConsumerQueue(Generic[T]):
                 pass
 
         self.__notify_event.signal()
+        if self.__not_full is not None:
+            self.__not_full.signal() # blocked producers will fail
 
     def get_iterator(self) -> PIterable[T]:
         """Returns a `ProducerConsumerQueueIterator[T]` used for blocking interruptable iteration.
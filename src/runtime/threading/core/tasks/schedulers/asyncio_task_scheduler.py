@@ -0,0 +1,171 @@
+from __future__ import annotations
+from typing import Any, ContextManager
+from types import TracebackType
+from threading import Thread, current_thread
+from asyncio import AbstractEventLoop, Task as AsyncioTask, new_event_loop, set_event_loop, get_running_loop
+from contextlib import nullcontext
+from time import perf_counter
+
+from runtime.threading.core.threading_exception import ThreadingException
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, TaskAlreadyStartedOrScheduledError, SchedulerClosedError
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_state import TaskState
+from runtime.threading.core.one_time_event import OneTimeEvent
+
+
+class AsyncioTaskScheduler(TaskScheduler):
+    """The AsyncioTaskScheduler class is a task scheduler which runs tasks on an asyncio event loop.
+    Targets may be coroutine functions, in which case the task completes when the coroutine does,
+    without occupying a thread while it's awaiting (and is cancelled when the task is interrupted).
+    Regular targets are run directly on the event loop thread, and should therefore not block.
+    """
+    __slots__ = [ "__loop", "__thread", "__pending", "__running", "__closed" ]
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop | None = None
+    ):
+        """Creates a new AsyncioTaskScheduler instance.
+
+        Arguments:
+            loop (AbstractEventLoop | None, optional): A running event loop to schedule tasks on. Defaults to None (a new loop is run on a dedicated thread)
+        """
+        super().__init__()
+
+        self.__pending = 0 # no. of tasks queued, but not yet started on the event loop
+        self.__running: dict[AsyncioTask[None], float] = {} # asyncio only keeps weak references to running tasks
+        self.__closed: OneTimeEvent | None = None
+
+        if loop is None:
+            self.__loop = new_event_loop()
+            self.__thread: Thread | None = Thread(target = self.__run_loop, name = "AsyncioTaskScheduler.Loop-Thread", daemon = True)
+            self.__thread.start()
+        else:
+            self.__loop = loop
+            self.__thread = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Returns True if scheduler is closed.
+        """
+        return self.__closed is not None
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """The event loop on which tasks are run.
+        """
+        return self.__loop
+
+    @property
+    def running_tasks(self) -> int:
+        """The no. of tasks currently running on the event loop (including those awaiting).
+        """
+        return self.__pending + len(self.__running)
+
+    def queue(self, task: Task[Any]) -> None:
+        """Queues the task. Should not be called directly - use Task.schedule(scheduler) instead...
+
+        Arguments:
+            task (Task): The task to schedule
+        """
+        with self.synchronization_lock:
+            if self.__closed is not None:
+                raise SchedulerClosedError
+
+            self.__pending += 1
+            self._record_queued(task)
+
+        def fn_start() -> None:
+            running = self.__loop.create_task(task._run_asynchronously(self)) # pyright: ignore[reportPrivateUsage]
+            counters = self._counters()
+            counters.tasks_started += 1
+            started = perf_counter()
+
+            if ( queued_at := task._queued_at ) is not None: # pyright: ignore[reportPrivateUsage]
+                counters.record_queue_wait(started - queued_at)
+
+            with self.synchronization_lock:
+                self.__pending -= 1
+                self.__running[running] = started
+
+            running.add_done_callback(self.__done)
+
+        self.__loop.call_soon_threadsafe(fn_start)
+
+    def _queue_depth(self) -> int:
+        """Returns the no. of tasks queued, but not yet started on the event loop.
+        """
+        return self.__pending
+
+    def prioritise(self, task: Task[Any]) -> None:
+        """Schedules a lazy task when awaited. Tasks cannot be run inline of others on an event loop.
+
+        Arguments:
+            task (Task): The task to run
+        """
+        if task.state > TaskState.SCHEDULED:
+            raise TaskAlreadyStartedOrScheduledError # pragma: no cover
+        elif task.state == TaskState.NOTSTARTED:
+            task.schedule(self)
+
+    def suspend(self) -> ContextManager[Any]:
+        """Suspends the current task. Since all tasks share the event loop thread, nothing is changed.
+        """
+        return nullcontext()
+
+    def close(self) -> None:
+        """Closes the scheduler and waits for any scheduled tasks to finish.
+        If the scheduler runs its own event loop, that loop is stopped and closed.
+        """
+        if ( current_thread() is self.__thread or self.__is_loop_thread() ) and self.running_tasks > 0:
+            raise ThreadingException("Cannot close scheduler with running tasks from within its own event loop")
+
+        self._close()
+
+    def _close(self) -> None:
+        if self.__closed is not None:
+            return
+
+        with self.synchronization_lock:
+            self.__closed = OneTimeEvent(purpose = "ASYNCIO_TASK_SCHEDULER_CLOSE")
+            if not self.__pending and not self.__running:
+                self.__closed.signal()
+
+        self.__closed.wait()
+
+        if self.__thread is not None:
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__thread.join()
+            self.__loop.close()
+
+    def __enter__(self) -> AsyncioTaskScheduler:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None):
+        self.close()
+
+    def __done(self, running: AsyncioTask[None]) -> None:
+        counters = self._counters()
+        counters.tasks_completed += 1
+
+        with self.synchronization_lock:
+            counters.record_run_time(perf_counter() - self.__running.pop(running))
+            if self.__closed is not None and not self.__pending and not self.__running:
+                self.__closed.signal()
+
+    def __is_loop_thread(self) -> bool:
+        try:
+            return get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
+
+    def __run_loop(self) -> None:
+        set_event_loop(self.__loop)
+        self._register()
+        try:
+            self.__loop.run_forever()
+        finally:
+            self._unregister()
+
+    def __finalize__(self) -> None:
+        self._close() # pragma: no cover
@@ -1,53 +1,84 @@
 from __future__ import annotations
-from typing import Any, MutableSequence, Callable, ContextManager, cast
+from typing import Any, MutableSequence, Sequence, Callable, ContextManager, cast
+from collections import deque
 from types import TracebackType
 from threading import Thread, Event as TEvent, current_thread
 from contextlib import nullcontext
 
 from runtime.threading.core.interrupt_exception import InterruptException
 from runtime.threading.core.threading_exception import ThreadingException
-from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, TaskAlreadyStartedOrScheduledError, SchedulerClosedError
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, TaskAlreadyStartedOrScheduledError, SchedulerClosedError, SchedulerQueueFullError, TaskDroppedError
+from runtime.threading.core.tasks.schedulers.queue_policy import QueuePolicy
 from runtime.threading.core.tasks.task import Task
 from runtime.threading.core.tasks.task_state import TaskState
 from runtime.threading.core.one_time_event import OneTimeEvent
+from runtime.threading.core.event import Event
+from runtime.threading.core.interrupt import Interrupt
 from runtime.threading.core.concurrent.queue import Queue
+from runtime.threading.core.concurrent.priority_queue import PriorityQueue
 from runtime.threading.core.interrupt_signal import InterruptSignal
 from runtime.threading.core.defaults import TASK_KEEP_ALIVE, DEFAULT_PARALLELISM
 
+RESUME = TEvent() # queued ahead of tasks to wake a parked thread, which then hands its slot to a resuming thread
+
+def is_task(item: Task[Any] | TEvent) -> bool:
+    return isinstance(item, Task)
 
 class ConcurrentTaskScheduler(TaskScheduler):
     """The ConcurrentTaskScheduler class is a task scheduler for concurrent workloads,
     with a predefined max degree of parallelism.
     """
-    __slots__ = [ "__max_parallelism", "__queue",
-                  "__threads", "__active_threads", "__suspended_threads",
-                  "__keep_alive", "__close", "__closed" ]
+    __slots__ = [ "__max_parallelism", "__min_threads", "__queue", "__backlog",
+                  "__threads", "__active_threads", "__idle_threads", "__suspended_threads", "__spare_threads", "__resuming",
+                  "__keep_alive", "__max_queue_size", "__queue_policy", "__not_full", "__close", "__closed" ]
 
     def __init__(
         self,
         max_parallelism: int = DEFAULT_PARALLELISM,
-        keep_alive: float = TASK_KEEP_ALIVE
+        keep_alive: float = TASK_KEEP_ALIVE,
+        min_threads: int = 0,
+        max_queue_size: int | None = None,
+        queue_policy: QueuePolicy = QueuePolicy.BLOCK
     ):
         """Creates a new ConcurrentTaskScheduler instance.
 
         Arguments:
             max_parallelism (int, optional): The max degree of parallelism. Defaults to the no. of CPUs
             keep_alive (float, optional): The no. of seconds to keep threads alive, before reclaiming them. Defaults to 0.1
+            min_threads (int, optional): The no. of threads to pre-warm and keep parked, instead of reclaiming them. Defaults to 0
+            max_queue_size (int | None, optional): The max no. of tasks waiting for a thread. Defaults to None (unbounded)
+            queue_policy (QueuePolicy, optional): The policy applied when queueing a task on a full queue. Defaults to QueuePolicy.BLOCK
         """
-        super().__init__()
-
         if max_parallelism < 1: # pragma: no cover
             raise ValueError("Argument max_parallelism must be greater than 0")
+        if min_threads < 0 or min_threads > max_parallelism:
+            raise ValueError("Argument min_threads must be between 0 and max_parallelism")
+        if max_queue_size is not None and max_queue_size < 1:
+            raise ValueError("Argument max_queue_size must be greater than 0")
+
+        super().__init__()
 
         self.__max_parallelism = max_parallelism
+        self.__min_threads = min_threads
         self.__keep_alive = keep_alive
-        self.__queue: Queue[Task[Any] | TEvent] = Queue()
+        self.__max_queue_size = max_queue_size
+        self.__queue_policy = queue_policy
+        self.__not_full = Event(purpose = "CONCURRENT_TASK_SCHEDULER_NOT_FULL")
+        self.__backlog = 0
+        self.__idle_threads = 0
+        self.__queue = self._create_queue()
         self.__threads: MutableSequence[Thread] = []
         self.__active_threads: MutableSequence[Thread] = []
         self.__suspended_threads: MutableSequence[Thread] = []
+        self.__spare_threads: list[ConcurrentTaskScheduler._Spare] = []
+        self.__resuming: deque[tuple[Thread, TEvent]] = deque()
         self.__close = InterruptSignal()
         self.__closed: OneTimeEvent | None = None
 
+        with self.synchronization_lock:
+            for _ in range(min_threads):
+                self.__start_thread(None, "ConcurrentTaskScheduler.Pool-Thread")
+
     @property
     def is_closed(self) -> bool:
         """Returns True if scheduler is closed.
@@ -60,12 +91,30 @@ class ConcurrentTaskScheduler(TaskScheduler):
         """
         return self.__max_parallelism
 
+    @property
+    def min_threads(self) -> int:
+        """The no. of threads kept parked when idle, instead of being reclaimed.
+        """
+        return self.__min_threads
+
     @property
     def keep_alive(self) -> float:
         """The no. of seconds to keep threads alive, before reclaiming them.
         """
         return self.__keep_alive
 
+    @property
+    def max_queue_size(self) -> int | None:
+        """The max no. of tasks waiting for a thread (if any).
+        """
+        return self.__max_queue_size
+
+    @property
+    def queue_policy(self) -> QueuePolicy:
+        """The policy applied when queueing a task on a full queue.
+        """
+        return self.__queue_policy
+
     @property
     def allocated_threads(self) -> int:
         """The no. of currently allocated threads. This does not include suspended threads.
@@ -79,28 +128,111 @@ class ConcurrentTaskScheduler(TaskScheduler):
         """
         return len(self.__active_threads)
 
+    @property
+    def idle_threads(self) -> int:
+        """The no. of active threads currently parked waiting for work.
+        """
+        return self.__idle_threads
+
     @property
     def suspended_threads(self) -> int:
         """The no. of currently suspended threads.
         """
         return len(self.__suspended_threads)
 
+    @property
+    def spare_threads(self) -> int:
+        """The no. of threads parked outside the active threads, waiting to be handed a slot.
+        """
+        return len(self.__spare_threads)
+
+    def _queue_depth(self) -> int:
+        """Returns the no. of tasks (and resuming threads) queued, but not yet started.
+        """
+        return self.__backlog
+
+    def _create_queue(self) -> Queue[Task[Any] | TEvent] | PriorityQueue[Task[Any] | TEvent]:
+        """Creates the queue holding tasks and resuming threads, when all threads are busy.
+        Defaults to a FIFO queue.
+        """
+        return Queue()
+
     def queue(self, task: Task[Any]) -> None:
         """Queues the task. Should not be called directly - use Task.schedule(scheduler) instead...
+        If the queue is full, the queue policy of the scheduler is applied.
 
         Arguments:
             task (Task): The task to schedule
         """
+        dropped: Task[Any] | None = None
+
+        while True:
+            with self.synchronization_lock:
+                if self.__closed is not None:
+                    raise SchedulerClosedError
+
+                if not self.__is_full():
+                    self._record_queued(task)
+                    self.__dispatch(task, task.name)
+                    return
+                elif self.__queue_policy == QueuePolicy.RAISE:
+                    raise SchedulerQueueFullError
+                elif self.__queue_policy == QueuePolicy.CALLER_RUNS:
+                    self._record_queued(task)
+                    break
+                elif self.__queue_policy == QueuePolicy.DROP_OLDEST:
+                    item, success = self.__queue.try_remove_oldest(is_task)
+                    if success:
+                        self.__backlog -= 1
+                        dropped = cast(Task[Any], item)
+                        self._record_queued(task)
+                        self.__dispatch(task, task.name)
+                        break
+
+                    # only resuming threads are queued, which can't be dropped - fall back to QueuePolicy.BLOCK
+                    self.__not_full.clear()
+                else:
+                    self.__not_full.clear()
+
+            # QueuePolicy.BLOCK - the producer waits for room in the queue, unless the task is interrupted in the meantime
+            # (if called from a task on this scheduler, the wait suspends it, and another thread is started to drain the queue)
+            if not self.__not_full.wait(interrupt = task.interrupt if task.interrupt is not Interrupt.none() else None):
+                task._interrupt_and_notify() # pyright: ignore[reportPrivateUsage]
+                return
+
+        if dropped is not None:
+            dropped._reject(TaskDroppedError) # pyright: ignore[reportPrivateUsage]
+        elif self.__queue_policy == QueuePolicy.CALLER_RUNS:
+            super()._run(task)
+
+    def queue_many(self, tasks: Sequence[Task[Any]]) -> None:
+        """Queues the tasks with a single lock acquisition and notification. Should not be called directly - use Task.run_many() instead...
+        If the queue is bounded, the tasks are queued one at a time, and the queue policy of the scheduler is applied.
+
+        Arguments:
+            tasks (Sequence[Task]): The tasks to schedule
+        """
+        if self.__max_queue_size is not None:
+            super().queue_many(tasks)
+            return
+
         with self.synchronization_lock:
             if self.__closed is not None:
                 raise SchedulerClosedError
 
-            if len(self.__active_threads) < self.__max_parallelism:
-                thread = Thread(target=self.__run, name = task.name, args=(task,))
-                self.__active_threads.append(thread)
-                thread.start()
-            else:
-                self.__queue.enqueue(task)
+            queued: list[Task[Any]] = []
+
+            for task in tasks:
+                self._record_queued(task)
+
+                # threads are started (or spare threads handed a slot) as long as max_parallelism permits it
+                if self.__idle_threads > self.__backlog + len(queued) or len(self.__active_threads) >= self.__max_parallelism:
+                    queued.append(task)
+                else:
+                    self.__start_thread(task, task.name)
+
+            self.__backlog += len(queued)
+            self.__queue.enqueue_many(queued)
 
     def prioritise(self, task: Task[Any]) -> None:
         """Runs the task inline of another.
@@ -112,10 +244,16 @@ class ConcurrentTaskScheduler(TaskScheduler):
             if self.__closed is not None:
                 raise SchedulerClosedError # pragma: no cover
 
-            if task.state > TaskState.SCHEDULED or ( task.state == TaskState.SCHEDULED and task not in self.__queue ):
+            if task.state > TaskState.SCHEDULED:
                 raise TaskAlreadyStartedOrScheduledError # pragma: no cover
 
             if ( current_task := self.current_task() ) and current_task.state == TaskState.RUNNING:
+                if task.state == TaskState.SCHEDULED:
+                    if not self.__queue.remove(task):
+                        raise TaskAlreadyStartedOrScheduledError # pragma: no cover
+                    self.__backlog -= 1
+                    self.__notify_not_full()
+
                 super()._run(task)
                 super()._resume(current_task)
             else:
@@ -129,7 +267,8 @@ class ConcurrentTaskScheduler(TaskScheduler):
         thread = current_thread()
 
         with self.synchronization_lock:
-            if not task or thread in self.__suspended_threads:
+            if not task or task.state != TaskState.RUNNING or thread in self.__suspended_threads:
+                # idle threads still referencing their last task are waiting for work, not suspended
                 return nullcontext()
             elif thread not in self.__active_threads:
                 return nullcontext() # pragma: no cover
@@ -139,11 +278,12 @@ class ConcurrentTaskScheduler(TaskScheduler):
                 self._refresh_task()
 
 
-                # add a new task so that no. of active tasks remains the same after the current is suspended
+                # hand the slot to a resuming thread, or to a spare (or new) thread if tasks are waiting for one,
+                # so that no. of active threads remains the same after the current is suspended
+                self._counters().suspensions += 1
                 self.__suspended_threads.append(thread)
-                self.__active_threads.remove(thread)
-                new_thread = Thread(target=self.__run, args=(None,), name="ConcurrentTaskScheduler.Non-Assigned-Thread")
-                new_thread.start()
+                if not self.__leave(thread) and self.__backlog > self.__idle_threads:
+                    self.__start_thread(None, "ConcurrentTaskScheduler.Non-Assigned-Thread")
 
 
                 def resume() -> None:
@@ -155,23 +295,30 @@ class ConcurrentTaskScheduler(TaskScheduler):
                     task.name = org_name + " *RESUMING"
                     self._refresh_task()
 
-                    event = TEvent()
-
-                    self.__queue.enqueue(event)
-
                     with self.synchronization_lock:
                         if len(self.__active_threads) < self.__max_parallelism:
-                            new_thread = Thread(target=self.__run, args=(None,), name="ConcurrentTaskScheduler.Resume-Thread")
-                            new_thread.start()
+                            self.__active_threads.append(resume_thread)
+                            event = None
+                        else:
+                            # wait for an active thread to hand over its slot, so that max_parallelism is not exceeded.
+                            # resuming threads go ahead of queued tasks, so that they finish first and release their resources
+                            event = TEvent()
+                            self.__resuming.append((resume_thread, event))
 
-                    event.wait()
+                            if self.__idle_threads > self.__backlog:
+                                self.__backlog += 1
+                                self.__queue.requeue(RESUME) # wake a parked thread to hand over its slot
+
+                    if event is not None:
+                        event.wait()
 
                     task.name = org_name
                     self._refresh_task()
 
                     with self.synchronization_lock:
                         self.__suspended_threads.remove(resume_thread)
-                        self.__active_threads.append(resume_thread)
+
+                    self._counters().resumes += 1
 
                 return ConcurrentTaskScheduler._SuspendedTask(resume)
 
@@ -191,6 +338,9 @@ class ConcurrentTaskScheduler(TaskScheduler):
         with self.synchronization_lock:
             self.__closed = OneTimeEvent(purpose = "CONCURRENT_TASK_SCHEDULER_CLOSE")
             self.__close.signal()
+            self.__not_full.signal() # wakes up blocked producers
+            for spare in self.__spare_threads:
+                spare.event.set() # wakes up spare threads, which exit since they're not handed a slot
             wait_for_close = self.allocated_threads > 0
 
         if wait_for_close:
@@ -204,57 +354,142 @@ class ConcurrentTaskScheduler(TaskScheduler):
     def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None):
         self.close()
 
+    def __dispatch(self, item: Task[Any] | TEvent, name: str) -> None:
+        # hands the item to a parked thread if one is available, otherwise a new thread is started
+        # as long as max_parallelism permits it - must be called while holding the synchronization lock
+        if self.__idle_threads > self.__backlog or len(self.__active_threads) >= self.__max_parallelism:
+            self.__backlog += 1
+            self.__queue.enqueue(item)
+        else:
+            self.__start_thread(item, name)
+
+    def __is_full(self) -> bool:
+        # the queue is full when the item would be queued (ie. neither be handed to a parked thread nor a new one),
+        # and the no. of items not claimed by parked threads has reached max_queue_size
+        return (
+            self.__max_queue_size is not None and
+            len(self.__active_threads) >= self.__max_parallelism and
+            self.__backlog - self.__idle_threads >= self.__max_queue_size
+        )
+
+    def __notify_not_full(self) -> None:
+        # must be called while holding the synchronization lock, whenever the backlog is decreased
+        if self.__max_queue_size is not None and not self.__not_full.is_signaled and not self.__is_full():
+            self.__not_full.signal()
+
+    def __start_thread(self, item: Task[Any] | TEvent | None, name: str) -> None:
+        # hands the slot (and item) to the most recently parked spare thread if any, otherwise a new thread is started
+        if self.__spare_threads:
+            spare = self.__spare_threads.pop()
+            self.__active_threads.append(spare.thread)
+            spare.item = item
+            spare.event.set()
+        else:
+            thread = Thread(target=self.__run, name = name, args=(item,))
+            self.__active_threads.append(thread)
+            self._counters().threads_spawned += 1
+            thread.start()
+
+    def __leave(self, thread: Thread) -> bool:
+        # removes the thread from the active threads and hands its slot to a resuming thread if any is waiting
+        # must be called while holding the synchronization lock
+        self.__active_threads.remove(thread)
+
+        if self.__resuming:
+            resume_thread, event = self.__resuming.popleft()
+            self.__active_threads.append(resume_thread)
+            event.set()
+            return True
+        else:
+            return False
+
+    def __park(self, thread: Thread) -> tuple[Task[Any] | TEvent | None, bool]:
+        # parks a thread which has left the active threads as a spare, until it's handed a slot (and item) or keep_alive
+        # seconds have passed - returns the item along with a value indicating if the thread was handed a slot
+        spare = ConcurrentTaskScheduler._Spare(thread)
+
+        with self.synchronization_lock:
+            if self.__closed is not None:
+                return None, False
+            self.__spare_threads.append(spare)
+
+        spare.event.wait(self.__keep_alive)
+
+        with self.synchronization_lock:
+            if spare in self.__spare_threads:
+                self.__spare_threads.remove(spare)
+                return None, False
+
+        return spare.item, True
+
     def __run(self, task: Task[Any] | TEvent | None) -> None:
         thread = current_thread()
         try:
             with self.synchronization_lock:
                 if thread not in self.__active_threads:
-                    self.__active_threads.append(thread)
+                    self.__active_threads.append(thread) # pragma: no cover
                 self._register()
 
-            keep_alive = True
-
-            while keep_alive:
-                try:
-                    while True:
-                        try:
-                            if isinstance(task, Task):
-                                super()._run(cast(Task[Any], task))
-                            elif isinstance(task, TEvent):
-                                task.set()
-                                break
-
-                        finally:
-                            with self.synchronization_lock:
-                                if len(self.__active_threads) > self.__max_parallelism:
-                                    self.__active_threads.remove(thread)
-                                    keep_alive = False
-                                    break
+            while True:
+                if isinstance(task, Task):
+                    super()._run(cast(Task[Any], task))
 
-                            task = self.__queue.dequeue(timeout = self.__keep_alive, interrupt = self.__close.interrupt)
+                with self.synchronization_lock:
+                    # resuming threads are handed the slot before any queued tasks are taken
+                    leave = bool(self.__resuming) or len(self.__active_threads) > self.__max_parallelism
+                    if leave:
+                        self.__leave(thread)
 
-                except (TimeoutError, InterruptException) as ex:
-                    if isinstance(ex, InterruptException) and ex.interrupt != self.__close.interrupt:
-                        raise # pragma: no cover
-
-                    try:
-                        task = self.__queue.dequeue(timeout = self.__keep_alive, interrupt = self.__close.interrupt)
-                    except (TimeoutError, InterruptException):
-                        if isinstance(ex, InterruptException) and ex.interrupt != self.__close.interrupt:
-                            raise # pragma: no cover
-
-                        with self.synchronization_lock:
-                            self.__active_threads.remove(thread)
-
-                        keep_alive = False
+                if leave:
+                    task, resumed = self.__park(thread)
+                    if not resumed:
+                        break
+                elif ( task := self.__next(thread) ) is None:
+                    break
 
         finally:
+            self._counters().threads_reclaimed += 1
+
             with self.synchronization_lock:
                 self._unregister()
                 if self.__closed is not None and len(self.__threads) == 0 and len(self.__suspended_threads) == 0:
                     self.__closed.signal()
 
+    def __next(self, thread: Thread) -> Task[Any] | TEvent | None:
+        # parks the thread until an item is available - threads within min_threads are parked indefinitely
+        # while others are reclaimed (ie. None is returned) after keep_alive seconds
+        while True:
+            with self.synchronization_lock:
+                timeout = None if len(self.__active_threads) <= self.__min_threads else self.__keep_alive
+                self.__idle_threads += 1
+
+            try:
+                item = self.__queue.dequeue(timeout = timeout, interrupt = self.__close.interrupt)
+
+                with self.synchronization_lock:
+                    self.__idle_threads -= 1
+                    self.__backlog -= 1
+                    self.__notify_not_full()
+                return item
+
+            except (TimeoutError, InterruptException) as ex:
+                if isinstance(ex, InterruptException) and ex.interrupt != self.__close.interrupt:
+                    raise # pragma: no cover
 
+                with self.synchronization_lock:
+                    self.__idle_threads -= 1
+
+                    # an item may have been handed to this thread just before it timed out
+                    item, success = self.__queue.try_dequeue()
+                    if success:
+                        self.__backlog -= 1
+                        self.__notify_not_full()
+                        return item
+                    elif self.__closed is None and len(self.__active_threads) <= self.__min_threads:
+                        continue
+
+                    self.__leave(thread)
+                    return None
 
     def _register(self) -> None:
         """Registers the current thread on the task scheduler.
@@ -275,6 +510,13 @@ class ConcurrentTaskScheduler(TaskScheduler):
     def __finalize__(self) -> None:
         self._close() # pragma: no cover
 
+    class _Spare:
+        __slots__ = ["thread", "event", "item"]
+        def __init__(self, thread: Thread):
+            self.thread = thread
+            self.event = TEvent()
+            self.item: Task[Any] | TEvent | None = None
+
     class _SuspendedTask:
         __slots__ = ["__resume"]
         def __init__(self, fn_resume: Callable[[], None]):
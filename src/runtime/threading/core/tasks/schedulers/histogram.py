@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Sequence
+
+BUCKETS = 32 # bucket i holds durations below 2^i µs, the last one holds anything longer
+
+def get_bucket(duration: float) -> int:
+    return min(int(duration * 1_000_000).bit_length(), BUCKETS - 1)
+
+def get_upper_bound(bucket: int) -> float:
+    return float("inf") if bucket == BUCKETS - 1 else ( 1 << bucket ) / 1_000_000
+
+class Histogram:
+    """The Histogram class is a snapshot of a distribution of durations (seconds), recorded
+    in exponential buckets where each bucket holds durations up to twice those of the previous one.
+    """
+    __slots__ = [ "__counts", "__count", "__total", "__max" ]
+
+    def __init__(self, counts: Sequence[int], total: float, max: float):
+        """Creates a new Histogram snapshot.
+
+        Args:
+            counts (Sequence[int]): The no. of durations recorded in each bucket.
+            total (float): The sum of all recorded durations.
+            max (float): The longest recorded duration.
+        """
+        self.__counts = tuple(counts)
+        self.__count = sum(counts)
+        self.__total = total
+        self.__max = max
+
+    @property
+    def count(self) -> int:
+        """The no. of recorded durations.
+        """
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        """The sum of all recorded durations.
+        """
+        return self.__total
+
+    @property
+    def mean(self) -> float:
+        """The mean of all recorded durations.
+        """
+        return self.__total / self.__count if self.__count else 0.0
+
+    @property
+    def max(self) -> float:
+        """The longest recorded duration.
+        """
+        return self.__max
+
+    @property
+    def buckets(self) -> tuple[tuple[float, int], ...]:
+        """The non-empty buckets as (upper bound, count) pairs.
+        """
+        return tuple( ( get_upper_bound(bucket), count ) for bucket, count in enumerate(self.__counts) if count )
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the upper bound of the bucket holding the specified percentile, capped by the longest recorded duration.
+
+        Args:
+            percentile (float): The percentile (between 0 and 100).
+
+        Returns:
+            float: Returns the upper bound of the percentile.
+        """
+        if percentile < 0 or percentile > 100:
+            raise ValueError("Argument percentile must be between 0 and 100")
+
+        threshold = self.__count * percentile / 100
+        cumulated = 0
+
+        for bucket, count in enumerate(self.__counts):
+            cumulated += count
+            if count and cumulated >= threshold:
+                return min(get_upper_bound(bucket), self.__max)
+
+        return 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram count={self.__count} mean={self.mean:.6f} p50={self.percentile(50):.6f} p99={self.percentile(99):.6f} max={self.__max:.6f}"
@@ -0,0 +1,58 @@
+from __future__ import annotations
+from typing import Any
+from threading import Event as TEvent
+
+from runtime.threading.core.tasks.schedulers.concurrent_task_scheduler import ConcurrentTaskScheduler
+from runtime.threading.core.tasks.schedulers.queue_policy import QueuePolicy
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.concurrent.queue import Queue
+from runtime.threading.core.concurrent.priority_queue import PriorityQueue
+from runtime.threading.core.defaults import TASK_KEEP_ALIVE, DEFAULT_PARALLELISM, TASK_PRIORITY_AGING
+
+RESUME_PRIORITY = float("inf") # resuming threads hold a task which is already running, and always go first
+
+def get_priority(item: Task[Any] | TEvent) -> float:
+    return item.priority if isinstance(item, Task) else RESUME_PRIORITY
+
+class PriorityTaskScheduler(ConcurrentTaskScheduler):
+    """The PriorityTaskScheduler class is a concurrent task scheduler, which runs queued tasks
+    by priority rather than in FIFO order. Tasks with a higher priority are run first, and
+    waiting tasks are aged, so that tasks with a low priority are not starved.
+    """
+    __slots__ = [ "__aging" ]
+
+    def __init__(
+        self,
+        max_parallelism: int = DEFAULT_PARALLELISM,
+        keep_alive: float = TASK_KEEP_ALIVE,
+        min_threads: int = 0,
+        aging: float | None = TASK_PRIORITY_AGING,
+        max_queue_size: int | None = None,
+        queue_policy: QueuePolicy = QueuePolicy.BLOCK
+    ):
+        """Creates a new PriorityTaskScheduler instance.
+
+        Arguments:
+            max_parallelism (int, optional): The max degree of parallelism. Defaults to the no. of CPUs
+            keep_alive (float, optional): The no. of seconds to keep threads alive, before reclaiming them. Defaults to 0.1
+            min_threads (int, optional): The no. of threads to pre-warm and keep parked, instead of reclaiming them. Defaults to 0
+            aging (float | None, optional): The no. of seconds a queued task must wait to gain one priority level. Defaults to 1.0, None disables aging
+            max_queue_size (int | None, optional): The max no. of tasks waiting for a thread. Defaults to None (unbounded)
+            queue_policy (QueuePolicy, optional): The policy applied when queueing a task on a full queue. Defaults to QueuePolicy.BLOCK
+        """
+        if aging is not None and aging <= 0:
+            raise ValueError("Argument aging must be greater than 0")
+
+        self.__aging = aging
+        super().__init__(max_parallelism, keep_alive, min_threads, max_queue_size, queue_policy)
+
+    @property
+    def aging(self) -> float | None:
+        """The no. of seconds a queued task must wait to gain one priority level (if any).
+        """
+        return self.__aging
+
+    def _create_queue(self) -> Queue[Task[Any] | TEvent] | PriorityQueue[Task[Any] | TEvent]:
+        """Creates the queue holding tasks and resuming threads, when all threads are busy.
+        """
+        return PriorityQueue(get_priority, self.__aging)
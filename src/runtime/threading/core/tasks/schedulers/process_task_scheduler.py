@@ -0,0 +1,217 @@
+from __future__ import annotations
+from typing import Any, Callable, TypeVar, cast
+from threading import Semaphore as TSemaphore
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from functools import partial
+from pickle import dumps, loads
+
+from runtime.threading.core.event import Event
+from runtime.threading.core.continue_when import ContinueWhen
+from runtime.threading.core.callback_continuation import CallbackContinuation
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.interrupt_exception import InterruptException
+from runtime.threading.core.tasks.schedulers.concurrent_task_scheduler import ConcurrentTaskScheduler
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_target import TaskTarget
+from runtime.threading.core.tasks.task_exception import TaskException
+from runtime.threading.core.defaults import TASK_KEEP_ALIVE, DEFAULT_PROCESS_PARALLELISM
+
+T = TypeVar("T")
+
+INTERRUPTED = "INTERRUPTED"
+FLAGS: Any = None # the shared interrupt flags, set in each worker process
+EVENTS: Any = None # the shared interrupt events (for awaiting the flags), set in each worker process
+
+def init_worker(flags: Any, events: Any) -> None:
+    global FLAGS, EVENTS
+    FLAGS = flags
+    EVENTS = events
+
+def run_remote(payload: bytes, slot: int, id: int, name: str) -> tuple[str | None, Any]:
+    fn, args, kwargs = loads(payload)
+    task = RemoteTask(id, name, RemoteInterrupt(slot))
+
+    try:
+        return None, fn(task, *args, **kwargs)
+    except InterruptException as ex:
+        if ex.interrupt is task.interrupt:
+            return INTERRUPTED, None # the exception itself is not sent back, as it references the remote interrupt
+        raise # pragma: no cover
+
+class ProcessTaskScheduler(ConcurrentTaskScheduler):
+    """The ProcessTaskScheduler class is a task scheduler for CPU-bound workloads, which runs task
+    targets in a pool of worker processes rather than in threads, and thus isn't limited by the GIL.
+    Targets (and their arguments) which cannot be pickled, fail unless the scheduler is created with local_fallback,
+    in which case they're run locally in a thread instead.
+    """
+    __slots__ = [ "__flags", "__events", "__owners", "__slot_semaphore", "__free_slots", "__executor", "__local_fallback" ]
+
+    def __init__(
+        self,
+        max_parallelism: int = DEFAULT_PROCESS_PARALLELISM,
+        keep_alive: float = TASK_KEEP_ALIVE,
+        local_fallback: bool = False
+    ):
+        """Creates a new ProcessTaskScheduler instance.
+
+        Arguments:
+            max_parallelism (int, optional): The max degree of parallelism i.e. no. of worker processes. Defaults to the no. of CPUs
+            keep_alive (float, optional): The no. of seconds to keep dispatching threads alive, before reclaiming them. Defaults to 0.1
+            local_fallback (bool, optional): Run targets which cannot be pickled locally in a thread, rather than failing them. Defaults to False
+        """
+        super().__init__(max_parallelism, keep_alive)
+
+        # each task running remotely is assigned a slot in the shared memory array used to signal interrupts,
+        # along with an event used by the worker process for awaiting the interrupt
+        context = get_context("spawn")
+        self.__flags = context.RawArray("b", max_parallelism)
+        self.__events = [ context.Event() for _ in range(max_parallelism) ]
+        self.__owners: list[Task[Any] | None] = [ None ] * max_parallelism
+        self.__slot_semaphore = TSemaphore(max_parallelism)
+        self.__free_slots = list(range(max_parallelism))
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__local_fallback = local_fallback
+
+    @property
+    def local_fallback(self) -> bool:
+        """Indicates if targets which cannot be pickled are run locally in a thread.
+        """
+        return self.__local_fallback
+
+    def _execute(self, task: Task[T], target: Callable[[Task[T]], T]) -> T:
+        """Executes the target function of the specified task in a worker process, and returns its result.
+        If the target cannot be pickled, it fails, unless the scheduler has local fallback enabled,
+        in which case it's executed on the current thread instead.
+
+        Arguments:
+            task (Task): The running task
+            target (Callable[[Task[T]], T]): The target function of the task
+        """
+        if not isinstance(target, TaskTarget):
+            return target(task) # pragma: no cover -- tasks are created with TaskTarget targets by Task.create()
+
+        try:
+            payload = dumps((target.fn, target.args, target.kwargs))
+        except Exception as ex: # eg. lambdas, closures or arguments holding locks (such as tasks)
+            if self.__local_fallback:
+                return target(task)
+
+            raise TaskException(
+                f"Target function or arguments of task '{task.name}' cannot be pickled, and thus not run in a worker process "
+                "(use local_fallback to run it locally instead)"
+            ) from ex
+
+        self.__slot_semaphore.acquire()
+        with self.synchronization_lock:
+            slot = self.__free_slots.pop()
+            self.__owners[slot] = task
+            self.__flags[slot] = 0
+            self.__events[slot].clear()
+
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    self.max_parallelism,
+                    mp_context = get_context("spawn"), # forking a multi-threaded process is unsafe
+                    initializer = init_worker,
+                    initargs = (self.__flags, self.__events)
+                )
+            executor = self.__executor
+
+        # the interrupt is passed on to the worker process as soon as it's signaled
+        interrupt_event = task.interrupt.wait_event
+        continuation = CallbackContinuation(ContinueWhen.ALL, (interrupt_event,), partial(self.__interrupt, slot, task))
+        Event._add_continuation((interrupt_event,), continuation) # pyright: ignore[reportPrivateUsage]
+
+        try:
+            status, result = executor.submit(run_remote, payload, slot, task.id, task.name).result()
+
+            if status == INTERRUPTED:
+                task.interrupt.raise_if_signaled()
+
+            return cast(T, result)
+        finally:
+            Event._remove_continuation(continuation) # pyright: ignore[reportPrivateUsage]
+
+            with self.synchronization_lock:
+                self.__owners[slot] = None
+                self.__free_slots.append(slot)
+            self.__slot_semaphore.release()
+
+    def __interrupt(self, slot: int, task: Task[Any]) -> None:
+        with self.synchronization_lock:
+            # the slot may have been reassigned, if the callback was already under way when the dispatch ended
+            if self.__owners[slot] is task:
+                self.__flags[slot] = 1
+                self.__events[slot].set()
+
+    def _close(self) -> None:
+        super()._close()
+
+        with self.synchronization_lock:
+            executor, self.__executor = self.__executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+
+class RemoteInterrupt:
+    """The RemoteInterrupt class is a stand-in for the task Interrupt within a worker process,
+    backed by a flag in shared memory.
+    """
+    __slots__ = [ "__slot" ]
+
+    def __init__(self, slot: int):
+        self.__slot = slot
+
+    @property
+    def is_signaled(self) -> bool:
+        """Indicates if Interrupt has been signaled.
+        """
+        return FLAGS[self.__slot] != 0
+
+    def raise_if_signaled(self) -> None:
+        """Raises an InterruptException if signaled.
+        """
+        if FLAGS[self.__slot] != 0:
+            raise InterruptException(cast(Interrupt, self))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Waits for signal.
+
+        Args:
+            timeout (float | None, optional): Timeout (seconds) before returning False. Defaults to None.
+
+        Returns:
+            bool: Returns True if signaled, False otherwise.
+        """
+        return FLAGS[self.__slot] != 0 or EVENTS[self.__slot].wait(timeout)
+
+
+class RemoteTask:
+    """The RemoteTask class is a stand-in for the Task passed to target functions within a worker process.
+    """
+    __slots__ = [ "__id", "__name", "__interrupt" ]
+
+    def __init__(self, id: int, name: str, interrupt: RemoteInterrupt):
+        self.__id = id
+        self.__name = name
+        self.__interrupt = interrupt
+
+    @property
+    def id(self) -> int:
+        """The id of the task.
+        """
+        return self.__id
+
+    @property
+    def name(self) -> str:
+        """The name of the task.
+        """
+        return self.__name
+
+    @property
+    def interrupt(self) -> RemoteInterrupt:
+        """The task Interrupt.
+        """
+        return self.__interrupt
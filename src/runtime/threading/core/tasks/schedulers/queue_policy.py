@@ -0,0 +1,7 @@
+from enum import IntEnum
+
+class QueuePolicy(IntEnum):
+    BLOCK = 0
+    RAISE = 1
+    CALLER_RUNS = 2
+    DROP_OLDEST = 3
\ No newline at end of file
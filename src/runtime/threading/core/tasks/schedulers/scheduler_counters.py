@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from runtime.threading.core.tasks.schedulers.histogram import BUCKETS, get_bucket
+
+class SchedulerCounters:
+    """The SchedulerCounters class holds the runtime counters of a task scheduler, as recorded by a single thread.
+    Each thread updates its own counters without locking, and they're aggregated when a snapshot is requested.
+    """
+    __slots__ = [
+        "tasks_queued", "tasks_started", "tasks_completed", "threads_spawned", "threads_reclaimed",
+        "suspensions", "resumes", "queue_wait", "queue_wait_total", "queue_wait_max", "run_time", "run_time_total", "run_time_max"
+    ]
+
+    def __init__(self):
+        self.tasks_queued = 0
+        self.tasks_started = 0
+        self.tasks_completed = 0
+        self.threads_spawned = 0
+        self.threads_reclaimed = 0
+        self.suspensions = 0
+        self.resumes = 0
+        self.queue_wait = [ 0 ] * BUCKETS
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.run_time = [ 0 ] * BUCKETS
+        self.run_time_total = 0.0
+        self.run_time_max = 0.0
+
+    def record_queue_wait(self, duration: float) -> None:
+        self.queue_wait[get_bucket(duration)] += 1
+        self.queue_wait_total += duration
+        if duration > self.queue_wait_max:
+            self.queue_wait_max = duration
+
+    def record_run_time(self, duration: float) -> None:
+        self.run_time[get_bucket(duration)] += 1
+        self.run_time_total += duration
+        if duration > self.run_time_max:
+            self.run_time_max = duration
+
+    def add(self, other: SchedulerCounters) -> None:
+        self.tasks_queued += other.tasks_queued
+        self.tasks_started += other.tasks_started
+        self.tasks_completed += other.tasks_completed
+        self.threads_spawned += other.threads_spawned
+        self.threads_reclaimed += other.threads_reclaimed
+        self.suspensions += other.suspensions
+        self.resumes += other.resumes
+        self.queue_wait = [ a + b for a, b in zip(self.queue_wait, other.queue_wait) ]
+        self.queue_wait_total += other.queue_wait_total
+        self.queue_wait_max = max(self.queue_wait_max, other.queue_wait_max)
+        self.run_time = [ a + b for a, b in zip(self.run_time, other.run_time) ]
+        self.run_time_total += other.run_time_total
+        self.run_time_max = max(self.run_time_max, other.run_time_max)
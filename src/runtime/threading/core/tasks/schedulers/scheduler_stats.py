@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from runtime.threading.core.tasks.schedulers.histogram import Histogram
+from runtime.threading.core.tasks.schedulers.scheduler_counters import SchedulerCounters
+
+class SchedulerStats:
+    """The SchedulerStats class is a snapshot of the runtime metrics of a task scheduler.
+    """
+    __slots__ = [
+        "__queue_depth", "__tasks_queued", "__tasks_started", "__tasks_completed", "__threads_spawned",
+        "__threads_reclaimed", "__suspensions", "__resumes", "__queue_wait", "__run_time"
+    ]
+
+    def __init__(self, queue_depth: int, counters: SchedulerCounters):
+        """Creates a new SchedulerStats snapshot. Should not be called directly - use TaskScheduler.stats() instead...
+
+        Args:
+            queue_depth (int): The no. of tasks currently queued.
+            counters (SchedulerCounters): The aggregated counters of the scheduler.
+        """
+        self.__queue_depth = queue_depth
+        self.__tasks_queued = counters.tasks_queued
+        self.__tasks_started = counters.tasks_started
+        self.__tasks_completed = counters.tasks_completed
+        self.__threads_spawned = counters.threads_spawned
+        self.__threads_reclaimed = counters.threads_reclaimed
+        self.__suspensions = counters.suspensions
+        self.__resumes = counters.resumes
+        self.__queue_wait = Histogram(counters.queue_wait, counters.queue_wait_total, counters.queue_wait_max)
+        self.__run_time = Histogram(counters.run_time, counters.run_time_total, counters.run_time_max)
+
+    @property
+    def queue_depth(self) -> int:
+        """The no. of tasks queued, but not yet started, at the time of the snapshot.
+        """
+        return self.__queue_depth
+
+    @property
+    def tasks_queued(self) -> int:
+        """The total no. of tasks queued.
+        """
+        return self.__tasks_queued
+
+    @property
+    def tasks_started(self) -> int:
+        """The total no. of tasks started.
+        """
+        return self.__tasks_started
+
+    @property
+    def tasks_completed(self) -> int:
+        """The total no. of tasks completed (successfully or not).
+        """
+        return self.__tasks_completed
+
+    @property
+    def threads_spawned(self) -> int:
+        """The total no. of threads spawned.
+        """
+        return self.__threads_spawned
+
+    @property
+    def threads_reclaimed(self) -> int:
+        """The total no. of threads reclaimed (ie. exited).
+        """
+        return self.__threads_reclaimed
+
+    @property
+    def suspensions(self) -> int:
+        """The total no. of task suspensions (ie. when waiting on an event or lock).
+        """
+        return self.__suspensions
+
+    @property
+    def resumes(self) -> int:
+        """The total no. of suspended tasks resumed.
+        """
+        return self.__resumes
+
+    @property
+    def queue_wait(self) -> Histogram:
+        """The distribution of time (seconds) tasks spent queued before being started.
+        """
+        return self.__queue_wait
+
+    @property
+    def run_time(self) -> Histogram:
+        """The distribution of time (seconds) tasks spent running (including time suspended).
+        """
+        return self.__run_time
+
+    def __repr__(self) -> str:
+        return (
+            f"SchedulerStats queue_depth={self.__queue_depth} queued={self.__tasks_queued} started={self.__tasks_started} "
+            f"completed={self.__tasks_completed} spawned={self.__threads_spawned} reclaimed={self.__threads_reclaimed} "
+            f"suspensions={self.__suspensions} resumes={self.__resumes}"
+        )
@@ -1,30 +1,52 @@
 from __future__ import annotations
-from threading import Thread, RLock, current_thread, main_thread
-from typing import ContextManager, Any, ClassVar, TYPE_CHECKING
+from threading import Thread, RLock, local, current_thread, main_thread
+from typing import ContextManager, Callable, Sequence, TypeVar, Any, ClassVar, TYPE_CHECKING
 from abc import ABC, abstractmethod
 from weakref import WeakKeyDictionary, finalize
+from contextvars import ContextVar, Token
+from time import perf_counter
 
 if TYPE_CHECKING: # pragma: no cover
     from runtime.threading.core.tasks.task import Task
 
 from runtime.threading.core.tasks.task_exception import TaskException
+from runtime.threading.core.tasks.schedulers.scheduler_counters import SchedulerCounters
+from runtime.threading.core.tasks.schedulers.scheduler_stats import SchedulerStats
+
+T = TypeVar("T")
 
 LOCK = RLock()
-THREADS: WeakKeyDictionary[Thread, tuple[TaskScheduler, Task[Any] | None]] = WeakKeyDictionary()
+# each thread holds its own registration ([scheduler, task]) in thread-local storage, which is read and updated without locking.
+# the registrations are also kept in THREADS (for introspection only), which is only changed when threads are registered or unregistered
+LOCAL = local()
+# tasks run on an event loop share its thread, so their registrations ((scheduler, task)) are held in the context of each asyncio task instead
+ASYNC_REGISTRATION: ContextVar[tuple[TaskScheduler, Task[Any]] | None] = ContextVar("ASYNC_REGISTRATION", default = None)
+THREADS: WeakKeyDictionary[Thread, list[Any]] = WeakKeyDictionary()
 
 SchedulerClosedError = TaskException("Task scheduler has been closed")
 TaskAlreadyStartedOrScheduledError = TaskException("Task is already running or scheduled on another scheduler.")
+SchedulerQueueFullError = TaskException("Task scheduler queue is full")
+TaskDroppedError = TaskException("Task was dropped from a full task scheduler queue")
+
+def retire_counters(lock: RLock, counters: list[SchedulerCounters], retired: SchedulerCounters, thread_counters: SchedulerCounters) -> None:
+    # folds the counters of a finalized thread into the retired counters of the scheduler
+    with lock:
+        retired.add(thread_counters)
+        counters.remove(thread_counters)
 
 class TaskScheduler(ABC):
     """The TaskScheduler class is the base task scheduler class responsible for managing the threads
     used by all derived schedulers.
     """
 
-    __slots__ = [ "__lock", "__finalizer", "__finalizing", "__weakref__" ]
+    __slots__ = [ "__lock", "__finalizer", "__finalizing", "__local", "__counters", "__retired", "__weakref__" ]
     __default__: ClassVar[TaskScheduler | None] = None
 
     def __init__(self):
         self.__lock = RLock()
+        self.__local = local()
+        self.__counters: list[SchedulerCounters] = []
+        self.__retired = SchedulerCounters()
 
         def fn_finalize(): # pragma: no cover
             self.__finalizing = True
@@ -60,10 +82,53 @@ class TaskScheduler(ABC):
         return self.__finalizing
 
 
+    def stats(self) -> SchedulerStats:
+        """Returns a snapshot of the runtime metrics of the scheduler.
+        """
+        aggregate = SchedulerCounters()
+
+        with self.__lock:
+            aggregate.add(self.__retired)
+            for counters in self.__counters:
+                aggregate.add(counters)
+
+            return SchedulerStats(self._queue_depth(), aggregate)
+
+    def _queue_depth(self) -> int:
+        """Returns the no. of tasks queued, but not yet started. Returns 0 unless overridden by derived schedulers.
+        """
+        return 0 # pragma: no cover
+
+    def _counters(self) -> SchedulerCounters:
+        """Returns the runtime counters of the current thread, which may be updated without locking.
+        """
+        if ( counters := getattr(self.__local, "counters", None) ) is None:
+            counters = self.__local.counters = SchedulerCounters()
+
+            with self.__lock:
+                self.__counters.append(counters)
+
+            # the scheduler must not be referenced, as threads (eg. the main thread) may outlive it
+            finalize(current_thread(), retire_counters, self.__lock, self.__counters, self.__retired, counters)
+
+        return counters
+
+    def _record_queued(self, task: Task[Any]) -> None:
+        """Records that the specified task has been queued.
+
+        Arguments:
+            task (Task): The queued task
+        """
+        self._counters().tasks_queued += 1
+        task._queued_at = perf_counter() # pyright: ignore[reportPrivateUsage]
+
     @staticmethod
     def default() -> TaskScheduler:
         """Returns the default task scheduler (a ConcurrentTaskScheduler instance).
         """
+        if ( default := TaskScheduler.__default__ ) is not None and not default.is_closed and not default.finalizing:
+            return default
+
         with LOCK:
             if TaskScheduler.__default__ is None or TaskScheduler.__default__.is_closed or TaskScheduler.__default__.finalizing:
                 from runtime.threading.core.tasks.schedulers.concurrent_task_scheduler import ConcurrentTaskScheduler
@@ -75,48 +140,76 @@ class TaskScheduler(ABC):
         """Returns the task scheduler of the currently running task, or the default task scheduler
         if not called from within a running task.
         """
-        cur_thread = current_thread()
-        with LOCK:
-            if cur_thread in THREADS:
-                return THREADS[cur_thread][0]
-            else:
-                return TaskScheduler.default()
+        registration = getattr(LOCAL, "registration", None)
+
+        if registration is not None and registration[1] is not None:
+            return registration[0]
+        elif ( async_registration := ASYNC_REGISTRATION.get() ) is not None:
+            return async_registration[0]
+        elif registration is not None:
+            return registration[0]
+        else:
+            return TaskScheduler.default()
 
     @staticmethod
     def current_task() -> Task[Any] | None:
         """Returns the currently running task, if called from within one.
         """
-        cur_thread = current_thread()
+        if ( registration := getattr(LOCAL, "registration", None) ) is not None and registration[1] is not None:
+            return registration[1]
+        elif ( async_registration := ASYNC_REGISTRATION.get() ) is not None:
+            return async_registration[1]
+        else:
+            return None
+
+    @staticmethod
+    def registrations() -> dict[Thread, tuple[TaskScheduler, Task[Any] | None]]:
+        """Returns a snapshot of the threads registered on task schedulers, along with their
+        scheduler and running task (if any). For introspection only.
+        """
         with LOCK:
-            if cur_thread in THREADS:
-                return THREADS[cur_thread][1]
-            else:
-                return None
+            return { thread: (registration[0], registration[1]) for thread, registration in THREADS.items() }
 
     def _register(self) -> None:
         """Registers the current thread on the task scheduler
         """
-        cur_thread = current_thread()
-        with LOCK:
-            THREADS[cur_thread] = (self, None)
+        self.__set_registration(None)
 
     def _run(self, task: Task[Any]) -> None:
-        """Runs the specified task on the current thread
+        """Runs the specified task on the current thread. Afterwards, the registration of the thread
+        is restored, since tasks may be run inline of others (or on threads not created by a scheduler).
 
         Arguments:
             task (Task): The task to run
         """
-        cur_thread = current_thread()
+        registration = getattr(LOCAL, "registration", None)
+        previous = ( registration[0], registration[1] ) if registration is not None else None
 
-        with LOCK:
-            THREADS[cur_thread] = (self, task)
+        self.__set_registration(task)
+        cur_thread = current_thread()
 
         if cur_thread != main_thread():
             cur_thread.name = task.name
         else:
             pass  # pragma: no cover
 
-        task.run_synchronously()
+        counters = self._counters()
+        counters.tasks_started += 1
+        started = perf_counter()
+
+        if ( queued_at := task._queued_at ) is not None: # pyright: ignore[reportPrivateUsage]
+            counters.record_queue_wait(started - queued_at)
+
+        try:
+            task.run_synchronously()
+        finally:
+            counters.tasks_completed += 1
+            counters.record_run_time(perf_counter() - started)
+
+            if previous is None:
+                TaskScheduler._unregister(self)
+            else:
+                previous[0].__set_registration(previous[1])
 
     def _resume(self, task: Task[Any]) -> None:
         """Resumes the specified task on the current thread
@@ -124,36 +217,81 @@ class TaskScheduler(ABC):
         Arguments:
             task (Task): The task to run
         """
+        self.__set_registration(task)
         cur_thread = current_thread()
 
-        with LOCK:
-            THREADS[cur_thread] = (self, task)
-
         if cur_thread != main_thread():
             cur_thread.name = task.name
         else:
             pass
 
+    def _execute(self, task: Task[T], target: Callable[[Task[T]], T]) -> T:
+        """Executes the target function of the specified task, and returns its result.
+        The target is called on the current thread, unless overridden by derived schedulers.
+
+        Arguments:
+            task (Task): The running task
+            target (Callable[[Task[T]], T]): The target function of the task
+        """
+        return target(task)
+
+    def _try_run_inline(self, task: Task[Any]) -> bool:
+        """Tries to run a scheduled task inline of the current one, instead of waiting for it.
+        Returns False unless overridden by derived schedulers.
+
+        Arguments:
+            task (Task): The task to run
+        """
+        return False
+
     def _refresh_task(self) -> None:
         """Refreshes task info, like the name.
         """
         if cur_task := TaskScheduler.current_task():
-            with LOCK:
-                cur_thread = current_thread()
-                if cur_thread != main_thread():
-                    cur_thread.name = cur_task.name
-                else:
-                    pass
+            cur_thread = current_thread()
+            if cur_thread != main_thread():
+                cur_thread.name = cur_task.name
+            else:
+                pass
         else:
             pass
 
+    def _register_async(self, task: Task[Any]) -> Token[tuple[TaskScheduler, Task[Any]] | None]:
+        """Registers the task as the current task of the running asyncio task (and not the thread).
+
+        Arguments:
+            task (Task): The running task
+
+        Returns:
+            Token: Returns a token used for unregistering the task
+        """
+        return ASYNC_REGISTRATION.set(( self, task ))
+
+    def _unregister_async(self, token: Token[tuple[TaskScheduler, Task[Any]] | None]) -> None:
+        """Un-registers a task registered with _register_async().
+
+        Arguments:
+            token (Token): The token returned by _register_async()
+        """
+        ASYNC_REGISTRATION.reset(token)
+
     def _unregister(self) -> None:
         """Un-registers the current thread on the task scheduler
         """
         cur_thread = current_thread()
+        del LOCAL.registration
         with LOCK:
             del THREADS[cur_thread]
 
+    def __set_registration(self, task: Task[Any] | None) -> None:
+        if ( registration := getattr(LOCAL, "registration", None) ) is not None:
+            registration[0] = self
+            registration[1] = task
+        else:
+            registration = LOCAL.registration = [ self, task ]
+            with LOCK:
+                THREADS[current_thread()] = registration
+
     @abstractmethod
     def queue(self, task: Task[Any]) -> None:
         """Queues the specified task.
@@ -163,6 +301,25 @@ class TaskScheduler(ABC):
         """
         ...
 
+    def queue_many(self, tasks: Sequence[Task[Any]]) -> None:
+        """Queues the specified tasks. Should not be called directly - use Task.run_many() instead...
+        If no tasks could be queued, an exception is raised - otherwise any tasks which could not be queued are rejected.
+        Queues the tasks one at a time, unless overridden by derived schedulers.
+
+        Arguments:
+            tasks (Sequence[Task]): The tasks to schedule
+        """
+        for index, task in enumerate(tasks):
+            try:
+                self.queue(task)
+            except Exception as ex:
+                if index == 0:
+                    raise
+
+                for remaining in tasks[index:]:
+                    remaining._reject(ex) # pyright: ignore[reportPrivateUsage]
+                break
+
     @abstractmethod
     def prioritise(self, task: Task[Any]) -> None:
         """Runs the task inline of another. For internal use.
@@ -0,0 +1,389 @@
+from __future__ import annotations
+from typing import Any, MutableSequence, Sequence, Callable, ContextManager, cast
+from types import TracebackType
+from threading import Thread, Semaphore as TSemaphore, Event as TEvent, current_thread, local
+from collections import deque
+from contextlib import nullcontext
+
+from runtime.threading.core.threading_exception import ThreadingException
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, TaskAlreadyStartedOrScheduledError, SchedulerClosedError
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_state import TaskState
+from runtime.threading.core.one_time_event import OneTimeEvent
+from runtime.threading.core.defaults import TASK_KEEP_ALIVE, DEFAULT_PARALLELISM
+
+
+class WorkStealingTaskScheduler(TaskScheduler):
+    """The WorkStealingTaskScheduler class is a task scheduler with a local deque per worker thread.
+    Tasks queued from within a running task are pushed onto the local deque of that worker, and run
+    in LIFO order, while idle workers steal tasks from the other end of the deques of busy workers.
+    """
+    __slots__ = [ "__max_parallelism", "__keep_alive", "__local", "__deques", "__injection", "__available", "__debt",
+                  "__threads", "__active_threads", "__suspended_threads", "__resuming", "__closed" ]
+
+    def __init__(
+        self,
+        max_parallelism: int = DEFAULT_PARALLELISM,
+        keep_alive: float = TASK_KEEP_ALIVE
+    ):
+        """Creates a new WorkStealingTaskScheduler instance.
+
+        Arguments:
+            max_parallelism (int, optional): The max degree of parallelism. Defaults to the no. of CPUs
+            keep_alive (float, optional): The no. of seconds to keep idle threads alive, before reclaiming them. Defaults to 0.1
+        """
+        super().__init__()
+
+        if max_parallelism < 1: # pragma: no cover
+            raise ValueError("Argument max_parallelism must be greater than 0")
+
+        self.__max_parallelism = max_parallelism
+        self.__keep_alive = keep_alive
+        self.__local = local()
+        self.__deques: tuple[deque[Task[Any]], ...] = ()
+        self.__injection: deque[Task[Any]] = deque()
+        self.__available = TSemaphore(0) # counts the tasks in all deques
+        self.__debt = 0 # no. of permits owed for tasks removed by their owners, while the permits were held by searching workers
+        self.__threads: MutableSequence[Thread] = []
+        self.__active_threads: MutableSequence[Thread] = []
+        self.__suspended_threads: MutableSequence[Thread] = []
+        self.__resuming: deque[tuple[Thread, TEvent]] = deque()
+        self.__closed: OneTimeEvent | None = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Returns True if scheduler is closed.
+        """
+        return self.__closed is not None
+
+    @property
+    def max_parallelism(self) -> int:
+        """The max degree of parallelism i.e. no. active tasks.
+        """
+        return self.__max_parallelism
+
+    @property
+    def keep_alive(self) -> float:
+        """The no. of seconds to keep idle threads alive, before reclaiming them.
+        """
+        return self.__keep_alive
+
+    @property
+    def active_threads(self) -> int:
+        """The no. of currently active threads.
+        """
+        return len(self.__active_threads)
+
+    @property
+    def suspended_threads(self) -> int:
+        """The no. of currently suspended threads.
+        """
+        return len(self.__suspended_threads)
+
+    def queue(self, task: Task[Any]) -> None:
+        """Queues the task. Should not be called directly - use Task.schedule(scheduler) instead...
+        When called from a worker thread, the task is pushed onto the local deque of that worker.
+
+        Arguments:
+            task (Task): The task to schedule
+        """
+        if self.__closed is not None:
+            raise SchedulerClosedError
+
+        self._record_queued(task)
+
+        if ( own := getattr(self.__local, "deque", None) ) is not None:
+            own.append(task)
+        else:
+            self.__injection.append(task)
+
+        self.__available.release()
+
+        if len(self.__active_threads) < self.__max_parallelism:
+            with self.synchronization_lock:
+                if len(self.__active_threads) < self.__max_parallelism:
+                    self.__start_thread()
+
+    def queue_many(self, tasks: Sequence[Task[Any]]) -> None:
+        """Queues the tasks with a single release of the workers. Should not be called directly - use Task.run_many() instead...
+        When called from a worker thread, the tasks are pushed onto the local deque of that worker.
+
+        Arguments:
+            tasks (Sequence[Task]): The tasks to schedule
+        """
+        if self.__closed is not None:
+            raise SchedulerClosedError
+
+        if not tasks:
+            return
+
+        for task in tasks:
+            self._record_queued(task)
+
+        if ( own := getattr(self.__local, "deque", None) ) is not None:
+            own.extend(tasks)
+        else:
+            self.__injection.extend(tasks)
+
+        self.__available.release(len(tasks))
+
+        if len(self.__active_threads) < self.__max_parallelism:
+            with self.synchronization_lock:
+                for _ in range(min(len(tasks), self.__max_parallelism - len(self.__active_threads))):
+                    self.__start_thread()
+
+    def _queue_depth(self) -> int:
+        """Returns the no. of tasks queued, but not yet started.
+        """
+        return len(self.__injection) + sum( len(other) for other in self.__deques )
+
+    def prioritise(self, task: Task[Any]) -> None:
+        """Runs the task inline of another.
+
+        Arguments:
+            task (Task): The task to run
+        """
+        if self.__closed is not None:
+            raise SchedulerClosedError # pragma: no cover
+
+        if task.state > TaskState.SCHEDULED:
+            raise TaskAlreadyStartedOrScheduledError # pragma: no cover
+
+        if ( current_task := self.current_task() ) and current_task.state == TaskState.RUNNING:
+            if task.state == TaskState.SCHEDULED and not self.__remove_local(task):
+                raise TaskAlreadyStartedOrScheduledError # pragma: no cover
+
+            super()._run(task)
+            super()._resume(current_task)
+        else:
+            task.schedule(self)
+
+    def _try_run_inline(self, task: Task[Any]) -> bool:
+        """Runs a scheduled task inline of the current one, if it's still in the local deque of the current worker.
+
+        Arguments:
+            task (Task): The task to run
+        """
+        if ( current_task := self.current_task() ) and current_task.state == TaskState.RUNNING and self.__remove_local(task):
+            super()._run(task)
+            super()._resume(current_task)
+            return True
+        else:
+            return False
+
+    def suspend(self) -> ContextManager[Any]:
+        """Suspends the current task, ie. when waiting on an event or lock.
+        If called from a thread not created by this scheduler, nothing is changed.
+        """
+        task = cast(Task[Any], self.current_task())
+        thread = current_thread()
+
+        with self.synchronization_lock:
+            if not task or task.state != TaskState.RUNNING or thread not in self.__active_threads:
+                return nullcontext()
+
+            org_name = task.name
+            task.name += " *SUSPENDED"
+            self._refresh_task()
+
+            # hand the slot to a resuming thread or start a new one, so that no. of active threads remains the same
+            self._counters().suspensions += 1
+            self.__suspended_threads.append(thread)
+            if not self.__leave(thread):
+                self.__start_thread()
+
+            def resume() -> None:
+                task.name = org_name + " *RESUMING"
+                self._refresh_task()
+
+                with self.synchronization_lock:
+                    self.__suspended_threads.remove(thread)
+                    if len(self.__active_threads) < self.__max_parallelism:
+                        self.__active_threads.append(thread)
+                        event = None
+                    else:
+                        # wait for an active thread to hand over its slot, so that max_parallelism is not exceeded
+                        event = TEvent()
+                        self.__resuming.append((thread, event))
+
+                if event is not None:
+                    event.wait()
+
+                self._counters().resumes += 1
+                task.name = org_name
+                self._refresh_task()
+
+            return WorkStealingTaskScheduler._SuspendedTask(resume)
+
+    def close(self) -> None:
+        """Closes the scheduler and waits for any scheduled tasks to finish.
+        """
+        if self is TaskScheduler.default() and not self.finalizing:
+            raise ThreadingException("Cannot close default scheduler") # pragma: no cover
+
+        self._close()
+
+    def _close(self) -> None:
+        if self.__closed is not None:
+            return
+
+        with self.synchronization_lock:
+            self.__closed = OneTimeEvent(purpose = "WORK_STEALING_TASK_SCHEDULER_CLOSE")
+            wait_for_close = len(self.__threads) > 0 or len(self.__active_threads) > 0
+
+            for _ in range(len(self.__active_threads) + len(self.__suspended_threads)):
+                self.__available.release() # wake parked workers, which will exit when no more tasks are found
+
+        if wait_for_close:
+            self.__closed.wait()
+
+    def __enter__(self) -> WorkStealingTaskScheduler:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None):
+        self.close()
+
+    def __start_thread(self) -> None:
+        thread = Thread(target=self.__run, name="WorkStealingTaskScheduler.Worker-Thread")
+        self.__active_threads.append(thread)
+        self._counters().threads_spawned += 1
+        thread.start()
+
+    def __remove_local(self, task: Task[Any]) -> bool:
+        if ( own := getattr(self.__local, "deque", None) ) is not None:
+            try:
+                own.remove(task)
+            except ValueError:
+                return False # task was stolen by another worker
+
+            # consume a permit for the removed task without blocking - if a worker holding it is searching for the task,
+            # the permit is owed instead, and settled by that worker (or the next) when it finds nothing
+            if not self.__available.acquire(False):
+                with self.synchronization_lock:
+                    self.__debt += 1
+            return True
+        else:
+            return False
+
+    def __take(self, own: deque[Task[Any]]) -> Task[Any] | None:
+        try:
+            return own.pop()
+        except IndexError:
+            pass
+
+        try:
+            return self.__injection.popleft()
+        except IndexError:
+            pass
+
+        for other in self.__deques:
+            if other is not own:
+                try:
+                    return other.popleft()
+                except IndexError:
+                    pass
+
+        return None
+
+    def __settle_debt(self) -> bool:
+        # consumes the permit held by the current worker for a task removed by its owner (if any is owed)
+        if self.__debt:
+            with self.synchronization_lock:
+                if self.__debt:
+                    self.__debt -= 1
+                    return True
+        return False
+
+    def __leave(self, thread: Thread) -> bool:
+        # removes the thread from the active threads and hands its slot to a resuming thread if any is waiting
+        # must be called while holding the synchronization lock
+        self.__active_threads.remove(thread)
+
+        if self.__resuming:
+            resume_thread, event = self.__resuming.popleft()
+            self.__active_threads.append(resume_thread)
+            event.set()
+            return True
+        else:
+            return False
+
+    def __run(self) -> None:
+        thread = current_thread()
+        own: deque[Task[Any]] = deque()
+        self.__local.deque = own
+
+        try:
+            with self.synchronization_lock:
+                self._register()
+                self.__deques = ( *self.__deques, own )
+
+            while True:
+                if not self.__available.acquire(timeout = self.__keep_alive):
+                    with self.synchronization_lock:
+                        # leave the active threads before checking again, so that queue() starts a new thread
+                        # if a task is queued after this point
+                        if not self.__leave(thread) and self.__available.acquire(False):
+                            self.__active_threads.append(thread)
+                        else:
+                            break
+
+                if ( task := self.__take(own) ) is None:
+                    if not self.__settle_debt():
+                        # the task was either run inline by its owner (which consumed another permit), or moved to the
+                        # injection deque by an exiting thread while searching - either way the permit is released for the next to use
+                        self.__available.release()
+
+                    if self.__closed is not None:
+                        with self.synchronization_lock:
+                            self.__leave(thread)
+                        break
+                    else:
+                        continue # pragma: no cover
+
+                super()._run(task)
+
+        finally:
+            self._counters().threads_reclaimed += 1
+
+            with self.synchronization_lock:
+                while own: # remaining tasks may still be stolen, hence no iteration
+                    try:
+                        self.__injection.append(own.popleft())
+                    except IndexError: # pragma: no cover
+                        break
+                self.__deques = tuple( other for other in self.__deques if other is not own )
+                del self.__local.deque
+                self._unregister()
+
+                if self.__injection and len(self.__active_threads) < self.__max_parallelism:
+                    self.__start_thread() # pragma: no cover
+                elif self.__closed is not None and len(self.__threads) == 0 and len(self.__active_threads) == 0 and len(self.__suspended_threads) == 0:
+                    self.__closed.signal()
+
+    def _register(self) -> None:
+        """Registers the current thread on the task scheduler.
+        """
+        with self.synchronization_lock:
+            super()._register()
+            self.__threads.append(current_thread())
+
+    def _unregister(self) -> None:
+        """Un-registers the current thread on the task scheduler.
+        """
+        with self.synchronization_lock:
+            super()._unregister()
+            self.__threads.remove(current_thread())
+
+    def __finalize__(self) -> None:
+        self._close() # pragma: no cover
+
+    class _SuspendedTask:
+        __slots__ = ["__resume"]
+        def __init__(self, fn_resume: Callable[[], None]):
+            self.__resume = fn_resume
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None):
+            self.__resume()
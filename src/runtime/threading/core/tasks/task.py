@@ -1,25 +1,40 @@
 from __future__ import annotations
 from typing import (
-    Sequence, TypeVar, Concatenate, ClassVar, Generic, Callable,
-    ParamSpec, Any, cast, overload
+    Sequence, Iterable, Iterator, TypeVar, Concatenate, ClassVar, Generic, Callable, Generator,
+    ParamSpec, Any, cast, overload, TYPE_CHECKING
 )
+from asyncio import AbstractEventLoop, Future as AsyncioFuture, Task as AsyncioTask, CancelledError, get_running_loop, current_task as current_asyncio_task
+from concurrent.futures import Future
+from inspect import isawaitable
+from itertools import count
+from functools import partial
+from time import perf_counter
 
 from runtime.threading.core.threading_exception import ThreadingException
 from runtime.threading.core.interrupt_exception import InterruptException
 from runtime.threading.core.event import Event
 from runtime.threading.core.one_time_event import OneTimeEvent
 from runtime.threading.core.continue_when import ContinueWhen
+from runtime.threading.core.callback_continuation import CallbackContinuation
 from runtime.threading.core.lock import Lock
 from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.interrupt_signal import InterruptSignal
+from runtime.threading.core.timer_wheel import TimerWheel
+from runtime.threading.core.concurrent.queue import Queue
 from runtime.threading.core.tasks.task_state import TaskState
 from runtime.threading.core.tasks.continuation_options import ContinuationOptions
 from runtime.threading.core.tasks.tasks_continuation import TasksContinuation
 from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
 from runtime.threading.core.tasks.aggregate_exception import AggregateException
 from runtime.threading.core.tasks.task_exception import TaskException
+from runtime.threading.core.tasks.task_target import TaskTarget
 from runtime.threading.core.tasks.helpers import get_function_name
 from runtime.threading.core.parallel.pipeline.p_context import PContext
 
+if TYPE_CHECKING: # pragma: no cover
+    from runtime.threading.core.tasks.task_batch import TaskBatch
+    from runtime.threading.core.tasks.task_stream import TaskStream
+
 P = ParamSpec("P")
 T = TypeVar("T")
 Tresult = TypeVar("Tresult")
@@ -31,12 +46,12 @@ TaskAlreadyRunningError = TaskException("Task is already running")
 TaskAlreadyScheduledError = TaskException("Task is already scheduled (on this or another scheduler)")
 AwaitedTaskInterruptedError = TaskException("One or more awaited tasks were interrupted")
 
-LOCK = Lock()
+IDS = count(1) # task ids are taken without locking, since next() on a count is atomic
 
 class TaskProto:
     """The TaskProto class is a Task creation wrapper, used to create new tasks in an easy way.
     """
-    __slots__ = [ "__name", "__interrupt", "__scheduler", "__lazy" ]
+    __slots__ = [ "__name", "__interrupt", "__scheduler", "__lazy", "__priority" ]
     __default__: ClassVar[TaskProto | None] = None
 
     def __new__(
@@ -44,9 +59,10 @@ class TaskProto:
         name: str | None = None,
         interrupt: Interrupt | None = None,
         scheduler: TaskScheduler | None = None,
-        lazy: bool | None = None
+        lazy: bool | None = None,
+        priority: int | None = None
     ):
-        if name is interrupt is scheduler is lazy is None:
+        if name is interrupt is scheduler is lazy is priority is None:
             if TaskProto.__default__ is None:
                 TaskProto.__default__ = super().__new__(cls)
             return TaskProto.__default__
@@ -58,12 +74,14 @@ class TaskProto:
         name: str | None = None,
         interrupt: Interrupt | None = None,
         scheduler: TaskScheduler | None = None,
-        lazy: bool | None = None
+        lazy: bool | None = None,
+        priority: int | None = None
     ):
         self.__name = name
         self.__interrupt = interrupt
         self.__scheduler = scheduler
         self.__lazy = lazy or False
+        self.__priority = priority or 0
 
     def plan(
         self,
@@ -79,13 +97,10 @@ class TaskProto:
         Returns:
             Task[T]: Returns the new task.
         """
-        def fn_wrap(task: Task[T]) -> T:
-            return fn(task, *args, **kwargs)
-
         if self.__scheduler:
             raise ThreadingException("Future tasks cannot have scheduler specified") # pragma: no cover
 
-        return Task[T](fn_wrap, self.__name, self.__interrupt, self.__lazy)
+        return Task[T](TaskTarget(fn, args, kwargs), self.__name, self.__interrupt, self.__lazy, self.__priority)
 
     def run(
         self,
@@ -101,17 +116,106 @@ class TaskProto:
         Returns:
             Task[T]: Returns the new task.
         """
-        def fn_wrap(task: Task[T]) -> T:
-            return fn(task, *args, **kwargs)
-
         if self.__scheduler is None:
             if ( pc := PContext.current() ) and pc is not PContext.root():
                 self.__scheduler = pc.scheduler
 
-        task = Task[T](fn_wrap, self.__name, self.__interrupt, self.__lazy)
+        task = Task[T](TaskTarget(fn, args, kwargs), self.__name, self.__interrupt, self.__lazy, self.__priority)
         task.schedule(self.__scheduler or TaskScheduler.current())
         return task
 
+    def run_many(
+        self,
+        fn: Callable[..., T],
+        args: Iterable[Sequence[Any]], /
+    ) -> TaskBatch[T]:
+        """Creates a batch of tasks, one for each sequence of positional arguments, and schedules them together.
+
+        Args:
+            fn (Callable[..., T]): The target function, which is called with the task followed by the arguments.
+            args (Iterable[Sequence[Any]]): The positional arguments of each task.
+
+        Returns:
+            TaskBatch[T]: Returns a handle to the new tasks.
+        """
+        from runtime.threading.core.tasks.task_batch import TaskBatch
+
+        if self.__scheduler is None:
+            if ( pc := PContext.current() ) and pc is not PContext.root():
+                self.__scheduler = pc.scheduler
+
+        tasks = [ Task[T](TaskTarget(fn, tuple(task_args), {}), self.__name, self.__interrupt, self.__lazy, self.__priority) for task_args in args ]
+        Task._schedule_many(tasks, self.__scheduler or TaskScheduler.current()) # pyright: ignore[reportPrivateUsage]
+        return TaskBatch(tasks)
+
+    def stream(
+        self,
+        fn: Callable[Concatenate[Task[None], P], Iterable[Tresult]], /,
+        *args: P.args,
+        **kwargs: P.kwargs
+    ) -> TaskStream[Tresult]:
+        """Creates a new streaming task and schedules it. The items yielded by the target function are buffered
+        in a bounded queue (see STREAM_BUFFER_SIZE), and can be consumed while the task is still producing.
+
+        Args:
+            fn (Callable[Concatenate[Task[None], P], Iterable[Tresult]]): The target function (typically a generator).
+
+        Returns:
+            TaskStream[Tresult]: Returns a PIterable yielding the items produced by the task.
+        """
+        from runtime.threading.core.defaults import STREAM_BUFFER_SIZE
+        from runtime.threading.core.parallel.producer_consumer_queue import ProducerConsumerQueue
+        from runtime.threading.core.tasks.task_stream import TaskStream, stream_target
+
+        queue = ProducerConsumerQueue[Tresult](max_size = STREAM_BUFFER_SIZE)
+        signal = InterruptSignal(self.__interrupt) if self.__interrupt else InterruptSignal()
+        task = TaskProto(self.__name, signal.interrupt, self.__scheduler, False, self.__priority).run(stream_target, queue, fn, args, kwargs)
+        return TaskStream[Tresult](queue, task, signal)
+
+    def hedge(
+        self,
+        fn: Callable[..., T], /,
+        *args: Any,
+        after: float = 0.05,
+        max_copies: int = 2,
+        **kwargs: Any
+    ) -> Task[T]:
+        """Creates a new hedged task and schedules it. The target function is run, and each time the specified delay elapses
+        without it having completed, a duplicate attempt is launched (up to max_copies attempts in total). The task completes with
+        the result of the first attempt to complete successfully, and the remaining attempts are interrupted.
+        If every attempt launched fails, the task fails with the exception of the last one.
+
+        Args:
+            fn (Callable[..., T]): The target function, which is called with the task of the attempt followed by the arguments.
+            after (float, optional): The time (seconds) to wait for an attempt before launching another. Defaults to 0.05.
+            max_copies (int, optional): The max. no. of attempts. Defaults to 2.
+
+        Returns:
+            Task[T]: Returns the new task.
+        """
+        from runtime.threading.core.tasks.task_hedge import HedgeRun
+
+        if after < 0:
+            raise ValueError("Argument after must be a non-negative number")
+        if max_copies < 1:
+            raise ValueError("Argument max_copies must be greater than 0")
+
+        if self.__scheduler is None:
+            if ( pc := PContext.current() ) and pc is not PContext.root():
+                self.__scheduler = pc.scheduler
+
+        return HedgeRun[T](
+            self.__name,
+            self.__interrupt,
+            self.__scheduler or TaskScheduler.current(),
+            self.__priority,
+            fn,
+            args,
+            kwargs,
+            after,
+            max_copies
+        ).start()
+
     def run_after(
         self,
         time: float,
@@ -119,7 +223,8 @@ class TaskProto:
         *args: P.args,
         **kwargs: P.kwargs
     ) -> Task[T]:
-        """Creates a new task which will be scheduled after specified time.
+        """Creates a new task which will be scheduled after specified time. The task is held by the
+        default TimerWheel until then, so no thread is occupied while waiting.
 
         Args:
             time (float): The time (seconds) to wait before scheduling the task.
@@ -128,22 +233,18 @@ class TaskProto:
         Returns:
             Task[T]: Returns the new task.
         """
-        def fn_sleep(task: Task[Any]) -> None:
-            task.interrupt.wait(time)
-
-        def fn_continue(task: Task[Any], other: Task[Any], *args: P.args, **kwargs: P.kwargs) -> T:
-            return fn(task, *args, **kwargs)
-
         if self.__scheduler is None:
             if ( pc := PContext.current() ) and pc is not PContext.root():
                 self.__scheduler = pc.scheduler
 
-        return Task.create(interrupt = self.__interrupt).run(fn_sleep).continue_with(ContinuationOptions.ON_COMPLETED_SUCCESSFULLY | ContinuationOptions.INLINE, fn_continue, *args, **kwargs)
+        task = Task[T](TaskTarget(fn, args, kwargs), self.__name, self.__interrupt, self.__lazy, self.__priority)
+        task._schedule_after(time, self.__scheduler or TaskScheduler.current()) # pyright: ignore[reportPrivateUsage]
+        return task
 
 class ContinuationProto:
     """The ContinuationProto class is a Task creation wrapper, used to create task continuations in an easy way.
     """
-    __slots__ = [ "__tasks", "__name", "__interrupt", "__when", "__options" ]
+    __slots__ = [ "__tasks", "__name", "__interrupt", "__when", "__options", "__priority" ]
 
     def __init__(
         self,
@@ -151,13 +252,16 @@ class ContinuationProto:
         when: ContinueWhen, /,
         options: ContinuationOptions = ContinuationOptions.ON_COMPLETED_SUCCESSFULLY,
         name: str | None = None,
-        interrupt: Interrupt | None = None
+        interrupt: Interrupt | None = None,
+        priority: int | None = None
     ):
         self.__tasks = tasks
         self.__when = when
         self.__options = options
         self.__name = name
         self.__interrupt = interrupt
+        # continuations inherit the highest priority of the awaited tasks, unless specified
+        self.__priority = priority if priority is not None else max(( task.priority for task in tasks ), default = 0)
 
     def plan(self) -> Task[None]:
         """Creates a continuation task which will complete immediately when one or all of the awaited tasks complete.
@@ -190,7 +294,8 @@ class ContinuationProto:
         """
         continuation = Task.create(
             name = self.__name or get_function_name(fn),
-            interrupt = self.__interrupt
+            interrupt = self.__interrupt,
+            priority = self.__priority
         ).plan(
             fn,
             self.__tasks,
@@ -212,16 +317,15 @@ class Task(Generic[T]):
     """
     __slots__ = [
         "__id", "__name", "__parent", "__scheduler", "__pctx", "__internal_event", "__lock", "__weakref__",
-        "__target", "__exception", "__state", "__interrupt", "__lazy", "__result", "__target_name"
+        "__target", "__exception", "__state", "__interrupt", "__lazy", "__priority", "__result", "__target_fn", "__queued_at"
     ]
-    __current_id__: ClassVar[int] = 1
-
     def __init__(
         self,
         fn: Callable[[Task[T]], T],
         name: str | None = None,
         interrupt: Interrupt | None = None,
-        lazy: bool = False
+        lazy: bool = False,
+        priority: int = 0
     ):
         """Creates a new Task. It's recommended to use Task.create(), Task.plan() or Task.run() instead.
 
@@ -230,22 +334,22 @@ class Task(Generic[T]):
             name (str | None, optional): The name of the task. Defaults to None.
             interrupt (Interrupt | None, optional): An external interrupt used for interruption. Defaults to None.
             lazy (bool, optional): Specifies whether or not this task may be run lazily when awaited. Defaults to False.
+            priority (int, optional): The task priority (higher is more urgent), used by priority aware schedulers. Defaults to 0.
         """
-        with LOCK:
-            self.__id = Task.__current_id__
-            Task.__current_id__ += 1
-
-        self.__name = name or f"Task_{self.__id}"
-        self.__internal_event = OneTimeEvent(purpose = "TASK_NOTIFY")
+        self.__id = next(IDS)
+        self.__name = name # default name is computed on demand
+        self.__internal_event: OneTimeEvent | None = None # allocated on demand, ie. when awaited or continued
         self.__lock = Lock()
         self.__scheduler: TaskScheduler | None = None
         self.__target = fn
-        self.__target_name = f"{fn.__module__}.{fn.__qualname__}"
+        self.__target_fn = fn.fn if isinstance(fn, TaskTarget) else fn # kept for naming, when the target (and its arguments) is released
         self.__state: TaskState = TaskState.NOTSTARTED
         self.__interrupt = interrupt or Interrupt.none()
         self.__exception: Exception | None = None
         self.__lazy = lazy
+        self.__priority = priority
         self.__result: T | None = None
+        self.__queued_at: float | None = None
         self.__parent = TaskScheduler.current_task()
 
         pctx = PContext.current()
@@ -262,13 +366,13 @@ class Task(Generic[T]):
     def name(self) -> str:
         """The task name.
         """
-        return self.__name
+        return self.__name or f"Task_{self.__id}"
 
     @name.setter
     def name(self, value: str):
         """Sets the task name
         """
-        self.__name = value or f"Task_{self.__id}"
+        self.__name = value or None
         TaskScheduler.current()._refresh_task() # pyright: ignore[reportPrivateUsage]
 
     @property
@@ -288,7 +392,7 @@ class Task(Generic[T]):
     def target(self) -> str: # pragma: no cover
         """Returns the name of the target function (for testing).
         """
-        return self.__target_name
+        return f"{self.__target_fn.__module__}.{self.__target_fn.__qualname__}"
 
     @property
     def is_completed(self) -> bool:
@@ -341,6 +445,22 @@ class Task(Generic[T]):
         """
         return self.__lazy
 
+    @property
+    def priority(self) -> int:
+        """The task priority (higher is more urgent), used by priority aware schedulers.
+        """
+        return self.__priority
+
+    @property
+    def _queued_at(self) -> float | None:
+        """The time (as returned by time.perf_counter()) at which the task was last queued on a scheduler. For internal use.
+        """
+        return self.__queued_at
+
+    @_queued_at.setter
+    def _queued_at(self, value: float) -> None:
+        self.__queued_at = value
+
     @property
     def interrupt(self) -> Interrupt:
         """The task Interrupt.
@@ -384,7 +504,13 @@ class Task(Generic[T]):
     def wait_event(self) -> Event:
         """The internal task event, signaled upon completion.
         """
-        return self.__internal_event
+        if ( event := self.__internal_event ) is None:
+            with self.__lock:
+                if ( event := self.__internal_event ) is None:
+                    event = self.__internal_event = OneTimeEvent(purpose = "TASK_NOTIFY")
+                    if self.__state >= TaskState.COMPLETED:
+                        event.signal() # the task completed before anyone waited for it
+        return event
 
     @staticmethod
     def current() -> Task[Any] | None:
@@ -413,26 +539,127 @@ class Task(Generic[T]):
 
             self.__scheduler = scheduler
             self.__transition_to(TaskState.SCHEDULED)
+
+        # the task is queued outside the lock, since bounded schedulers may block the caller or run the task inline
+        try:
             scheduler.queue(self)
+        except Exception:
+            with self.__lock:
+                if self.__state == TaskState.SCHEDULED:
+                    # the task was rejected, so it may be scheduled again
+                    self.__state = TaskState.NOTSTARTED
+                    self.__scheduler = None
+            raise
 
-    def run_synchronously(self) -> None:
-        """Runs the task synchronously.
+    @staticmethod
+    def _schedule_many(tasks: Sequence[Task[Any]], scheduler: TaskScheduler) -> None:
+        """Marks the tasks as scheduled, and queues them on the specified scheduler all at once.
+
+        Args:
+            tasks (Sequence[Task[Any]]): The tasks to schedule.
+            scheduler (TaskScheduler): The task scheduler on which to schedule.
         """
+        for task in tasks:
+            with task.__lock:
+                if task.__state == TaskState.SCHEDULED:
+                    raise TaskAlreadyScheduledError # pragma: no cover -- only called on new tasks
+                elif task.__state >= TaskState.COMPLETED:
+                    raise TaskCompletedError # pragma: no cover -- only called on new tasks
 
-        current_scheduler = TaskScheduler.current()
+                task.__scheduler = scheduler
+                task.__transition_to(TaskState.SCHEDULED)
+
+        try:
+            scheduler.queue_many(tasks)
+        except Exception:
+            for task in tasks:
+                with task.__lock:
+                    # none of the tasks were queued, so they may be scheduled again
+                    task.__state = TaskState.NOTSTARTED
+                    task.__scheduler = None
+            raise
+
+    def _schedule_after(self, time: float, scheduler: TaskScheduler) -> None:
+        """Marks the task as scheduled, and queues it on the specified scheduler after specified time.
+        If the task interrupt is signaled in the meantime, the task is queued immediately (and thus interrupted).
+
+        Args:
+            time (float): The time (seconds) to wait before queueing the task.
+            scheduler (TaskScheduler): The task scheduler on which to schedule.
+        """
+        self._hold(scheduler)
+        fn_queue = self._release
+
+        if self.__interrupt is Interrupt.none():
+            TimerWheel.default().schedule(time, fn_queue)
+            return
+
+        def fn_interrupt() -> None:
+            if timer.cancel():
+                fn_queue()
+
+        def fn_expired() -> None:
+            # the interrupt may be long-lived, so the continuation is removed once it's no longer needed
+            Event._remove_continuation(continuation) # pyright: ignore[reportPrivateUsage]
+            fn_queue()
+
+        continuation = CallbackContinuation(ContinueWhen.ALL, (self.__interrupt.wait_event,), fn_interrupt)
+        timer = TimerWheel.default().schedule(time, fn_expired)
+        Event._add_continuation((self.__interrupt.wait_event,), continuation) # pyright: ignore[reportPrivateUsage]
+
+        if not timer.is_pending: # ie. the timer expired before the continuation was added
+            Event._remove_continuation(continuation) # pyright: ignore[reportPrivateUsage]
+
+    def _hold(self, scheduler: TaskScheduler) -> None:
+        """Marks the task as scheduled on the specified scheduler without queueing it. The task is queued later with _release().
 
+        Args:
+            scheduler (TaskScheduler): The task scheduler on which to schedule.
+        """
         with self.__lock:
-            if self.__state >= TaskState.COMPLETED:
-                raise TaskCompletedError
-            elif self.__state >= TaskState.RUNNING:
-                raise TaskAlreadyRunningError
-            elif self.__scheduler is not None and self.__scheduler is not current_scheduler:
-                raise TaskAlreadyScheduledError # pragma: no cover
+            if self.__state == TaskState.SCHEDULED:
+                raise TaskAlreadyScheduledError # pragma: no cover -- only called on new tasks
+            elif self.__state >= TaskState.COMPLETED:
+                raise TaskCompletedError # pragma: no cover -- only called on new tasks
 
-            if self.__scheduler is None:
-                self.__scheduler = current_scheduler
+            self.__scheduler = scheduler
+            self.__transition_to(TaskState.SCHEDULED)
 
-            self.__transition_to(TaskState.RUNNING)
+    def _release(self) -> None:
+        """Queues a task held by _hold() on its scheduler. If the scheduler rejects the task, the task fails.
+        """
+        try:
+            cast(TaskScheduler, self.__scheduler).queue(self)
+        except Exception as ex: # ie. scheduler was closed in the meantime
+            self._reject(ex)
+
+    def _resolve(self, result: T) -> None:
+        """Completes a task held by _hold() with a result produced elsewhere, without queueing or running it.
+
+        Args:
+            result (T): The result of the task.
+        """
+        with self.__lock:
+            self.__result = result
+            self.__transition_to(TaskState.COMPLETED)
+
+        self.__notify()
+
+    def _reject(self, ex: Exception) -> None:
+        """Fails a scheduled task, which was rejected by its scheduler without being run.
+
+        Args:
+            ex (Exception): The reason for rejecting the task.
+        """
+        self.__fail(ex)
+        self.__notify()
+
+    def run_synchronously(self) -> None:
+        """Runs the task synchronously.
+        """
+
+        current_scheduler = TaskScheduler.current()
+        self.__start(current_scheduler)
 
         try:
             if self.__pctx and not self.__pctx.closed and current_scheduler is self.__pctx.scheduler and PContext._register(self.__pctx): # pyright: ignore[reportPrivateUsage]
@@ -441,31 +668,96 @@ class Task(Generic[T]):
                 self.__pctx = None
 
             self.__interrupt.raise_if_signaled()
-            self.__result = self.__target(self)
+            self.__result = cast(TaskScheduler, self.__scheduler)._execute(self, self.__target) # pyright: ignore[reportPrivateUsage]
 
             with self.__lock:
                 self.__transition_to(TaskState.COMPLETED)
 
-        except InterruptException as ex:
-            with self.__lock:
-                self.__exception = ex
-
-                if ex.interrupt.signal_id == self.__interrupt.signal_id:
-                    self.__transition_to(TaskState.INTERRUPTED)
-                # elif ex.interrupt is self.__interrupt:
-                #     self.__transition_to(TaskState.INTERRUPTED)
-                else:
-                    self.__transition_to(TaskState.FAILED)
         except Exception as ex:
-            with self.__lock:
-                self.__exception = ex
-                self.__transition_to(TaskState.FAILED)
+            self.__fail(ex)
         finally:
             if self.__pctx:
                 PContext._unregister(self.__pctx) # pyright: ignore[reportPrivateUsage]
                 self.__pctx = None
 
-            self.__internal_event.signal()
+            self.__notify()
+
+    async def _run_asynchronously(self, scheduler: TaskScheduler) -> None:
+        """Runs the task on the current event loop. If the target function returns an awaitable
+        (ie. it's a coroutine function), it's awaited before the task is completed.
+
+        Args:
+            scheduler (TaskScheduler): The scheduler running the event loop.
+        """
+        self.__start(scheduler)
+        self.__pctx = None # parallel contexts are thread-bound, and the event loop thread is shared by many tasks
+        token = scheduler._register_async(self) # pyright: ignore[reportPrivateUsage]
+
+        # the interrupt cancels the asyncio task, so that awaiting coroutines are interrupted right away
+        running, loop = current_asyncio_task(), get_running_loop()
+        interrupt_event = self.__interrupt.wait_event
+        continuation = CallbackContinuation(
+            ContinueWhen.ALL,
+            (interrupt_event,),
+            lambda: loop.call_soon_threadsafe(cast(AsyncioTask[None], running).cancel)
+        )
+        Event._add_continuation((interrupt_event,), continuation) # pyright: ignore[reportPrivateUsage]
+
+        try:
+            self.__interrupt.raise_if_signaled()
+            result = self.__target(self)
+            self.__result = await result if isawaitable(result) else result
+
+            with self.__lock:
+                self.__transition_to(TaskState.COMPLETED)
+
+        except CancelledError:
+            try:
+                self.__interrupt.raise_if_signaled()
+                raise TaskException("Task was cancelled outside of its interrupt")
+            except Exception as ex:
+                self.__fail(ex)
+        except Exception as ex:
+            self.__fail(ex)
+        finally:
+            Event._remove_continuation(continuation) # pyright: ignore[reportPrivateUsage]
+            scheduler._unregister_async(token) # pyright: ignore[reportPrivateUsage]
+            self.__notify()
+
+    def __start(self, scheduler: TaskScheduler) -> None:
+        with self.__lock:
+            if self.__state >= TaskState.COMPLETED:
+                raise TaskCompletedError
+            elif self.__state >= TaskState.RUNNING:
+                raise TaskAlreadyRunningError
+            elif self.__scheduler is not None and self.__scheduler is not scheduler:
+                raise TaskAlreadyScheduledError # pragma: no cover
+
+            if self.__scheduler is None:
+                self.__scheduler = scheduler
+
+            self.__transition_to(TaskState.RUNNING)
+
+    def __notify(self) -> None:
+        self._on_completed()
+
+        # signals the wait event, if anyone has waited for or continued the task - otherwise it's signaled upon creation
+        if ( event := self.__internal_event ) is not None:
+            event.signal()
+
+    def _on_completed(self) -> None:
+        """Called once when the task is completed (successfully or not), before it's signaled. Overridable.
+        """
+        pass
+
+    def __fail(self, ex: Exception) -> None:
+        with self.__lock:
+            self.__exception = ex
+
+            if isinstance(ex, InterruptException) and ex.interrupt.signal_id == self.__interrupt.signal_id:
+                self.__transition_to(TaskState.INTERRUPTED)
+            else:
+                self.__transition_to(TaskState.FAILED)
 
     def wait(
         self,
@@ -482,11 +774,22 @@ class Task(Generic[T]):
         Returns:
             bool: Returns True if task completed. Otherwise False.
         """
+        scheduler: TaskScheduler | None = None
+
         with self.__lock:
             if self.__state == TaskState.NOTSTARTED and self.__lazy:
                 TaskScheduler.current().prioritise(self)
+            elif self.__state == TaskState.SCHEDULED and timeout is None and interrupt is None:
+                # running the task inline cannot honor a timeout or interrupt, so only do so for unbounded waits
+                scheduler = self.__scheduler
+
+        if scheduler is not None:
+            scheduler._try_run_inline(self) # pyright: ignore[reportPrivateUsage]
 
-        return self.__internal_event.wait(timeout, interrupt)
+        if self.__state >= TaskState.COMPLETED and ( interrupt is None or not interrupt.is_signaled ):
+            return True # no need to allocate the wait event
+
+        return self.wait_event.wait(timeout, interrupt)
 
 
     def continue_with(
@@ -506,7 +809,7 @@ class Task(Generic[T]):
         Returns:
             Task[Tcontinuation]: Returns a new Task instance.
         """
-        continuation = Task.plan(fn, self, *args, **kwargs)
+        continuation = Task.create(priority = self.__priority).plan(fn, self, *args, **kwargs)
         continuation.__state = TaskState.SCHEDULED
 
         Event._add_continuation( # pyright: ignore[reportPrivateUsage]
@@ -516,6 +819,55 @@ class Task(Generic[T]):
 
         return continuation
 
+    def to_future(self, loop: AbstractEventLoop | None = None) -> AsyncioFuture[T]:
+        """Creates an asyncio future which is completed with the result or exception of the task.
+        The future is completed from the event loop, so no thread is blocked while awaiting it.
+        If task has not been scheduled and is lazy, it will be scheduled automatically.
+
+        Args:
+            loop (AbstractEventLoop | None, optional): The event loop of the future. Defaults to None (the running loop).
+
+        Raises:
+            TaskNotScheduledError: Raised if task is not scheduled and is not lazy.
+
+        Returns:
+            AsyncioFuture[T]: Returns a new future.
+        """
+        loop = loop or get_running_loop()
+        future: AsyncioFuture[T] = loop.create_future()
+
+        with self.__lock:
+            if self.__state == TaskState.NOTSTARTED:
+                if self.__lazy:
+                    self.schedule()
+                else:
+                    raise TaskNotScheduledError
+
+        def fn_complete() -> None:
+            if future.done():
+                return # pragma: no cover -- future was cancelled
+            elif self.__state in (TaskState.INTERRUPTED, TaskState.FAILED):
+                future.set_exception(cast(Exception, self.__exception))
+            else:
+                future.set_result(cast(T, self.__result))
+
+        def fn_notify() -> None:
+            try:
+                loop.call_soon_threadsafe(fn_complete)
+            except RuntimeError: # pragma: no cover
+                pass # event loop is closed
+
+        event = self.wait_event
+        Event._add_continuation( # pyright: ignore[reportPrivateUsage]
+            (event,),
+            CallbackContinuation(ContinueWhen.ALL, (event,), fn_notify)
+        )
+
+        return future
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.to_future().__await__()
+
     def _interrupt_and_notify(self) -> None:
         with self.__lock:
             if self.__state == TaskState.NOTSTARTED:
@@ -525,7 +877,7 @@ class Task(Generic[T]):
 
             self.__exception = InterruptException(self.__interrupt)
             self.__transition_to(TaskState.INTERRUPTED)
-            self.__internal_event.signal()
+            self.__notify()
 
     def __transition_to(self, state: TaskState) -> None:
         with self.__lock:
@@ -543,14 +895,18 @@ class Task(Generic[T]):
                 pass
             elif state == TaskState.FAILED and self.__state == TaskState.RUNNING:
                 pass
+            elif state == TaskState.FAILED and self.__state == TaskState.SCHEDULED:
+                pass
             elif state == TaskState.COMPLETED and self.__state == TaskState.RUNNING:
                 pass
+            elif state == TaskState.COMPLETED and self.__state == TaskState.SCHEDULED:
+                pass
             else:
                 raise TaskException(f"Task cannot transition from state '{self.__state.name}' to '{state.name}'")
 
             self.__state = state
 
-            if state in [TaskState.INTERRUPTED, TaskState.FAILED, TaskState.COMPLETED ]:
+            if state >= TaskState.COMPLETED:
                 del self.__target
 
     def __repr__(self) -> str:
@@ -579,7 +935,7 @@ class Task(Generic[T]):
             bool: Returns True when any of the tasks completed. Otherwise False.
         """
 
-        events: Sequence[Event] = [ t.__internal_event for t in tasks ]
+        events: Sequence[Event] = [ t.wait_event for t in tasks ]
 
         if Event.wait_any(events, timeout, interrupt = interrupt):
             if interrupt and interrupt.is_signaled:
@@ -596,6 +952,64 @@ class Task(Generic[T]):
         else:
             return False # pragma: no cover -- events will be hit eventually
 
+    @staticmethod
+    def wait_any_index(
+        tasks: Sequence[Task[Any]],
+        timeout: float | None = None, /,
+        interrupt: Interrupt | None = None
+    ) -> int | None:
+        """Waits for any of the specified tasks to complete (successfully or not), and returns the index of the first one completed.
+        Unlike wait_any(), no exceptions are raised for failed or interrupted tasks - inspect the returned task instead.
+
+        Args:
+            tasks (Sequence[Task]): The tasks to await.
+            timeout (float | None, optional): Timeout (seconds) before returning None. Defaults to None.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+
+        Returns:
+            int | None: Returns the index of the completed task, or None if a timeout occurred or the interrupt was signaled.
+        """
+        return Event.wait_any_index([ t.wait_event for t in tasks ], timeout, interrupt)
+
+    @staticmethod
+    def as_completed(
+        tasks: Sequence[Task[Tresult]],
+        timeout: float | None = None, /,
+        interrupt: Interrupt | None = None
+    ) -> Iterator[Task[Tresult]]:
+        """Returns an iterator yielding the tasks as they complete (successfully or not). The tasks are
+        collected in a single completion queue, so each task is yielded without rescanning the others.
+
+        Args:
+            tasks (Sequence[Task]): The tasks to await.
+            timeout (float | None, optional): Timeout (seconds) for all of the tasks to complete. Defaults to None.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+
+        Raises:
+            TimeoutError: Raised if the tasks haven't completed before the timeout.
+            InterruptException: Raised if the interrupt is signaled.
+
+        Returns:
+            Iterator[Task[Tresult]]: Returns an iterator.
+        """
+        completed: Queue[Task[Tresult]] = Queue()
+
+        for task in tasks:
+            event = task.wait_event
+            Event._add_continuation( # pyright: ignore[reportPrivateUsage]
+                (event,),
+                CallbackContinuation(ContinueWhen.ALL, (event,), partial(completed.enqueue, task))
+            )
+
+        return Task.__iterate_completed(completed, len(tasks), timeout, interrupt)
+
+    @staticmethod
+    def __iterate_completed(completed: Queue[Task[Tresult]], count: int, timeout: float | None, interrupt: Interrupt | None) -> Iterator[Task[Tresult]]:
+        deadline = perf_counter() + timeout if timeout is not None else None
+
+        for _ in range(count):
+            yield completed.dequeue(max(0, deadline - perf_counter()) if deadline is not None else None, interrupt)
+
     @staticmethod
     def wait_all(
         tasks: Sequence[Task[Any]],
@@ -619,7 +1033,7 @@ class Task(Generic[T]):
             bool: Returns true if all of the tasks completed. Otherwise False.
         """
 
-        events: Sequence[Event] = [ t.__internal_event for t in tasks ]
+        events: Sequence[Event] = [ t.wait_event for t in tasks ]
 
         if Event.wait_all(events, timeout, interrupt = interrupt):
             if interrupt and interrupt.is_signaled:
@@ -640,7 +1054,8 @@ class Task(Generic[T]):
     def with_any(
         tasks: Sequence[Task[Any]], /,
         options: ContinuationOptions=ContinuationOptions.ON_COMPLETED_SUCCESSFULLY,
-        interrupt: Interrupt | None = None
+        interrupt: Interrupt | None = None,
+        priority: int | None = None
     ) -> ContinuationProto:
         """Initiates the creation of a new continuation which is run when any of the specified tasks are completed.
 
@@ -648,17 +1063,19 @@ class Task(Generic[T]):
             tasks (Sequence[Task[Any]]): The tasks awaited.
             options (ContinuationOptions): Specifies when and how continuation is run.
             interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+            priority (int | None, optional): The continuation priority. Defaults to None (highest priority of the awaited tasks).
 
         Returns:
             ContinuationProto: Returns a ContinuationProto wrapper.
         """
-        return ContinuationProto(tasks, ContinueWhen.ANY, options = options, interrupt = interrupt)
+        return ContinuationProto(tasks, ContinueWhen.ANY, options = options, interrupt = interrupt, priority = priority)
 
     @staticmethod
     def with_all(
         tasks: Sequence[Task[Any]], /,
         options: ContinuationOptions=ContinuationOptions.ON_COMPLETED_SUCCESSFULLY,
         interrupt: Interrupt | None = None,
+        priority: int | None = None
     ) -> ContinuationProto:
         """Initiates the creation of a new continuation which is run when all of the specified tasks are completed.
 
@@ -666,11 +1083,12 @@ class Task(Generic[T]):
             tasks (Sequence[Task[Any]]): The tasks awaited.
             options (ContinuationOptions): Specifies when and how continuation is run.
             interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+            priority (int | None, optional): The continuation priority. Defaults to None (highest priority of the awaited tasks).
 
         Returns:
             ContinuationProto: Returns a ContinuationProto wrapper.
         """
-        return ContinuationProto(tasks, ContinueWhen.ALL, options = options, interrupt = interrupt)
+        return ContinuationProto(tasks, ContinueWhen.ALL, options = options, interrupt = interrupt, priority = priority)
 
 
     @staticmethod
@@ -679,7 +1097,8 @@ class Task(Generic[T]):
         name: str | None = None,
         interrupt: Interrupt | None = None,
         scheduler: TaskScheduler | None = None,
-        lazy: bool = False
+        lazy: bool = False,
+        priority: int = 0
     ) -> TaskProto:
         """Initiates the creation of a new Task.
 
@@ -688,11 +1107,12 @@ class Task(Generic[T]):
             interrupt (Interrupt | None, optional): An external interrupt used to stop the task. Defaults to None.
             scheduler (TaskScheduler | None, optional): A scheduler onto which the task will be scheduled. Defaults to None.
             lazy (bool, optional): Specifies if task can be lazily started or not. Defaults to False.
+            priority (int, optional): The task priority (higher is more urgent), used by priority aware schedulers. Defaults to 0.
 
         Returns:
             TaskProto: Returns a TaskProto wrapper.
         """
-        return TaskProto(name, interrupt, scheduler, lazy)
+        return TaskProto(name, interrupt, scheduler, lazy, priority)
 
     @staticmethod
     def plan(
@@ -728,6 +1148,66 @@ class Task(Generic[T]):
         """
         return TaskProto().run(fn, *args, **kwargs)
 
+    @staticmethod
+    def run_many(
+        fn: Callable[..., Tresult],
+        args: Iterable[Sequence[Any]], /,
+        scheduler: TaskScheduler | None = None
+    ) -> TaskBatch[Tresult]:
+        """Creates a batch of tasks, one for each sequence of positional arguments, and schedules them together
+        with a single lock acquisition and wake-up. Use Task.create().run_many() for more control of the task specifics.
+
+        Args:
+            fn (Callable[..., Tresult]): The target function, which is called with the task followed by the arguments.
+            args (Iterable[Sequence[Any]]): The positional arguments of each task.
+            scheduler (TaskScheduler | None, optional): The scheduler onto which the tasks will be scheduled. Defaults to None (the current scheduler).
+
+        Returns:
+            TaskBatch[Tresult]: Returns a handle to the new tasks.
+        """
+        return TaskProto(scheduler = scheduler).run_many(fn, args)
+
+    @staticmethod
+    def stream(
+        fn: Callable[Concatenate[Task[None], P], Iterable[Tresult]], /,
+        *args: P.args,
+        **kwargs: P.kwargs
+    ) -> TaskStream[Tresult]:
+        """Creates a new streaming task and schedules it on the default scheduler. The items yielded by the target function
+        are buffered in a bounded queue (see STREAM_BUFFER_SIZE), and can be consumed while the task is still producing.
+        Use Task.create().stream() for more control of the task specifics.
+
+        Args:
+            fn (Callable[Concatenate[Task[None], P], Iterable[Tresult]]): The target function (typically a generator).
+
+        Returns:
+            TaskStream[Tresult]: Returns a PIterable yielding the items produced by the task.
+        """
+        return TaskProto().stream(fn, *args, **kwargs)
+
+    @staticmethod
+    def hedge(
+        fn: Callable[..., Tresult], /,
+        *args: Any,
+        after: float = 0.05,
+        max_copies: int = 2,
+        **kwargs: Any
+    ) -> Task[Tresult]:
+        """Creates a new hedged task and schedules it on the default scheduler. The target function is run, and each time the specified delay
+        elapses without it having completed, a duplicate attempt is launched (up to max_copies attempts in total). The task completes with
+        the result of the first attempt to complete successfully, and the remaining attempts are interrupted.
+        Use Task.create().hedge() for more control of the task specifics.
+
+        Args:
+            fn (Callable[..., Tresult]): The target function, which is called with the task of the attempt followed by the arguments.
+            after (float, optional): The time (seconds) to wait for an attempt before launching another. Defaults to 0.05.
+            max_copies (int, optional): The max. no. of attempts. Defaults to 2.
+
+        Returns:
+            Task[Tresult]: Returns the new task.
+        """
+        return TaskProto().hedge(fn, *args, after = after, max_copies = max_copies, **kwargs)
+
     @staticmethod
     def run_after(
         time: float,
@@ -748,6 +1228,34 @@ class Task(Generic[T]):
 
         return TaskProto().run_after(time, fn, *args, **kwargs)
 
+    @staticmethod
+    def from_future(future: Future[Tresult] | AsyncioFuture[Tresult]) -> Task[Tresult]:
+        """Creates a task which is completed with the result or exception of a future.
+        A cancelled future results in an interrupted task.
+
+        Args:
+            future (Future[Tresult] | AsyncioFuture[Tresult]): The future (either from concurrent.futures or asyncio).
+
+        Returns:
+            Task[Tresult]: Returns a task which completes when the future is done.
+        """
+        signal = InterruptSignal()
+
+        def fn_result(task: Task[Tresult]) -> Tresult:
+            if future.cancelled():
+                signal.signal()
+                task.interrupt.raise_if_signaled()
+            return future.result()
+
+        task = Task.create(interrupt = signal.interrupt).plan(fn_result)
+        task.__state = TaskState.SCHEDULED
+
+        def fn_done(future: Any) -> None:
+            task.run_synchronously()
+
+        future.add_done_callback(fn_done)
+        return task
+
     @staticmethod
     def from_result(result: Tresult) -> Task[Tresult]:
         """Creates a task which is completed with a preset result.
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import TypeVar, Sequence, Iterator, overload
+
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.tasks.task import Task
+
+T = TypeVar("T")
+
+class TaskBatch(Sequence[Task[T]]):
+    """The TaskBatch class is a handle to a batch of tasks, created and scheduled together with Task.run_many().
+    """
+    __slots__ = [ "__tasks" ]
+
+    def __init__(self, tasks: Sequence[Task[T]]):
+        """Creates a new TaskBatch. Should not be called directly - use Task.run_many() instead...
+
+        Args:
+            tasks (Sequence[Task[T]]): The tasks of the batch.
+        """
+        self.__tasks = tuple(tasks)
+
+    @property
+    def tasks(self) -> tuple[Task[T], ...]:
+        """The tasks of the batch.
+        """
+        return self.__tasks
+
+    def wait_all(
+        self,
+        timeout: float | None = None, /,
+        fail_on_interrupt: bool = False,
+        interrupt: Interrupt | None = None
+    ) -> bool:
+        """Waits for all of the tasks to complete.
+
+        Args:
+            timeout (float | None, optional): Timeout (seconds) before returning False. Defaults to None.
+            fail_on_interrupt (bool): Raise a AwaitedTaskInterruptedError if any of the tasks was interrupted.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+
+        Raises:
+            AggregateException: Any failed tasks will raise an AggregateException
+            AwaitedTaskInterruptedError: Any interrupted tasks will raise a AwaitedTaskInterruptedError if 'fail_on_interrupt' argument is True
+
+        Returns:
+            bool: Returns True if all of the tasks completed. Otherwise False.
+        """
+        if not self.__tasks:
+            return True
+
+        return Task.wait_all(self.__tasks, timeout, fail_on_interrupt, interrupt)
+
+    def results(self) -> list[T]:
+        """Waits for all of the tasks to complete, and returns their results in the order of the batch.
+
+        Raises:
+            AggregateException: Any failed tasks will raise an AggregateException
+            AwaitedTaskInterruptedError: Any interrupted tasks will raise a AwaitedTaskInterruptedError
+
+        Returns:
+            list[T]: Returns the results of the tasks.
+        """
+        self.wait_all(None, True)
+        return [ task.result for task in self.__tasks ]
+
+    def as_completed(
+        self,
+        timeout: float | None = None, /,
+        interrupt: Interrupt | None = None
+    ) -> Iterator[Task[T]]:
+        """Returns an iterator yielding the tasks as they complete (successfully or not).
+
+        Args:
+            timeout (float | None, optional): Timeout (seconds) for all of the tasks to complete. Defaults to None.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+
+        Raises:
+            TimeoutError: Raised if the tasks haven't completed before the timeout.
+            InterruptException: Raised if the interrupt is signaled.
+
+        Returns:
+            Iterator[Task[T]]: Returns an iterator.
+        """
+        return Task.as_completed(self.__tasks, timeout, interrupt)
+
+    @overload
+    def __getitem__(self, index: int) -> Task[T]:
+        ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Task[T]]:
+        ...
+    def __getitem__(self, index: int | slice) -> Task[T] | Sequence[Task[T]]:
+        return self.__tasks[index]
+
+    def __len__(self) -> int:
+        return len(self.__tasks)
+
+    def __iter__(self) -> Iterator[Task[T]]:
+        return iter(self.__tasks)
+
+    def __repr__(self) -> str:
+        return f"TaskBatch of {len(self.__tasks)} tasks"
@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import Callable, Concatenate, Generic, Hashable, ParamSpec, TypeVar, Any
+from collections import OrderedDict
+from functools import partial, wraps
+from time import monotonic
+
+from runtime.threading.core.event import Event
+from runtime.threading.core.lock import Lock
+from runtime.threading.core.continue_when import ContinueWhen
+from runtime.threading.core.callback_continuation import CallbackContinuation
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
+
+K = TypeVar("K", bound = Hashable)
+T = TypeVar("T")
+P = ParamSpec("P")
+
+class TaskCache(Generic[K, T]):
+    """The TaskCache class is a single-flight memoizing cache of tasks. Concurrent requests for the same key share
+    one in-flight task, and completed tasks are kept until evicted (least recently used first, or when their time-to-live expires).
+    Failed and interrupted tasks are evicted immediately, so that the next request for the key starts a new task.
+    """
+    __slots__ = [ "__lock", "__max_size", "__ttl", "__scheduler", "__entries" ]
+
+    def __init__(
+        self,
+        max_size: int | None = 128,
+        ttl: float | None = None,
+        scheduler: TaskScheduler | None = None
+    ):
+        """Creates a new TaskCache.
+
+        Args:
+            max_size (int | None, optional): The max. no. of cached tasks. Defaults to 128 (None means unbounded).
+            ttl (float | None, optional): The time (seconds) a completed task is cached. Defaults to None (until evicted).
+            scheduler (TaskScheduler | None, optional): The scheduler onto which tasks are scheduled. Defaults to None (the current scheduler).
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("Argument max_size must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Argument ttl must be greater than 0")
+
+        self.__lock = Lock()
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__scheduler = scheduler
+        self.__entries: OrderedDict[K, tuple[Task[T], float | None]] = OrderedDict() # key -> (task, expiry)
+
+    @property
+    def max_size(self) -> int | None:
+        """The max. no. of cached tasks.
+        """
+        return self.__max_size
+
+    @property
+    def ttl(self) -> float | None:
+        """The time (seconds) a completed task is cached.
+        """
+        return self.__ttl
+
+    def get(
+        self,
+        key: K,
+        fn: Callable[Concatenate[Task[T], P], T], /,
+        *args: P.args,
+        **kwargs: P.kwargs
+    ) -> Task[T]:
+        """Returns the cached task for the specified key. If no task is cached (or it has expired),
+        a new task is created with the target function and scheduled, and cached under the key.
+
+        Args:
+            key (K): The cache key.
+            fn (Callable[Concatenate[Task[T], P], T]): The target function.
+
+        Returns:
+            Task[T]: Returns the cached (or new) task.
+        """
+        with self.__lock:
+            if ( entry := self.__entries.get(key) ) is not None:
+                task, expiry = entry
+
+                if task.is_failed or task.is_interrupted or ( expiry is not None and expiry <= monotonic() ):
+                    del self.__entries[key]
+                else:
+                    if expiry is None and self.__ttl is not None and task.is_completed:
+                        # the completion callback couldn't record the expiry, since the lock was busy at the time
+                        self.__entries[key] = ( task, monotonic() + self.__ttl )
+                    self.__entries.move_to_end(key)
+                    return task
+
+            task = Task.plan(fn, *args, **kwargs)
+            self.__entries[key] = ( task, None )
+
+            if self.__max_size is not None and len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last = False)
+
+        event = task.wait_event
+        Event._add_continuation( # pyright: ignore[reportPrivateUsage]
+            (event,),
+            CallbackContinuation(ContinueWhen.ALL, (event,), partial(self.__completed, key, task))
+        )
+
+        # the task is scheduled outside the lock, since bounded schedulers may block the caller or run the task inline
+        try:
+            task.schedule(self.__scheduler)
+        except Exception:
+            self.__remove(key, task)
+            raise
+
+        return task
+
+    def invalidate(self, key: K) -> bool:
+        """Removes the task cached under the specified key (if any). Tasks in flight are not interrupted.
+
+        Args:
+            key (K): The cache key.
+
+        Returns:
+            bool: Returns True if a task was removed. Otherwise False.
+        """
+        with self.__lock:
+            return self.__entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Removes all cached tasks. Tasks in flight are not interrupted.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __completed(self, key: K, task: Task[T]) -> None:
+        # callbacks must not block, so if the lock is busy, the entry is updated lazily by the next request for the key instead
+        if not self.__lock.acquire(0):
+            return
+
+        try:
+            if task.is_completed_successfully:
+                if self.__ttl is not None and ( entry := self.__entries.get(key) ) is not None and entry[0] is task:
+                    self.__entries[key] = ( task, monotonic() + self.__ttl )
+            else:
+                self.__remove(key, task)
+        finally:
+            self.__lock.release()
+
+    def __remove(self, key: K, task: Task[T]) -> None:
+        with self.__lock:
+            if ( entry := self.__entries.get(key) ) is not None and entry[0] is task:
+                del self.__entries[key]
+
+    def __contains__(self, key: K) -> bool:
+        with self.__lock:
+            return key in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+def task_cached(
+    max_size: int | None = 128,
+    ttl: float | None = None,
+    scheduler: TaskScheduler | None = None
+) -> Callable[[Callable[Concatenate[Task[T], P], T]], Callable[P, Task[T]]]:
+    """Decorates a target function, so that calling it returns a task from a single-flight TaskCache keyed by the arguments.
+    The arguments must be hashable, and the cache is available as the 'cache' attribute of the decorated function.
+
+    Args:
+        max_size (int | None, optional): The max. no. of cached tasks. Defaults to 128 (None means unbounded).
+        ttl (float | None, optional): The time (seconds) a completed task is cached. Defaults to None (until evicted).
+        scheduler (TaskScheduler | None, optional): The scheduler onto which tasks are scheduled. Defaults to None (the current scheduler).
+
+    Returns:
+        Callable[[Callable[Concatenate[Task[T], P], T]], Callable[P, Task[T]]]: Returns the decorator.
+    """
+    def decorator(fn: Callable[Concatenate[Task[T], P], T]) -> Callable[P, Task[T]]:
+        cache = TaskCache[Any, T](max_size, ttl, scheduler)
+
+        @wraps(fn)
+        def get(*args: P.args, **kwargs: P.kwargs) -> Task[T]:
+            key = ( args, tuple(sorted(kwargs.items())) ) if kwargs else args
+            return cache.get(key, fn, *args, **kwargs)
+
+        setattr(get, "cache", cache)
+        return get
+
+    return decorator
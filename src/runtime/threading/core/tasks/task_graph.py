@@ -0,0 +1,258 @@
+from __future__ import annotations
+from typing import Callable, Sequence, Mapping, Any
+
+from runtime.threading.core.lock import Lock
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_target import TaskTarget
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
+
+class TaskGraph:
+    """The TaskGraph class is used to declare a directed acyclic graph of tasks, where each node is run once all of its dependencies
+    have completed. Independent nodes run in parallel, and nodes on the critical path (ie. the longest path to the end of the graph) are
+    scheduled first. The target function of a node is called with the task, followed by the results of its dependencies and its own arguments.
+    """
+    __slots__ = [ "__nodes" ]
+
+    def __init__(self):
+        """Creates a new empty TaskGraph.
+        """
+        self.__nodes: dict[str, TaskGraphNode] = {}
+
+    @property
+    def nodes(self) -> Mapping[str, TaskGraphNode]:
+        """The nodes of the graph, in the order added.
+        """
+        return self.__nodes
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any], /,
+        *args: Any,
+        depends_on: Sequence[str] = (),
+        cost: float = 1.0
+    ) -> TaskGraph:
+        """Adds a node to the graph.
+
+        Args:
+            name (str): The unique name of the node.
+            fn (Callable[..., Any]): The target function, which is called with the task followed by the results of the dependencies and the arguments.
+            depends_on (Sequence[str], optional): The names of the nodes which must complete first. Defaults to ().
+            cost (float, optional): The estimated (relative) cost of the node, used for finding the critical path. Defaults to 1.0.
+
+        Returns:
+            TaskGraph: Returns the graph.
+        """
+        if name in self.__nodes:
+            raise ValueError(f"Node '{name}' already exists")
+        if cost < 0:
+            raise ValueError("Argument cost must be a non-negative number")
+
+        self.__nodes[name] = TaskGraphNode(name, fn, args, tuple(depends_on), cost)
+        return self
+
+    def plan(self) -> list[TaskGraphNode]:
+        """Validates the graph, and returns the nodes in the order they're prioritised, ie. a topological order where
+        nodes are sorted by their rank (the cost of the longest path from the node to the end of the graph).
+
+        Raises:
+            ValueError: Raised if a node depends on an unknown node, or if the graph contains a cycle.
+
+        Returns:
+            list[TaskGraphNode]: Returns the nodes.
+        """
+        dependents: dict[str, list[str]] = { name: [] for name in self.__nodes }
+        remaining: dict[str, int] = {}
+
+        for node in self.__nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self.__nodes:
+                    raise ValueError(f"Node '{node.name}' depends on unknown node '{dependency}'")
+                dependents[dependency].append(node.name)
+            remaining[node.name] = len(node.dependencies)
+
+        ordered = [ name for name, count in remaining.items() if count == 0 ]
+
+        for name in ordered: # ordered is extended while iterating
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ordered.append(dependent)
+
+        if len(ordered) < len(self.__nodes):
+            raise ValueError(f"Graph contains a cycle involving nodes {', '.join(sorted(name for name, count in remaining.items() if count > 0))}")
+
+        ranks: dict[str, float] = {}
+        for name in reversed(ordered):
+            ranks[name] = self.__nodes[name].cost + max(( ranks[dependent] for dependent in dependents[name] ), default = 0.0)
+
+        position = { name: index for index, name in enumerate(ordered) }
+        # sorting by rank preserves the topological order, since a node always outranks its dependents unless its cost is 0
+        ordered.sort(key = lambda name: ( -ranks[name], position[name] ))
+        return [ self.__nodes[name].with_rank(ranks[name]) for name in ordered ]
+
+    def to_dot(self) -> str:
+        """Exports the plan of the graph in the Graphviz DOT format.
+
+        Returns:
+            str: Returns the DOT representation of the graph.
+        """
+        lines = [ "digraph {" ]
+        for node in self.plan():
+            lines.append(f'  "{node.name}" [label="{node.name}\\nrank={node.rank:g}"];')
+            for dependency in node.dependencies:
+                lines.append(f'  "{dependency}" -> "{node.name}";')
+        lines.append("}")
+        return "\n".join(lines)
+
+    def run(
+        self,
+        scheduler: TaskScheduler | None = None,
+        interrupt: Interrupt | None = None
+    ) -> dict[str, Task[Any]]:
+        """Runs the graph. Nodes without dependencies are scheduled immediately, and every other node
+        is scheduled once its dependencies complete. If a dependency fails, the nodes depending on it fail as well.
+
+        Args:
+            scheduler (TaskScheduler | None, optional): The scheduler onto which tasks are scheduled. Defaults to None (the current scheduler).
+            interrupt (Interrupt | None, optional): An external interrupt used to interrupt the tasks. Defaults to None.
+
+        Raises:
+            ValueError: Raised if a node depends on an unknown node, or if the graph contains a cycle.
+
+        Returns:
+            dict[str, Task[Any]]: Returns the tasks of the nodes by name.
+        """
+        return GraphRun(self.plan(), scheduler or TaskScheduler.current(), interrupt).start()
+
+
+class TaskGraphNode:
+    """The TaskGraphNode class is a node of a TaskGraph.
+    """
+    __slots__ = [ "__name", "__fn", "__args", "__dependencies", "__cost", "__rank" ]
+
+    def __init__(self, name: str, fn: Callable[..., Any], args: tuple[Any, ...], dependencies: tuple[str, ...], cost: float, rank: float | None = None):
+        self.__name = name
+        self.__fn = fn
+        self.__args = args
+        self.__dependencies = dependencies
+        self.__cost = cost
+        self.__rank = rank
+
+    @property
+    def name(self) -> str:
+        """The name of the node.
+        """
+        return self.__name
+
+    @property
+    def fn(self) -> Callable[..., Any]:
+        """The target function of the node.
+        """
+        return self.__fn
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        """The arguments of the target function (following the results of the dependencies).
+        """
+        return self.__args
+
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        """The names of the nodes which must complete first.
+        """
+        return self.__dependencies
+
+    @property
+    def cost(self) -> float:
+        """The estimated (relative) cost of the node.
+        """
+        return self.__cost
+
+    @property
+    def rank(self) -> float | None:
+        """The cost of the longest path from the node to the end of the graph (only available in a plan).
+        """
+        return self.__rank
+
+    def with_rank(self, rank: float) -> TaskGraphNode:
+        return TaskGraphNode(self.__name, self.__fn, self.__args, self.__dependencies, self.__cost, rank)
+
+    def __repr__(self) -> str:
+        return f"TaskGraphNode '{self.__name}' rank={self.__rank}"
+
+
+class GraphRun:
+    """Tracks the remaining dependencies of each node in a single run of a TaskGraph.
+    """
+    __slots__ = [ "__lock", "__scheduler", "__tasks", "__remaining", "__dependents", "__positions" ]
+
+    def __init__(self, plan: Sequence[TaskGraphNode], scheduler: TaskScheduler, interrupt: Interrupt | None):
+        self.__lock = Lock()
+        self.__scheduler = scheduler
+        self.__tasks: dict[str, GraphTask] = {}
+        self.__remaining: dict[str, int] = {}
+        self.__dependents: dict[str, list[str]] = { node.name: [] for node in plan }
+        self.__positions = { node.name: position for position, node in enumerate(plan) } # plan is sorted by rank (descending)
+        priorities = { rank: priority for priority, rank in enumerate(sorted(set( node.rank for node in plan ))) }
+
+        for node in plan:
+            dependencies = tuple( self.__tasks[dependency] for dependency in node.dependencies ) # plan is topologically ordered
+            self.__tasks[node.name] = GraphTask(
+                self,
+                node.name,
+                TaskTarget(run_node, ( node.fn, dependencies, node.args ), {}),
+                interrupt,
+                priorities[node.rank]
+            )
+            self.__remaining[node.name] = len(set(node.dependencies))
+            for dependency in set(node.dependencies):
+                self.__dependents[dependency].append(node.name)
+
+    def start(self) -> dict[str, Task[Any]]:
+        tasks: dict[str, Task[Any]] = dict(self.__tasks)
+
+        # all nodes are marked as scheduled up front (so that they can be awaited), but only queued once their dependencies complete
+        for task in self.__tasks.values():
+            task._hold(self.__scheduler) # pyright: ignore[reportPrivateUsage]
+
+        # nodes are queued in the order of the plan, ie. critical path first
+        for name in [ name for name, remaining in self.__remaining.items() if remaining == 0 ]:
+            self.__tasks[name]._release() # pyright: ignore[reportPrivateUsage]
+        return tasks
+
+    def completed(self, name: str) -> None:
+        ready: list[str] = []
+
+        with self.__lock:
+            for dependent in self.__dependents.pop(name):
+                self.__remaining[dependent] -= 1
+                if self.__remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        # ready nodes are queued in the order of the plan, ie. critical path first
+        ready.sort(key = self.__positions.__getitem__)
+        for dependent in ready:
+            self.__tasks[dependent]._release() # pyright: ignore[reportPrivateUsage]
+
+
+class GraphTask(Task[Any]):
+    """A task of a TaskGraph node, which reports its completion directly to the graph run.
+    """
+    __slots__ = [ "__run", "__node" ]
+
+    def __init__(self, run: GraphRun, node: str, fn: Callable[[Task[Any]], Any], interrupt: Interrupt | None, priority: int):
+        super().__init__(fn, node, interrupt, False, priority)
+        self.__run: GraphRun | None = run
+        self.__node = node
+
+    def _on_completed(self) -> None:
+        if ( run := self.__run ) is not None:
+            self.__run = None
+            run.completed(self.__node)
+
+
+def run_node(task: Task[Any], fn: Callable[..., Any], dependencies: tuple[Task[Any], ...], args: tuple[Any, ...]) -> Any:
+    # reading the result of a failed dependency raises its exception, which fails this node as well
+    return fn(task, *( dependency.result for dependency in dependencies ), *args)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from typing import Callable, Concatenate, ParamSpec, TypeVar, Any
+from types import TracebackType
+
+from runtime.threading.core.event import Event
+from runtime.threading.core.lock import Lock
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.interrupt_signal import InterruptSignal
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_target import TaskTarget
+from runtime.threading.core.tasks.task_exception import TaskException
+from runtime.threading.core.tasks.aggregate_exception import AggregateException
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
+from runtime.threading.core.parallel.pipeline.p_context import PContext
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+TaskGroupClosedError = TaskException("Task group has been closed")
+
+class TaskGroup:
+    """The TaskGroup class is a context manager used for structured concurrency. Tasks spawned by the group share
+    a single interrupt, and the first task to fail interrupts its siblings. On exit, the group waits for all of its tasks
+    to complete, and raises an AggregateException if any of them failed.
+    """
+    __slots__ = [ "__lock", "__name", "__scheduler", "__priority", "__signal", "__interrupt", "__pending", "__joined", "__exceptions", "__closed" ]
+
+    def __init__(
+        self,
+        name: str | None = None,
+        interrupt: Interrupt | None = None,
+        scheduler: TaskScheduler | None = None,
+        priority: int = 0
+    ):
+        """Creates a new TaskGroup.
+
+        Args:
+            name (str | None, optional): The name of the tasks spawned by the group. Defaults to None.
+            interrupt (Interrupt | None, optional): An external interrupt linked to the interrupt of the group. Defaults to None.
+            scheduler (TaskScheduler | None, optional): The scheduler onto which tasks are scheduled. Defaults to None (the current scheduler).
+            priority (int, optional): The priority of the tasks spawned by the group. Defaults to 0.
+        """
+        self.__lock = Lock()
+        self.__name = name
+        self.__scheduler = scheduler
+        self.__priority = priority
+        self.__signal = InterruptSignal(interrupt) if interrupt else InterruptSignal()
+        self.__interrupt = interrupt
+        self.__pending = 0 # no. of spawned tasks not yet completed
+        self.__joined = Event(purpose = "TASK_GROUP_JOIN")
+        self.__joined.signal()
+        self.__exceptions: list[Exception] = []
+        self.__closed = False
+
+    @property
+    def interrupt(self) -> Interrupt:
+        """The interrupt shared by the tasks of the group.
+        """
+        return self.__signal.interrupt
+
+    @property
+    def pending(self) -> int:
+        """The no. of tasks spawned by the group, which have not yet completed.
+        """
+        return self.__pending
+
+    @property
+    def exceptions(self) -> tuple[Exception, ...]:
+        """The exceptions of the failed tasks of the group.
+        """
+        return tuple(self.__exceptions)
+
+    @property
+    def is_closed(self) -> bool:
+        """Indicates if the group has been closed (ie. exited), after which no more tasks can be spawned.
+        """
+        return self.__closed
+
+    def run(
+        self,
+        fn: Callable[Concatenate[Task[T], P], T], /,
+        *args: P.args,
+        **kwargs: P.kwargs
+    ) -> Task[T]:
+        """Spawns a new task in the group.
+
+        Args:
+            fn (Callable[Concatenate[Task[T], P], T]): The target function.
+
+        Raises:
+            TaskGroupClosedError: Raised if the group has been closed.
+
+        Returns:
+            Task[T]: Returns the new task.
+        """
+        scheduler = self.__scheduler
+
+        if scheduler is None:
+            if ( pc := PContext.current() ) and pc is not PContext.root():
+                scheduler = pc.scheduler
+
+        task = GroupTask[T](self, TaskTarget(fn, args, kwargs), self.__name, self.__signal.interrupt, self.__priority)
+
+        with self.__lock:
+            if self.__closed:
+                raise TaskGroupClosedError
+
+            self.__pending += 1
+            if self.__pending == 1:
+                self.__joined.clear()
+
+        try:
+            task.schedule(scheduler or TaskScheduler.current())
+        except Exception:
+            self._completed(None) # the task was never queued, so it'll never complete
+            raise
+
+        return task
+
+    def cancel(self) -> None:
+        """Interrupts all tasks of the group.
+        """
+        self.__signal.signal()
+
+    def wait(
+        self,
+        timeout: float | None = None, /,
+        interrupt: Interrupt | None = None
+    ) -> bool:
+        """Waits for all tasks spawned by the group to complete.
+
+        Args:
+            timeout (float | None, optional): Timeout (seconds) before returning False. Defaults to None.
+            interrupt (Interrupt | None, optional): An Interrupt for this specific call. Defaults to None.
+
+        Returns:
+            bool: Returns True if all tasks completed. Otherwise False.
+        """
+        return self.__joined.wait(timeout, interrupt)
+
+    def _completed(self, task: Task[Any] | None) -> None:
+        """Registers a completed task of the group. For internal use.
+
+        Args:
+            task (Task[Any] | None): The completed task, or None if it was never queued.
+        """
+        with self.__lock:
+            if task is not None and task.is_failed and ( exception := task.exception ) is not None:
+                self.__exceptions.append(exception)
+                if len(self.__exceptions) == 1:
+                    self.__signal.signal() # the first failure interrupts the siblings
+
+            self.__pending -= 1
+            if self.__pending == 0:
+                self.__joined.signal()
+
+    def __enter__(self) -> TaskGroup:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None
+    ) -> None:
+        if exc_value is not None:
+            self.__signal.signal() # the body failed, so the tasks are interrupted
+
+        with self.__lock:
+            self.__closed = True
+
+        self.__joined.wait()
+
+        if exc_value is None:
+            if self.__exceptions:
+                raise AggregateException(self.__exceptions)
+            elif self.__interrupt is not None:
+                self.__interrupt.raise_if_signaled()
+
+
+class GroupTask(Task[T]):
+    """A task spawned by a TaskGroup, which reports its completion directly to the group.
+    """
+    __slots__ = [ "__group" ]
+
+    def __init__(
+        self,
+        group: TaskGroup,
+        fn: Callable[[Task[T]], T],
+        name: str | None,
+        interrupt: Interrupt,
+        priority: int
+    ):
+        super().__init__(fn, name, interrupt, False, priority)
+        self.__group: TaskGroup | None = group
+
+    def _on_completed(self) -> None:
+        if ( group := self.__group ) is not None:
+            self.__group = None
+            group._completed(self) # pyright: ignore[reportPrivateUsage]
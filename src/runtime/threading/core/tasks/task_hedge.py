@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Callable, TypeVar, Generic, Any, cast
+from functools import partial
+
+from runtime.threading.core.event import Event
+from runtime.threading.core.lock import Lock
+from runtime.threading.core.interrupt import Interrupt
+from runtime.threading.core.interrupt_signal import InterruptSignal
+from runtime.threading.core.interrupt_exception import InterruptException
+from runtime.threading.core.continue_when import ContinueWhen
+from runtime.threading.core.callback_continuation import CallbackContinuation
+from runtime.threading.core.timer_wheel import TimerWheel, Timer
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.tasks.task_target import TaskTarget
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
+
+T = TypeVar("T")
+
+class HedgeRun(Generic[T]):
+    """Tracks the attempts of a single hedged task. A new attempt is launched each time the delay elapses without
+    any attempt having completed, and the first attempt to complete successfully decides the result.
+    Attempts are not retried - if every attempt launched fails, the hedged task fails with the exception of the last one.
+    """
+    __slots__ = [
+        "__lock", "__name", "__scheduler", "__priority", "__target", "__after", "__max_copies",
+        "__signal", "__task", "__timer", "__attempts", "__pending", "__decided"
+    ]
+
+    def __init__(
+        self,
+        name: str | None,
+        interrupt: Interrupt | None,
+        scheduler: TaskScheduler,
+        priority: int,
+        fn: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        after: float,
+        max_copies: int
+    ):
+        self.__lock = Lock()
+        self.__name = name
+        self.__scheduler = scheduler
+        self.__priority = priority
+        self.__target = TaskTarget(fn, args, kwargs)
+        self.__after = after
+        self.__max_copies = max_copies
+        self.__signal = InterruptSignal(interrupt) if interrupt else InterruptSignal() # interrupts the attempts
+        # the task is never run - it's completed directly by the attempt deciding it
+        self.__task = Task[T](TaskTarget(self.__result, (), {}), name, interrupt, False, priority)
+        self.__timer: Timer | None = None
+        self.__attempts: list[Task[T]] = []
+        self.__pending = 0
+        self.__decided: Task[T] | None = None
+
+        self.__task._hold(scheduler) # pyright: ignore[reportPrivateUsage]
+
+    def start(self) -> Task[T]:
+        self.__launch()
+        return self.__task
+
+    def __launch(self) -> None:
+        with self.__lock:
+            if self.__decided is not None or len(self.__attempts) >= self.__max_copies:
+                return
+
+            attempt = Task[T](self.__target, self.__name, self.__signal.interrupt, False, self.__priority)
+            attempt._hold(self.__scheduler) # pyright: ignore[reportPrivateUsage]
+            self.__attempts.append(attempt)
+            self.__pending += 1
+
+            event = attempt.wait_event
+            Event._add_continuation( # pyright: ignore[reportPrivateUsage]
+                (event,),
+                CallbackContinuation(ContinueWhen.ALL, (event,), partial(self.__completed, attempt))
+            )
+
+            if len(self.__attempts) < self.__max_copies:
+                self.__timer = TimerWheel.default().schedule(self.__after, self.__launch)
+
+        attempt._release() # pyright: ignore[reportPrivateUsage]
+
+    def __completed(self, attempt: Task[T]) -> None:
+        with self.__lock:
+            self.__pending -= 1
+
+            if self.__decided is not None:
+                return
+            elif attempt.is_completed_successfully or self.__pending == 0:
+                self.__decided = attempt
+                if self.__timer is not None:
+                    self.__timer.cancel()
+            else:
+                return
+
+        # the task is completed on this thread, rather than queued behind the backlog of the scheduler
+        try:
+            self.__task.interrupt.raise_if_signaled()
+
+            if attempt.is_completed_successfully:
+                self.__task._resolve(attempt.result) # pyright: ignore[reportPrivateUsage]
+            else:
+                self.__task._reject(cast(Exception, attempt.exception)) # pyright: ignore[reportPrivateUsage]
+        except InterruptException as ex:
+            self.__task._reject(ex) # pyright: ignore[reportPrivateUsage]
+
+        self.__signal.signal() # interrupts the remaining attempts
+
+    def __result(self, task: Task[T]) -> T: # pragma: no cover
+        task.interrupt.raise_if_signaled()
+        return cast(Task[T], self.__decided).result
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Callable, Iterable, TypeVar, Any
+from types import TracebackType
+from weakref import finalize
+
+from runtime.threading.core.interrupt_signal import InterruptSignal
+from runtime.threading.core.tasks.task import Task
+from runtime.threading.core.parallel.producer_consumer_queue import ProducerConsumerQueue
+from runtime.threading.core.parallel.producer_consumer_queue_iterator import ProducerConsumerQueueIterator
+
+T = TypeVar("T")
+
+class TaskStream(ProducerConsumerQueueIterator[T]):
+    """The TaskStream class exposes the output of a streaming task (ie. a task whose target function is a generator) as a PIterable,
+    backed by a bounded ProducerConsumerQueue, so that items can be consumed while the task is still producing.
+    If the task fails, the queue is failed as well, and the exception is raised to the consumer.
+    A stream which is closed, exited as a context manager or garbage collected, interrupts the producing task.
+    """
+    __slots__ = [ "__task", "__signal", "__finalizer" ]
+
+    def __init__(self, queue: ProducerConsumerQueue[T], task: Task[None], signal: InterruptSignal):
+        """Creates a new TaskStream. Should not be called directly - use Task.stream() instead...
+
+        Args:
+            queue (ProducerConsumerQueue[T]): The queue into which the task produces items.
+            task (Task[None]): The producing task.
+            signal (InterruptSignal): The signal used for interrupting the producing task.
+        """
+        super().__init__(queue)
+        self.__task = task
+        self.__signal = signal
+        # an abandoned stream interrupts the producer, which would otherwise be blocked on the full queue forever
+        self.__finalizer = finalize(self, signal.signal)
+
+    @property
+    def task(self) -> Task[None]:
+        """The producing task.
+        """
+        return self.__task
+
+    def close(self) -> None:
+        """Interrupts the producing task, which is otherwise blocked when the queue is full and the consumer stops consuming.
+        """
+        self.__finalizer()
+
+    def __enter__(self) -> TaskStream[T]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def stream_target(task: Task[None], queue: ProducerConsumerQueue[T], fn: Callable[..., Iterable[T]], args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    try:
+        for item in fn(task, *args, **kwargs):
+            queue.put(item, interrupt = task.interrupt)
+    except Exception as ex:
+        queue.fail_if_not_complete(ex)
+        raise
+    else:
+        queue.complete()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Callable, Any, TYPE_CHECKING
+
+if TYPE_CHECKING: # pragma: no cover
+    from runtime.threading.core.tasks.task import Task
+
+T = TypeVar("T")
+
+class TaskTarget(Generic[T]):
+    """The TaskTarget class binds a target function to its arguments. Unlike a closure, it can be pickled
+    (as long as the function and arguments can), which allows a task target to be run in another process.
+    """
+    __slots__ = [ "__fn", "__args", "__kwargs" ]
+
+    def __init__(self, fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]):
+        self.__fn = fn
+        self.__args = args
+        self.__kwargs = kwargs
+
+    @property
+    def fn(self) -> Callable[..., T]:
+        """The target function.
+        """
+        return self.__fn
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        """The positional target arguments.
+        """
+        return self.__args
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        """The keyword target arguments.
+        """
+        return self.__kwargs
+
+    def __call__(self, task: Task[T]) -> T:
+        return self.__fn(task, *self.__args, **self.__kwargs)
+
+    def __getstate__(self) -> tuple[Callable[..., T], tuple[Any, ...], dict[str, Any]]:
+        return self.__fn, self.__args, self.__kwargs
+
+    def __setstate__(self, state: tuple[Callable[..., T], tuple[Any, ...], dict[str, Any]]) -> None:
+        self.__fn, self.__args, self.__kwargs = state
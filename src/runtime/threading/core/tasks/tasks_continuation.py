@@ -10,6 +10,7 @@ from runtime.threading.core.interrupt_exception import InterruptException
 if TYPE_CHECKING: # pragma: no cover
     from runtime.threading.core.tasks.task import Task
     from runtime.threading.core.interrupt import Interrupt
+    from runtime.threading.core.event import Event
 
 class TasksContinuation(Continuation):
     __slots__ = [ "__what", "__then", "__options", "__states", "__done" ]
@@ -36,14 +37,14 @@ class TasksContinuation(Continuation):
             self.__states |= set([TaskState.COMPLETED])
 
 
-    def try_continue(self) -> bool:
+    def try_continue(self, event: Event | None = None) -> bool:
         with super().synchronization_lock:
             from runtime.threading.core.tasks.task import CompletedTask
 
             try:
                 if self.__done:
                     return True
-                elif not Continuation.try_continue(self):
+                elif not Continuation.try_continue(self, event):
                     return False
                 else:
                     missing = [ task for task in self.__what if not task.is_completed ]
@@ -0,0 +1,243 @@
+from __future__ import annotations
+from typing import Callable, ClassVar
+from threading import Thread, Condition, Lock as TLock
+from time import perf_counter
+from math import ceil, floor
+
+from runtime.threading.core.defaults import TIMER_RESOLUTION, TASK_KEEP_ALIVE
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS # no. of slots per level
+LEVELS = 6 # with a resolution of 1ms, the levels cover a span of more than 2000 years
+MASK = SLOTS - 1
+SPAN = 1 << ( SLOT_BITS * LEVELS ) # no. of ticks covered by all levels
+
+LOCK = TLock()
+
+class Timer:
+    """The Timer class represents a callback scheduled on a TimerWheel.
+    """
+    __slots__ = [ "__wheel", "__due", "__callback", "__slot" ]
+
+    def __init__(self, wheel: TimerWheel, due: float, callback: Callable[[], None]):
+        self.__wheel = wheel
+        self.__due = due
+        self.__callback = callback
+        self.__slot: dict[Timer, int] | None = None
+
+    @property
+    def due(self) -> float:
+        """The time (as returned by time.perf_counter()) at which the timer expires.
+        """
+        return self.__due
+
+    @property
+    def is_pending(self) -> bool:
+        """Indicates if the timer is still pending, ie. it has neither expired nor been cancelled.
+        """
+        return self.__slot is not None
+
+    def cancel(self) -> bool:
+        """Cancels the timer.
+
+        Returns:
+            bool: Returns True if the timer was cancelled, False if it has already expired or been cancelled.
+        """
+        return self.__wheel._cancel(self) # pyright: ignore[reportPrivateUsage]
+
+    def _place(self, slot: dict[Timer, int] | None) -> None:
+        self.__slot = slot
+
+    def _remove(self) -> bool:
+        if ( slot := self.__slot ) is None:
+            return False
+
+        del slot[self]
+        self.__slot = None
+        return True
+
+    def _expire(self) -> Callable[[], None]:
+        self.__slot = None
+        callback = self.__callback
+        del self.__callback
+        return callback
+
+    def __repr__(self) -> str:
+        return f"Timer due {self.__due:.3f} {'PENDING' if self.is_pending else 'DONE'}"
+
+
+class TimerWheel:
+    """The TimerWheel class is a hierarchical timing wheel, which holds timers and invokes their
+    callbacks upon expiry, from a single service thread. Pending timers therefore only cost memory,
+    and scheduling or cancelling a timer is O(1) regardless of the no. of pending timers.
+    Callbacks are invoked on the service thread, and should therefore be short and non-blocking.
+    """
+    __slots__ = [ "__resolution", "__lock", "__levels", "__epoch", "__tick", "__wake", "__count", "__thread" ]
+    __default__: ClassVar[TimerWheel | None] = None
+
+    def __init__(self, resolution: float = TIMER_RESOLUTION):
+        """Creates a new TimerWheel instance.
+
+        Args:
+            resolution (float, optional): The duration (seconds) of a tick, ie. the precision of the timers. Defaults to 0.001.
+        """
+        if resolution <= 0:
+            raise ValueError("Argument resolution must be greater than 0")
+
+        self.__resolution = resolution
+        self.__lock = Condition()
+        self.__levels: list[list[dict[Timer, int]]] = [ [ {} for _ in range(SLOTS) ] for _ in range(LEVELS) ]
+        self.__epoch = perf_counter()
+        self.__tick = 0 # the last tick processed
+        self.__wake: int | None = None # the tick at which the service thread wakes up (if sleeping)
+        self.__count = 0
+        self.__thread: Thread | None = None
+
+    @property
+    def resolution(self) -> float:
+        """The duration (seconds) of a tick.
+        """
+        return self.__resolution
+
+    @property
+    def pending(self) -> int:
+        """The no. of pending timers.
+        """
+        return self.__count
+
+    @staticmethod
+    def default() -> TimerWheel:
+        """Returns the default timer wheel, used for delayed tasks and signals.
+        """
+        if ( wheel := TimerWheel.__default__ ) is None:
+            with LOCK:
+                if TimerWheel.__default__ is None:
+                    TimerWheel.__default__ = TimerWheel()
+                wheel = TimerWheel.__default__
+        return wheel
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """Schedules a callback to be invoked after specified time.
+
+        Args:
+            delay (float): The time (seconds) to wait before invoking the callback.
+            callback (Callable[[], None]): The callback function.
+
+        Returns:
+            Timer: Returns a new timer, which may be used to cancel the callback.
+        """
+        due = perf_counter() + max(delay, 0)
+        timer = Timer(self, due, callback)
+
+        with self.__lock:
+            if self.__count == 0:
+                self.__tick = max(self.__tick, self.__current_tick()) # the wheel is empty, so it's safe to skip ahead
+
+            tick = max(ceil(( due - self.__epoch ) / self.__resolution), self.__tick + 1)
+            self.__add(timer, tick)
+            self.__count += 1
+
+            if self.__thread is None:
+                self.__thread = Thread(target = self.__run, name = "TimerWheel-Thread", daemon = True)
+                self.__thread.start()
+            elif self.__wake is not None and tick < self.__wake:
+                self.__lock.notify()
+
+        return timer
+
+    def _cancel(self, timer: Timer) -> bool:
+        with self.__lock:
+            if timer._remove(): # pyright: ignore[reportPrivateUsage]
+                self.__count -= 1
+                return True
+            else:
+                return False
+
+    def __current_tick(self) -> int:
+        return floor(( perf_counter() - self.__epoch ) / self.__resolution)
+
+    def __add(self, timer: Timer, tick: int) -> None:
+        delta = tick - self.__tick
+        level = 0
+
+        while level < LEVELS - 1 and delta >= 1 << ( SLOT_BITS * ( level + 1 ) ):
+            level += 1
+
+        # timers beyond the span of the wheel are parked on the top level, and re-added when it's cascaded
+        position = tick if delta < SPAN else self.__tick + SPAN - 1
+        slot = self.__levels[level][( position >> ( SLOT_BITS * level ) ) & MASK]
+        slot[timer] = tick
+        timer._place(slot) # pyright: ignore[reportPrivateUsage]
+
+    def __next_tick(self) -> int | None:
+        # finds the first tick at which a slot holding timers is either expired (level 0) or cascaded (higher levels)
+        current = self.__tick
+        result: int | None = None
+
+        for level, slots in enumerate(self.__levels):
+            shift = SLOT_BITS * level
+            index = ( current >> shift ) & MASK
+
+            for offset in range(1, SLOTS + 1):
+                if slots[( index + offset ) & MASK]:
+                    next_shift = shift + SLOT_BITS
+                    tick = ( ( current >> next_shift ) << next_shift ) + ( ( ( index + offset ) & MASK ) << shift )
+                    if tick <= current:
+                        tick += 1 << next_shift
+                    if result is None or tick < result:
+                        result = tick
+                    break
+
+        return result
+
+    def __advance(self, tick: int) -> list[Callable[[], None]]:
+        self.__tick = tick
+
+        for level in range(LEVELS - 1, 0, -1):
+            shift = SLOT_BITS * level
+            if tick & ( ( 1 << shift ) - 1 ) == 0:
+                slot = self.__levels[level][( tick >> shift ) & MASK]
+                if slot:
+                    timers = tuple(slot.items())
+                    slot.clear()
+                    for timer, due in timers:
+                        self.__add(timer, due)
+
+        slot = self.__levels[0][tick & MASK]
+        expired = tuple(slot)
+        slot.clear()
+        self.__count -= len(expired)
+        return [ timer._expire() for timer in expired ] # pyright: ignore[reportPrivateUsage]
+
+    def __run(self) -> None:
+        while True:
+            callbacks: list[Callable[[], None]] = []
+
+            with self.__lock:
+                current = self.__current_tick()
+
+                while ( tick := self.__next_tick() ) is not None and tick <= current:
+                    callbacks.extend(self.__advance(tick))
+
+                if not callbacks:
+                    # no slots hold timers between the last processed tick and now, so it's safe to skip ahead
+                    self.__tick = max(self.__tick, current)
+
+                    if tick is None:
+                        self.__wake = current + ceil(TASK_KEEP_ALIVE / self.__resolution)
+                        self.__lock.wait(TASK_KEEP_ALIVE)
+                        self.__wake = None
+
+                        if self.__count == 0:
+                            self.__thread = None # reclaim thread, a new one is started when needed
+                            return
+                    else:
+                        self.__wake = tick
+                        self.__lock.wait(self.__epoch + tick * self.__resolution - perf_counter())
+                        self.__wake = None
+
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception: # pragma: no cover
+                    pass # a failing callback must not bring down the service thread
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from threading import Event as TEvent, local
+from typing import Sequence, TYPE_CHECKING
+
+from runtime.threading.core.continuation import Continuation
+from runtime.threading.core.continue_when import ContinueWhen
+from runtime.threading.core.interrupt_exception import InterruptException
+
+if TYPE_CHECKING: # pragma: no cover
+    from runtime.threading.core.event import Event
+    from runtime.threading.core.interrupt import Interrupt
+
+LOCAL = local()
+
+class Waiter(Continuation):
+    """The Waiter class is a reusable continuation owned by a single thread, which parks the thread while it's waiting
+    on one or more events. Unlike other continuations, a waiter is only removed from the events by its owner once
+    the wait is over (and never by the signaling thread), so that it can safely be reused for the next wait.
+    """
+    __slots__ = [ "__parker", "__completed", "__busy" ]
+
+    def __init__(self):
+        super().__init__(ContinueWhen.ANY, (), None)
+        self.__parker = TEvent()
+        self.__completed = False
+        self.__busy = False
+
+    @staticmethod
+    def acquire() -> Waiter:
+        """Returns the waiter of the current thread, or a new waiter if it's already in use (ie. a nested wait).
+        """
+        waiter: Waiter | None = getattr(LOCAL, "waiter", None)
+
+        if waiter is None:
+            waiter = LOCAL.waiter = Waiter()
+        elif waiter.__busy:
+            waiter = Waiter() # pragma: no cover
+
+        waiter.__busy = True
+        return waiter
+
+    def release(self) -> None:
+        """Returns the waiter to the current thread.
+        """
+        self.__busy = False
+
+    @property
+    def is_completed(self) -> bool:
+        """Indicates if the waiter has been woken (and not rearmed since).
+        """
+        return self.__completed
+
+    @property
+    def parker(self) -> TEvent:
+        """The builtin event, which the owner waits on.
+        """
+        return self.__parker
+
+    def wake(self) -> None:
+        """Wakes the owner without completing the wait, ie. when it's waiting for something else than events (such as a lock).
+        """
+        self.__parker.set()
+
+    def arm(self, when: ContinueWhen, events: Sequence[Event], interrupt: Interrupt | None) -> None:
+        """Prepares the waiter for awaiting the specified events.
+        """
+        with super().synchronization_lock:
+            self._reset(when, events, interrupt)
+            self.__completed = False
+            self.__parker.clear()
+
+    def disarm(self) -> bool:
+        """Ends the wait, after the waiter has been removed from the events.
+
+        Returns:
+            bool: Returns True if the wait was completed (ie. not timed out). Otherwise False.
+        """
+        with super().synchronization_lock:
+            return self.__completed
+
+    def try_continue(self, event: Event | None = None) -> bool:
+        with super().synchronization_lock:
+            try:
+                if not super().try_continue(event):
+                    return False
+            except InterruptException:
+                self.__completed = True
+                self.__parker.set()
+                raise
+
+            self.__completed = True
+            self.__parker.set()
+            return True
@@ -3,6 +3,11 @@ from runtime.threading.core.tasks.task import (
     Task, TaskCompletedError, TaskNotScheduledError,
     TaskAlreadyRunningError, TaskAlreadyScheduledError, AwaitedTaskInterruptedError,
 )
+from runtime.threading.core.tasks.task_batch import TaskBatch
+from runtime.threading.core.tasks.task_cache import TaskCache, task_cached
+from runtime.threading.core.tasks.task_graph import TaskGraph, TaskGraphNode
+from runtime.threading.core.tasks.task_stream import TaskStream
+from runtime.threading.core.tasks.task_group import TaskGroup, TaskGroupClosedError
 from runtime.threading.core.tasks.task_state import TaskState
 from runtime.threading.core.tasks.continuation_options import ContinuationOptions
 from runtime.threading.core.tasks.aggregate_exception import AggregateException
@@ -10,6 +15,14 @@ from runtime.threading.core.tasks.task_exception import TaskException
 
 __all__ = [
     'Task',
+    'TaskBatch',
+    'TaskCache',
+    'task_cached',
+    'TaskGraph',
+    'TaskGraphNode',
+    'TaskGroup',
+    'TaskStream',
+    'TaskGroupClosedError',
     'TaskState',
     'ContinuationOptions',
     'AggregateException',
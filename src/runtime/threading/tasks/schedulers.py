@@ -1,9 +1,25 @@
-from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, SchedulerClosedError, TaskAlreadyStartedOrScheduledError
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler, SchedulerClosedError, SchedulerQueueFullError, TaskAlreadyStartedOrScheduledError, TaskDroppedError
 from runtime.threading.core.tasks.schedulers.concurrent_task_scheduler import ConcurrentTaskScheduler
+from runtime.threading.core.tasks.schedulers.work_stealing_task_scheduler import WorkStealingTaskScheduler
+from runtime.threading.core.tasks.schedulers.priority_task_scheduler import PriorityTaskScheduler
+from runtime.threading.core.tasks.schedulers.process_task_scheduler import ProcessTaskScheduler
+from runtime.threading.core.tasks.schedulers.asyncio_task_scheduler import AsyncioTaskScheduler
+from runtime.threading.core.tasks.schedulers.scheduler_stats import SchedulerStats
+from runtime.threading.core.tasks.schedulers.histogram import Histogram
+from runtime.threading.core.tasks.schedulers.queue_policy import QueuePolicy
 
 __all__ = [
     'TaskScheduler',
     'ConcurrentTaskScheduler',
+    'WorkStealingTaskScheduler',
+    'PriorityTaskScheduler',
+    'ProcessTaskScheduler',
+    'AsyncioTaskScheduler',
+    'SchedulerStats',
+    'Histogram',
+    'QueuePolicy',
     'SchedulerClosedError',
+    'SchedulerQueueFullError',
     'TaskAlreadyStartedOrScheduledError',
+    'TaskDroppedError',
 ]
\ No newline at end of file
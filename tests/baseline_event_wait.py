@@ -0,0 +1,63 @@
+# pyright: basic
+# ruff: noqa
+from datetime import datetime
+from threading import Thread, Event as TEvent
+from tracemalloc import start, stop, get_traced_memory, reset_peak
+
+from runtime.threading import Event, InterruptSignal
+
+def measure(fn, iterations: int) -> tuple[float, int]:
+    fn() # warm up, so that only steady state allocations are counted
+
+    start()
+    current, _ = get_traced_memory()
+    reset_peak()
+    fn()
+    allocated = get_traced_memory()[1] - current # peak memory allocated during the wait
+    stop()
+
+    ts = datetime.now()
+    for _ in range(iterations):
+        fn()
+    return (datetime.now()-ts).total_seconds() / iterations * 1e6, allocated
+
+def baseline_event_wait(counts: tuple[int, ...], iterations: int):
+    interrupt = InterruptSignal().interrupt
+
+    for count in counts:
+        events = [ Event() for _ in range(count) ]
+        for event in events:
+            event.signal()
+
+        us, allocated = measure(lambda: Event.wait_any(events, None, interrupt), iterations)
+        print("Events=%d Signaled : wait_any %.2fus (%d bytes allocated)" % (count, us, allocated))
+
+        us, allocated = measure(lambda: Event.wait_all(events, None, interrupt), iterations)
+        print("Events=%d Signaled : wait_all %.2fus (%d bytes allocated)" % (count, us, allocated))
+
+        # the last event is signaled by another thread, while waiting
+        def wait_blocking():
+            events[-1].clear()
+            thread = Thread(target = events[-1].signal)
+            thread.start()
+            Event.wait_all(events, None, interrupt)
+            thread.join()
+
+        ts = datetime.now()
+        for _ in range(iterations // 10):
+            wait_blocking()
+        print("Events=%d Pending : wait_all %.2fus" % (count, (datetime.now()-ts).total_seconds() / (iterations // 10) * 1e6))
+
+    event = Event()
+    event.signal()
+    us, allocated = measure(lambda: event.wait(None, interrupt), iterations)
+    print("Events=1 Signaled : wait with interrupt %.2fus (%d bytes allocated)" % (us, allocated))
+
+    # signaling an event nobody waits on, compared to the builtin event
+    event = Event()
+    us, _ = measure(event.signal, iterations * 10)
+    builtin_us, _ = measure(TEvent().set, iterations * 10)
+    print("Events=1 Not awaited : signal %.2fus (builtin %.2fus)" % (us, builtin_us))
+
+if __name__ == "__main__":
+    baseline_event_wait((1, 2, 64), 10000)
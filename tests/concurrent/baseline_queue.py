@@ -1,20 +1,21 @@
-from typing import Iterable, Any
+from typing import Iterable, Sequence, Any, cast
 from datetime import datetime
+import sys
 from queue import Queue as OrgQueue, Empty as QueueEmptyException
 
 from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
 from runtime.threading.tasks import Task, ContinuationOptions
-from runtime.threading import InterruptSignal, Interrupt
+from runtime.threading import InterruptSignal, Interrupt, InterruptException
 from runtime.threading.concurrent import Queue
 
-def baseline_queue():
+def baseline_queue(parallelism: Sequence[int] = (2,4,8)):
     count = 10000
 
-    for parallelism_in in [2,4,8]:
+    for parallelism_in in parallelism:
         with ConcurrentTaskScheduler(parallelism_in) as scheduler_in:
             facit = sorted([ i for i in range(count) ] * parallelism_in)
 
-            for parallelism_out in [2,4,8]:
+            for parallelism_out in parallelism:
                 print("Queue comparison @ in: %d out: %d" % (parallelism_in, parallelism_out))
 
                 ### runtime.threading.tasks.concurrent.queue ###
@@ -47,6 +48,35 @@ def baseline_queue():
                     assert facit == result1
                     print("New Queue: %s" % t1)
 
+                    ### runtime.threading.tasks.concurrent.queue (blocking consumers, woken by the notify event) ###
+
+                    queue3 = Queue[int]()
+                    cts3 = InterruptSignal()
+                    ts = datetime.now()
+
+                    tasks3 = [ Task.create(scheduler=scheduler_out).run(fn_concurrent_queue_blocking, queue3, cts3.interrupt) for _ in range(parallelism_out) ]
+
+                    def put3(task: Task[Any]):
+                        for i in range(count):
+                            queue3.enqueue(i)
+
+                    def put3done(task: Task[Any], tasks: Iterable[Task[Any]]):
+                        cts3.signal()
+
+                    Task.with_all([
+                        Task.create(scheduler=scheduler_in).run(put3) for _ in range(parallelism_in)
+                    ], options=ContinuationOptions.DEFAULT).run(put3done)
+                    Task.wait_all(tasks3)
+
+                    t3 = datetime.now()-ts
+                    result3: list[int] = []
+                    for task in tasks3:
+                        result3 += task.result
+
+                    result3 = sorted(result3)
+                    assert facit == result3
+                    print("New Queue (blocking): %s" % t3)
+
                     ### builtin python queue ###
 
                     queue2: 'OrgQueue[int]' = OrgQueue()
@@ -93,6 +123,18 @@ def fn_concurrent_queue(task: Task[list[int]], queue: Queue[int], interrupt: Int
             break
     return results
 
+def fn_concurrent_queue_blocking(task: Task[list[int]], queue: Queue[int], interrupt: Interrupt) -> list[int]:
+    results: list[int] = []
+    while True:
+        try:
+            results.append(queue.dequeue(None, interrupt))
+        except InterruptException:
+            # drain the items enqueued before the interrupt
+            while ( item := queue.try_dequeue(0) )[1]:
+                results.append(cast(int, item[0]))
+            break
+    return results
+
 def fn_org_queue(task: Task[list[int]], queue: 'OrgQueue[int]', interrupt: Interrupt) -> list[int]:
     results: list[int] = []
     while True:
@@ -106,4 +148,4 @@ def fn_org_queue(task: Task[list[int]], queue: 'OrgQueue[int]', interrupt: Inter
     return results
 
 if __name__ == "__main__":
-    baseline_queue()
\ No newline at end of file
+    baseline_queue([ int(arg) for arg in sys.argv[1:] ] or (2,4,8))
\ No newline at end of file
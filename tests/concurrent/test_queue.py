@@ -1,10 +1,11 @@
 # pyright: basic
+from pytest import raises as assert_raises
 from typing import Iterable, Any, cast
 
 from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
 from runtime.threading.tasks import Task, ContinuationOptions
-from runtime.threading import InterruptSignal, Interrupt
-from runtime.threading.concurrent import Queue
+from runtime.threading import InterruptSignal, Interrupt, sleep
+from runtime.threading.concurrent import Queue, PriorityQueue
 
 def test_basics(internals):
     queue = Queue[int]()
@@ -87,3 +88,63 @@ def fn_concurrent_queue(task: Task[list[int]], queue: Queue[int], interrupt: Int
         elif interrupt.is_signaled:
             break
     return results
+
+
+def test_remove(internals):
+    queue = Queue[int].from_items(range(5))
+
+    assert queue.remove(0)
+    assert queue.remove(2)
+    assert queue.remove(4)
+    assert not queue.remove(4)
+
+    assert list(queue) == [1, 3]
+
+
+def test_try_remove_oldest(internals):
+    queue = Queue[int].from_items(range(5))
+
+    assert queue.try_remove_oldest(lambda item: item % 2 == 1) == (1, True)
+    assert queue.try_remove_oldest(lambda item: item > 3) == (4, True)
+    assert queue.try_remove_oldest(lambda item: item > 4) == (None, False)
+    queue.enqueue(5)
+
+    assert list(queue) == [0, 2, 3, 5]
+
+    priority_queue = PriorityQueue[tuple[int, str]].from_items([ (0, "a"), (2, "b"), (1, "c") ], lambda item: item[0])
+
+    assert priority_queue.try_remove_oldest(lambda item: item[0] > 0) == ((2, "b"), True)
+    assert priority_queue.try_remove_oldest(lambda item: item[0] > 1) == (None, False)
+
+    assert [ value for _, value in priority_queue ] == [ "c", "a" ]
+
+
+def test_priority_queue(internals):
+    queue = PriorityQueue[tuple[int, str]](lambda item: item[0])
+
+    for item in [ (0, "a"), (2, "b"), (1, "c"), (2, "d"), (0, "e") ]:
+        queue.enqueue(item)
+
+    queue.requeue((-1, "f"))
+
+    assert queue.remove((1, "c"))
+    assert not queue.remove((1, "c"))
+
+    assert [ value for _, value in queue ] == [ "f", "b", "d", "a", "e" ]
+
+    with assert_raises(TimeoutError):
+        queue.dequeue(0.01)
+
+    with assert_raises(ValueError):
+        PriorityQueue[int](aging = 0)
+
+
+def test_priority_queue_aging(internals):
+    queue = PriorityQueue[tuple[int, str]](lambda item: item[0], aging = 0.01)
+
+    queue.enqueue((0, "old"))
+    sleep(0.05) # the old item has gained ~5 priority levels
+    queue.enqueue((2, "new"))
+    queue.enqueue((10, "urgent"))
+
+    assert [ value for _, value in queue ] == [ "urgent", "old", "new" ]
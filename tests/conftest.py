@@ -13,7 +13,7 @@ from runtime.threading.core.defaults import TASK_KEEP_ALIVE
 from runtime.threading.core.tasks.helpers import get_function_name
 from runtime.threading.core.tasks.schedulers.concurrent_task_scheduler import ConcurrentTaskScheduler
 from runtime.threading.core.testing.debug import enable_debugging, EventsDebugger, LocksDebugger
-from runtime.threading.core.tasks.schedulers.task_scheduler import LOCK as TASK_LOCK, THREADS, TaskScheduler
+from runtime.threading.core.tasks.schedulers.task_scheduler import TaskScheduler
 
 EVENTS_DEBUGGER: EventsDebugger | None = None
 LOCKS_DEBUGGER: LocksDebugger | None = None
@@ -158,20 +158,19 @@ def report_continuations():
 
 
 def report_tasks():
-    with TASK_LOCK:
-        schedulers = {
-            scheduler: (thread, task)
-            for thread, (scheduler, task) in THREADS.items()
-            if not task or not task.is_completed
-        }
-        if schedulers:
-            print("\n-- TASKS:")
-            for scheduler, (thread, task) in schedulers.items():
-                print(f"{TAB}SCHEDULER {id(scheduler)} :")
-                if task:
-                    print(f"{TAB}{thread.name} ->")
-                    print(f"{TAB}{TAB}{task.id} : {task.state.name}")
-                else:
-                    print(f"{TAB}{thread.name} -> No task")
-        else:
-            print("\n-- TASKS: NONE")
+    schedulers = {
+        scheduler: (thread, task)
+        for thread, (scheduler, task) in TaskScheduler.registrations().items()
+        if not task or not task.is_completed
+    }
+    if schedulers:
+        print("\n-- TASKS:")
+        for scheduler, (thread, task) in schedulers.items():
+            print(f"{TAB}SCHEDULER {id(scheduler)} :")
+            if task:
+                print(f"{TAB}{thread.name} ->")
+                print(f"{TAB}{TAB}{task.id} : {task.state.name}")
+            else:
+                print(f"{TAB}{thread.name} -> No task")
+    else:
+        print("\n-- TASKS: NONE")
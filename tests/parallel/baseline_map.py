@@ -0,0 +1,33 @@
+# pyright: basic
+# ruff: noqa
+from typing import Iterable
+from datetime import datetime
+from multiprocessing import cpu_count
+
+from runtime.threading import parallel
+from runtime.threading.tasks import Task
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+from runtime.threading.core.defaults import GIL_ENABLED, DEFAULT_PARALLELISM
+
+def fn_cpu_bound(task: Task[Iterable[int]], item: int, n: int) -> Iterable[int]:
+    result = 0
+    for i in range(n):
+        result += (i * item) % 7
+    yield result
+
+def baseline_map(parallelism: tuple[int, ...], count: int, n: int):
+    print(f"GIL enabled: {GIL_ENABLED}, CPUs: {cpu_count()}, default parallelism: {DEFAULT_PARALLELISM}")
+
+    t_single = 0.0
+    for p in parallelism:
+        with ConcurrentTaskScheduler(p) as scheduler:
+            ts = datetime.now()
+            result = list(parallel.map(range(count), parallelism=p, scheduler=scheduler).do(fn_cpu_bound, n = n))
+            t = (datetime.now()-ts).total_seconds()
+
+        assert len(result) == count
+        t_single = t_single or t * p # the estimated time using a single thread
+        print(f"Parallelism={p} : {t:.3f}s speedup={t_single / t:.2f} (linear={p})")
+
+if __name__ == "__main__":
+    baseline_map(tuple( p for p in (1, 2, 4, 8, 16, 32) if p <= max(1, cpu_count()) ), 256, 20000)
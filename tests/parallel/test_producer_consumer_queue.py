@@ -10,7 +10,7 @@ from runtime.threading.parallel import ProducerConsumerQueue, ParallelException
 from runtime.threading.core.parallel.producer_consumer_queue import QueueCompletedError, QueueLinkedToAnotherQueueError
 from runtime.threading.tasks import Task
 from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
-from runtime.threading import InterruptSignal
+from runtime.threading import InterruptSignal, InterruptException
 
 def test_basics(internals):
     o = 100
@@ -118,6 +118,42 @@ def test_take(internals):
 
     assert o == len(items)
 
+def test_bounded(internals):
+    with assert_raises(ValueError):
+        ProducerConsumerQueue[int](max_size = 0)
+
+    pcq = ProducerConsumerQueue[int](max_size = 2)
+    assert pcq.max_size == 2
+    pcq.put(0) # falsy items must not be lost
+    pcq.put(1)
+
+    sig = InterruptSignal()
+    t = Thread(target=lambda: pcq.put(2, interrupt = sig.interrupt))
+    t.start()
+    t.join(0.1)
+    assert t.is_alive() # blocked until an item is taken
+
+    assert pcq.take() == 0
+    t.join(1)
+    assert not t.is_alive()
+
+    sig.signal()
+    with assert_raises(InterruptException):
+        pcq.put(3, interrupt = sig.interrupt)
+
+    pcq.complete()
+    assert list(pcq.get_iterator()) == [ 1, 2 ]
+
+    with assert_raises(ParallelException, match = escape(str(QueueCompletedError))):
+        pcq.put(4)
+
+    pcq = ProducerConsumerQueue[int](max_size = 1)
+    pcq.put(0)
+    t = Thread(target=add_many, args=(pcq, [ i for i in range(1, 100) ]))
+    t.start()
+    assert list(pcq.get_iterator()) == list(range(100))
+    t.join()
+
 def test_multiple_iterators(internals):
     o = 100
     p = 5
@@ -111,3 +111,11 @@ def fn_wait_until_scheduled_and_return_result(task: Task[float], other_task: Tas
         task.interrupt.wait_event.wait(0.1)
     return other_task.result # this will unqueue task t and run it synchronously
 
+
+def fn_return_pid(task: Task[int]) -> int:
+    from os import getpid
+    return getpid()
+
+def fn_wait_for_interrupt(task: Task[Any], t_timeout: float) -> None:
+    task.interrupt.wait(t_timeout)
+    task.interrupt.raise_if_signaled()
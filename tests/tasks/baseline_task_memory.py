@@ -0,0 +1,40 @@
+# pyright: basic
+# ruff: noqa
+from typing import Any
+from datetime import datetime
+import tracemalloc
+
+from runtime.threading.tasks import Task
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+
+def fn_tiny(task: Task[int], value: int) -> int:
+    return value
+
+def measure(fn_create: Any, count: int) -> tuple[float, float]:
+    tracemalloc.start()
+    ts = datetime.now()
+    tasks = fn_create(count)
+    t = (datetime.now()-ts).total_seconds()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return size / count, count / t
+
+def baseline_task_memory(counts: tuple[int, ...]):
+    with ConcurrentTaskScheduler(4, min_threads = 4) as scheduler:
+        def fn_plan(count: int) -> list[Task[int]]:
+            return [ Task.plan(fn_tiny, i) for i in range(count) ]
+
+        def fn_run(count: int) -> list[Task[int]]:
+            tasks = [ Task.create(scheduler = scheduler).run(fn_tiny, i) for i in range(count) ]
+            for task in tasks:
+                task.wait()
+            return tasks
+
+        for count in counts:
+            for mode, fn_create in [ ("Planned", fn_plan), ("Completed", fn_run) ]:
+                size, rate = measure(fn_create, count)
+                print("Tasks=%d %s : %.0f bytes/task, %.0f tasks/s (traced)" % (count, mode, size, rate))
+
+if __name__ == "__main__":
+    baseline_task_memory((1000, 10000, 100000))
@@ -0,0 +1,38 @@
+# pyright: basic
+# ruff: noqa
+from typing import Any
+from datetime import datetime
+
+from runtime.threading.tasks import Task
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+
+def fn_tiny(task: Task[int], value: int) -> int:
+    return value
+
+def run_tasks(scheduler: ConcurrentTaskScheduler, count: int) -> float:
+    ts = datetime.now()
+    tasks = [ Task.create(scheduler = scheduler).run(fn_tiny, i) for i in range(count) ]
+    for task in tasks:
+        task.wait()
+    return (datetime.now()-ts).total_seconds()
+
+def run_batch(scheduler: ConcurrentTaskScheduler, count: int) -> float:
+    ts = datetime.now()
+    for task in Task.run_many(fn_tiny, ( (i,) for i in range(count) ), scheduler = scheduler):
+        task.wait()
+    return (datetime.now()-ts).total_seconds()
+
+def baseline_task_scheduler(parallelism: tuple[int, ...], counts: tuple[int, ...]):
+    for count in counts:
+        for p in parallelism:
+            kwargs: list[tuple[str, dict[str, Any]]] = [ ("On-demand", {}), ("Pool", { "min_threads": p }) ]
+
+            for mode, kw in kwargs:
+                for submit, run in (("Single", run_tasks), ("Batch", run_batch)):
+                    with ConcurrentTaskScheduler(p, **kw) as scheduler:
+                        run(scheduler, min(count, 1000)) # warm-up
+                        t = run(scheduler, count)
+                    print("Tasks=%d Parallelism=%d %s %s : %.0f tasks/s" % (count, p, mode, submit, count / t))
+
+if __name__ == "__main__":
+    baseline_task_scheduler((2, 4), (1000, 10000, 100000))
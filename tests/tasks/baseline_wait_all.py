@@ -0,0 +1,38 @@
+# pyright: basic
+# ruff: noqa
+from datetime import datetime
+
+from runtime.threading.tasks import Task
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+
+def fn_tiny(task: Task[int], value: int) -> int:
+    return value
+
+def baseline_wait_all(counts: tuple[int, ...]):
+    for count in counts:
+        with ConcurrentTaskScheduler(4) as scheduler:
+            # completed tasks
+            tasks = Task.run_many(fn_tiny, ( (i,) for i in range(count) ), scheduler = scheduler)
+            for task in tasks:
+                task.wait()
+            ts = datetime.now()
+            Task.wait_all(tasks)
+            t = (datetime.now()-ts).total_seconds()
+            print("Tasks=%d Completed : wait_all %.3fs" % (count, t))
+
+            # pending tasks
+            ts = datetime.now()
+            tasks = Task.run_many(fn_tiny, ( (i,) for i in range(count) ), scheduler = scheduler)
+            Task.wait_all(tasks)
+            t = (datetime.now()-ts).total_seconds()
+            print("Tasks=%d Pending : run_many + wait_all %.3fs" % (count, t))
+
+            # continuation
+            ts = datetime.now()
+            tasks = Task.run_many(fn_tiny, ( (i,) for i in range(count) ), scheduler = scheduler)
+            Task.with_all(tasks).run(lambda task: None).wait()
+            t = (datetime.now()-ts).total_seconds()
+            print("Tasks=%d Pending : run_many + with_all %.3fs" % (count, t))
+
+if __name__ == "__main__":
+    baseline_wait_all((10000, 100000))
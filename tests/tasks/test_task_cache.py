@@ -0,0 +1,114 @@
+# pyright: basic
+# ruff: noqa
+from pytest import raises as assert_raises
+from re import escape
+from typing import Any
+from time import sleep
+from threading import Thread
+
+from runtime.threading.tasks import Task, TaskCache, task_cached, TaskException
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler, SchedulerClosedError, QueuePolicy
+from runtime.threading import Event
+
+from tests.shared_functions import fn_return_value_after_time, fn_fail_after_time
+
+
+def test_single_flight(internals):
+    cache = TaskCache[str, str]()
+    calls: list[str] = []
+    gate = Event()
+
+    def fn_lookup(task: Task[str], key: str) -> str:
+        calls.append(key)
+        gate.wait()
+        return key.upper()
+
+    tasks: list[Task[str]] = []
+    threads = [ Thread(target = lambda: tasks.append(cache.get("a", fn_lookup, "a"))) for _ in range(10) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    gate.signal()
+    assert all(task is tasks[0] for task in tasks)
+    assert [ task.result for task in tasks ] == [ "A" ] * 10
+    assert calls == [ "a" ]
+
+    # completed tasks are cached
+    assert cache.get("a", fn_lookup, "a") is tasks[0]
+    assert "a" in cache
+    assert cache.get("b", fn_lookup, "b").result == "B"
+    assert len(cache) == 2
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert cache.get("a", fn_lookup, "a") is not tasks[0]
+    cache.clear()
+    assert len(cache) == 0
+
+    with assert_raises(ValueError):
+        TaskCache(max_size = 0)
+    with assert_raises(ValueError):
+        TaskCache(ttl = 0)
+
+
+def test_eviction(internals):
+    cache = TaskCache[int, Any](max_size = 2, ttl = 0.1)
+
+    t1 = cache.get(1, fn_return_value_after_time, 0, 1)
+    t2 = cache.get(2, fn_return_value_after_time, 0, 2)
+    assert cache.get(1, fn_return_value_after_time, 0, 1) is t1 # 1 is now the most recently used
+    cache.get(3, fn_return_value_after_time, 0, 3)
+    assert 1 in cache and 2 not in cache and 3 in cache
+
+    # completed tasks expire
+    t1.wait()
+    assert cache.get(1, fn_return_value_after_time, 0, 1) is t1
+    sleep(0.15)
+    assert cache.get(1, fn_return_value_after_time, 0, 1) is not t1
+
+    # failed tasks are evicted immediately
+    failed = cache.get(4, fn_fail_after_time, 0, "error")
+    failed.wait()
+    assert failed.is_failed
+    assert 4 not in cache
+    assert cache.get(4, fn_return_value_after_time, 0, 4).result == 4
+
+    # tasks which could not be scheduled are not cached
+    scheduler = ConcurrentTaskScheduler(2)
+    scheduler.close()
+    cache = TaskCache[int, Any](scheduler = scheduler)
+    with assert_raises(TaskException, match = escape(str(SchedulerClosedError))):
+        cache.get(1, fn_return_value_after_time, 0, 1)
+    assert len(cache) == 0
+
+
+def test_bounded_scheduler(internals):
+    # scheduling may block the caller until a task completes, so it mustn't happen while the cache is locked
+    with ConcurrentTaskScheduler(1, max_queue_size = 1, queue_policy = QueuePolicy.BLOCK) as scheduler:
+        cache = TaskCache[int, Any](ttl = 10, scheduler = scheduler)
+        tasks: list[Task[Any]] = []
+        thread = Thread(target = lambda: tasks.extend(cache.get(i, fn_return_value_after_time, 0.1, i) for i in range(4)))
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert Task.wait_all(tasks, 5)
+        assert [ task.result for task in tasks ] == [ 0, 1, 2, 3 ]
+        assert all(cache.get(i, fn_return_value_after_time, 0.1, i) is tasks[i] for i in range(4))
+
+
+def test_task_cached(internals):
+    calls: list[tuple[int, int]] = []
+
+    @task_cached(max_size = 10)
+    def fn_add(task: Task[int], a: int, b: int = 0) -> int:
+        calls.append((a, b))
+        return a + b
+
+    assert fn_add(1, 2).result == 3
+    assert fn_add(1, 2).result == 3
+    assert fn_add(1, b = 2).result == 3
+    assert fn_add(1, b = 2).result == 3
+    assert calls == [ (1, 2), (1, 2) ]
+    assert fn_add.__name__ == "fn_add"
+    assert len(fn_add.cache) == 2
@@ -0,0 +1,114 @@
+# pyright: basic
+# ruff: noqa
+from pytest import raises as assert_raises
+from time import time
+
+from runtime.threading.tasks import Task, TaskGraph, TaskState
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+from runtime.threading import InterruptSignal
+
+from tests.shared_functions import fn_return_value_after_time, fn_fail_after_time
+
+
+def fn_sum(task: Task[int], *values: int) -> int:
+    return sum(values)
+
+
+def test_basic(internals):
+    calls: list[str] = []
+
+    def fn_shared(task: Task[int]) -> int:
+        calls.append(task.name)
+        return 1
+
+    graph = TaskGraph()
+    graph.add("shared", fn_shared)
+    graph.add("a", fn_return_value_after_time, 0.2, 10)
+    graph.add("b", fn_return_value_after_time, 0.2, 20)
+    graph.add("a+shared", fn_sum, depends_on = ("a", "shared"))
+    graph.add("b+shared", fn_sum, 100, depends_on = ("b", "shared"))
+    graph.add("total", fn_sum, depends_on = ("a+shared", "b+shared"))
+
+    with ConcurrentTaskScheduler(4) as scheduler:
+        start = time()
+        tasks = graph.run(scheduler)
+        assert all(task.state != TaskState.NOTSTARTED for task in tasks.values()) # all nodes may be awaited immediately
+        assert tasks["total"].result == 132
+        assert time() - start < 0.39 # independent branches run in parallel
+
+    assert calls == [ "shared" ] # shared dependencies are run once
+    assert tasks["total"].name == "total"
+    assert tasks["a"].priority > tasks["total"].priority
+
+
+def test_plan(internals):
+    graph = TaskGraph()
+    graph.add("short", fn_sum, cost = 1)
+    graph.add("long", fn_sum, cost = 5)
+    graph.add("end", fn_sum, depends_on = ("short", "long"), cost = 0)
+    graph.add("end2", fn_sum, depends_on = ("end",), cost = 0)
+
+    plan = graph.plan()
+    assert [ node.name for node in plan ] == [ "long", "short", "end", "end2" ] # critical path first
+    assert [ node.rank for node in plan ] == [ 5, 1, 0, 0 ]
+    assert plan[2].dependencies == ("short", "long")
+    assert list(graph.nodes) == [ "short", "long", "end", "end2" ]
+    assert '"long" -> "end";' in graph.to_dot()
+
+    # nodes becoming ready at the same time are queued critical path first, also below the roots
+    calls: list[str] = []
+
+    def fn_record(task: Task[None], *results: None) -> None:
+        calls.append(task.name)
+
+    fan_out = TaskGraph()
+    fan_out.add("root", fn_record)
+    fan_out.add("cheap", fn_record, depends_on = ("root",), cost = 1)
+    fan_out.add("costly", fn_record, depends_on = ("root",), cost = 5)
+    fan_out.add("medium", fn_record, depends_on = ("root",), cost = 3)
+
+    with ConcurrentTaskScheduler(1) as scheduler: # FIFO queue and a single thread, so nodes run in the order queued
+        tasks = fan_out.run(scheduler)
+        assert Task.wait_all(list(tasks.values()))
+    assert calls == [ "root", "costly", "medium", "cheap" ]
+
+    with assert_raises(ValueError):
+        graph.add("end", fn_sum)
+    with assert_raises(ValueError):
+        graph.add("negative", fn_sum, cost = -1)
+
+    graph.add("unknown", fn_sum, depends_on = ("missing",))
+    with assert_raises(ValueError, match = "unknown node 'missing'"):
+        graph.plan()
+
+    graph = TaskGraph()
+    graph.add("a", fn_sum, depends_on = ("b",))
+    graph.add("b", fn_sum, depends_on = ("a",))
+    graph.add("c", fn_sum)
+    with assert_raises(ValueError, match = "cycle involving nodes a, b"):
+        graph.run()
+
+
+def test_failure(internals):
+    graph = TaskGraph()
+    graph.add("error", fn_fail_after_time, 0, "error")
+    graph.add("ok", fn_return_value_after_time, 0, 1)
+    graph.add("dependent", fn_sum, depends_on = ("ok", "error"))
+    graph.add("independent", fn_sum, depends_on = ("ok",))
+
+    tasks = graph.run()
+    Task.wait_all([ tasks["independent"] ])
+    tasks["dependent"].wait()
+    assert tasks["dependent"].is_failed
+    assert str(tasks["dependent"].exception) == "error"
+    assert tasks["independent"].result == 1
+
+    signal = InterruptSignal()
+    graph = TaskGraph()
+    graph.add("slow", fn_return_value_after_time, 10, 1)
+    graph.add("dependent", fn_sum, depends_on = ("slow",))
+    tasks = graph.run(interrupt = signal.interrupt)
+    signal.signal()
+    tasks["dependent"].wait()
+    assert tasks["slow"].state == TaskState.INTERRUPTED
+    assert tasks["dependent"].state == TaskState.INTERRUPTED
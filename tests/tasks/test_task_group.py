@@ -0,0 +1,82 @@
+# pyright: basic
+# ruff: noqa
+from pytest import raises as assert_raises
+from re import escape
+from time import time
+
+from runtime.threading.tasks import Task, TaskGroup, TaskGroupClosedError, TaskException, AggregateException, TaskState
+from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler, SchedulerClosedError
+from runtime.threading import InterruptSignal, InterruptException
+
+from tests.shared_functions import fn_return_value_after_time, fn_fail_after_time
+
+
+def test_basic(internals):
+    with TaskGroup(name = "group") as group:
+        tasks = [ group.run(fn_return_value_after_time, 0.01, i) for i in range(10) ]
+        assert not group.interrupt.is_signaled
+
+    assert group.pending == 0
+    assert group.is_closed
+    assert not group.exceptions
+    assert [ task.result for task in tasks ] == list(range(10))
+    assert tasks[0].name == "group"
+
+    with assert_raises(TaskException, match = escape(str(TaskGroupClosedError))):
+        group.run(fn_return_value_after_time, 0, "test")
+
+    group = TaskGroup()
+    assert group.wait(0)
+    task = group.run(fn_return_value_after_time, 0.05, "test")
+    assert group.pending == 1
+    assert not group.wait(0)
+    assert group.wait(1)
+    assert task.result == "test"
+
+
+def test_failure(internals):
+    start = time()
+
+    with assert_raises(AggregateException) as ex:
+        with TaskGroup() as group:
+            siblings = [ group.run(fn_return_value_after_time, 10, i) for i in range(3) ]
+            group.run(fn_fail_after_time, 0.05, "error")
+
+    # the first failure interrupts the siblings immediately
+    assert time() - start < 5
+    assert all(sibling.state == TaskState.INTERRUPTED for sibling in siblings)
+    assert group.interrupt.is_signaled
+    assert [ str(exception) for exception in ex.value.exceptions ] == [ "error" ]
+
+    # a failing body interrupts the tasks, and its exception is propagated
+    with assert_raises(ZeroDivisionError):
+        with TaskGroup() as group:
+            task = group.run(fn_return_value_after_time, 10, "test")
+            1 / 0
+    assert task.is_interrupted
+
+    # tasks which could not be scheduled are not awaited
+    scheduler = ConcurrentTaskScheduler(2)
+    scheduler.close()
+    with TaskGroup(scheduler = scheduler) as group:
+        with assert_raises(TaskException, match = escape(str(SchedulerClosedError))):
+            group.run(fn_return_value_after_time, 0, "test")
+        assert group.pending == 0
+
+
+def test_interrupt(internals):
+    signal = InterruptSignal()
+
+    with assert_raises(InterruptException):
+        with TaskGroup(interrupt = signal.interrupt) as group:
+            task = group.run(fn_return_value_after_time, 10, "test")
+            signal.signal()
+
+    assert task.is_interrupted
+    assert not group.exceptions
+
+    with TaskGroup() as group:
+        task = group.run(fn_return_value_after_time, 10, "test")
+        group.cancel()
+
+    assert task.is_interrupted
@@ -4,13 +4,23 @@ from pytest import raises as assert_raises, fixture
 from datetime import datetime
 from typing import Any, List
 
-from runtime.threading import ThreadingException, InterruptSignal, sleep
-from runtime.threading.tasks import Task
-from runtime.threading.tasks.schedulers import ConcurrentTaskScheduler
+from threading import Thread, Event as TEvent, current_thread
+from time import time, sleep as time_sleep
+from re import escape
+
+from runtime.threading import ThreadingException, InterruptSignal, Event, sleep
+from runtime.threading.tasks import Task, TaskException
+from runtime.threading.tasks.schedulers import (
+    ConcurrentTaskScheduler, WorkStealingTaskScheduler, PriorityTaskScheduler, ProcessTaskScheduler, AsyncioTaskScheduler, TaskScheduler, SchedulerStats, Histogram,
+    QueuePolicy, SchedulerQueueFullError, TaskDroppedError
+)
+from runtime.threading.parallel.pipeline import PContext, PFn
+from runtime.threading.concurrent import Queue
 
 from tests.shared_functions import (
     fn_interrupt_and_wait_for_task, fn_return_value, fn_return_value_after_time,
-    fn_wait_until_scheduled_and_return_result
+    fn_wait_until_scheduled_and_return_result, fn_return_pid, fn_wait_for_interrupt, fn_fail_immediately,
+    fn_continue_and_return_result_or_state
 )
 
 def test_concurrent_task_scheduler(internals):
@@ -87,3 +97,448 @@ def test_unqueue(internals):
 
         assert t1.is_completed
         assert t2.is_completed
+
+def test_current(internals):
+    def fn_current(task: Task[Any], scheduler: TaskScheduler) -> bool:
+        registration = TaskScheduler.registrations()[current_thread()]
+        return TaskScheduler.current() is scheduler and TaskScheduler.current_task() is task and registration == (scheduler, task)
+
+    assert TaskScheduler.current() is TaskScheduler.default()
+    assert TaskScheduler.current_task() is None
+    assert current_thread() not in TaskScheduler.registrations()
+
+    with ConcurrentTaskScheduler(2) as scheduler:
+        tasks = [ Task.create(scheduler=scheduler).run(fn_current, scheduler) for _ in range(10) ]
+        assert all(task.result for task in tasks)
+
+    assert not any( registered_scheduler is scheduler for registered_scheduler, _ in TaskScheduler.registrations().values() )
+
+
+def test_scheduler_stats(internals):
+    for scheduler in ( ConcurrentTaskScheduler(2, 0.05), WorkStealingTaskScheduler(2, 0.05) ):
+        with scheduler:
+            # tasks awaiting longer than TASK_SUSPEND_AFTER are suspended
+            tasks = [ Task.create(scheduler=scheduler).run(fn_return_value_after_time, 0.3, "abc") for _ in range(4) ]
+            stats = scheduler.stats()
+            assert isinstance(stats, SchedulerStats)
+            assert stats.tasks_queued == 4
+            assert stats.queue_depth <= 4
+            Task.wait_all(tasks)
+
+        stats = scheduler.stats()
+        assert stats.queue_depth == 0
+        assert stats.tasks_queued == stats.tasks_started == stats.tasks_completed == 4
+        assert stats.suspensions >= 1
+        assert stats.resumes == stats.suspensions
+        assert stats.threads_spawned >= 2
+        assert stats.threads_reclaimed == stats.threads_spawned
+        assert stats.queue_wait.count == 4
+        assert stats.run_time.count == 4
+        assert stats.run_time.mean >= 0.3
+        assert 0.3 <= stats.run_time.percentile(50) <= stats.run_time.max
+        assert sum( count for _, count in stats.run_time.buckets ) == 4
+
+    with AsyncioTaskScheduler() as scheduler:
+        Task.wait_all([ Task.create(scheduler=scheduler).run(fn_return_value, i) for i in range(10) ])
+
+    stats = scheduler.stats()
+    assert stats.tasks_queued == stats.tasks_started == stats.tasks_completed == stats.run_time.count == 10
+    assert stats.queue_depth == 0
+
+    histogram = Histogram([ 0, 1, 2, 0, 1 ] + [ 0 ] * 27, 0.00002, 0.000009)
+    assert histogram.count == 4
+    assert histogram.mean == 0.000005
+    assert histogram.buckets == ( ( 0.000002, 1 ), ( 0.000004, 2 ), ( 0.000016, 1 ) )
+    assert histogram.percentile(25) == 0.000002
+    assert histogram.percentile(75) == 0.000004
+    assert histogram.percentile(100) == 0.000009 # capped by max
+    assert Histogram([ 0 ] * 32, 0, 0).percentile(50) == 0
+
+    with assert_raises(ValueError):
+        histogram.percentile(101)
+
+
+def test_concurrent_task_scheduler_pool(internals):
+    with ConcurrentTaskScheduler(4, 0.05, min_threads = 2) as ts:
+        assert ts.min_threads == 2
+        assert ts.active_threads == 2 # pre-warmed
+
+        tasks_list = [ Task.create(scheduler=ts).run(fn_return_value, i) for i in range(20) ]
+        assert [ t.result for t in tasks_list ] == list(range(20))
+
+        w_start = datetime.now()
+        while ts.active_threads > 2 and (datetime.now()-w_start).total_seconds() < 5:
+            sleep(0.1)
+
+        sleep(0.2) # pool threads are parked, not reclaimed
+        assert ts.active_threads == 2
+        assert ts.idle_threads == 2
+
+        assert Task.create(scheduler=ts).run(fn_return_value, 42).result == 42
+
+    assert ts.active_threads == 0
+
+    with assert_raises(ValueError, match="min_threads"):
+        ConcurrentTaskScheduler(2, min_threads = 3)
+
+def test_concurrent_task_scheduler_resume_lane(internals):
+    def fn_wait_for_event(task: Task[Any], event: Event, order: list[Any]) -> None:
+        event.wait()
+        order.append("resumed")
+
+    def fn_work(task: Task[Any], event: Event, order: list[Any], i: int) -> None:
+        event.signal()
+        time_sleep(0.01) # blocks without suspending
+        order.append(i)
+
+    with ConcurrentTaskScheduler(1, 5) as ts:
+        for _ in range(5):
+            event = Event()
+            order: list[Any] = []
+            waiting = Task.create(scheduler=ts).run(fn_wait_for_event, event, order)
+
+            while ts.suspended_threads == 0:
+                time_sleep(0.01)
+
+            tasks = [ Task.create(scheduler=ts).run(fn_work, event, order, i) for i in range(10) ]
+            Task.wait_all([ waiting, *tasks ])
+
+            # the resumed task is handed the slot before queued tasks are run
+            assert order.index("resumed") <= 2
+
+        stats = ts.stats()
+        assert stats.suspensions == stats.resumes == 5
+        assert stats.threads_spawned <= 2 # threads handing over their slot are parked as spares and reused
+        assert ts.spare_threads <= 1
+
+
+def test_concurrent_task_scheduler_bounded_queue(internals):
+    def fn_wait_for_gate(task: Task[Any], gate: TEvent) -> None:
+        gate.wait()
+
+    def fn_return_thread(task: Task[Any]) -> Any:
+        return current_thread()
+
+    with assert_raises(ValueError):
+        ConcurrentTaskScheduler(1, max_queue_size = 0)
+
+    for policy in QueuePolicy:
+        gate = TEvent()
+
+        with ConcurrentTaskScheduler(1, 0.05, max_queue_size = 2, queue_policy = policy) as ts:
+            assert ts.max_queue_size == 2
+            assert ts.queue_policy == policy
+
+            blocking = Task.create(scheduler=ts).run(fn_wait_for_gate, gate)
+            queued = [ Task.create(scheduler=ts).run(fn_return_value, i) for i in range(2) ]
+            assert ts.stats().queue_depth == 2
+
+            if policy == QueuePolicy.RAISE:
+                with assert_raises(TaskException, match=escape(str(SchedulerQueueFullError))):
+                    Task.create(scheduler=ts).run(fn_return_value, 2)
+
+            elif policy == QueuePolicy.CALLER_RUNS:
+                task = Task.create(scheduler=ts).run(fn_return_thread)
+                assert task.is_completed
+                assert task.result is current_thread()
+
+            elif policy == QueuePolicy.DROP_OLDEST:
+                task = Task.create(scheduler=ts).run(fn_return_value, 2)
+                assert queued[0].is_failed
+                assert queued[0].exception is TaskDroppedError
+                queued = [ queued[1], task ]
+
+            else:
+                signal = InterruptSignal()
+                interrupted: list[Task[Any]] = []
+                producer = Thread(target = lambda: interrupted.append(Task.create(scheduler=ts, interrupt=signal.interrupt).run(fn_return_value, 2)))
+                producer.start()
+                producer.join(0.1)
+                assert producer.is_alive() # blocked on the full queue
+                signal.signal()
+                producer.join()
+                assert interrupted[0].is_interrupted
+
+                results: list[int] = []
+                producer = Thread(target = lambda: results.append(Task.create(scheduler=ts).run(fn_return_value, 3).result))
+                producer.start()
+                producer.join(0.1)
+                assert producer.is_alive()
+                gate.set()
+                producer.join()
+                assert results == [ 3 ]
+
+            gate.set()
+            blocking.wait()
+            assert Task.wait_all(queued)
+            assert ts.stats().queue_depth == 0
+
+    # with DROP_OLDEST, a queue holding nothing droppable (ie. only resuming threads) makes the producer block instead
+    class UndroppableQueue(Queue[Any]):
+        def try_remove_oldest(self, predicate):
+            return None, False
+
+    class UndroppableScheduler(ConcurrentTaskScheduler):
+        def _create_queue(self):
+            return UndroppableQueue()
+
+    with UndroppableScheduler(1, 0.05, max_queue_size = 1, queue_policy = QueuePolicy.DROP_OLDEST) as ts:
+        gate = TEvent()
+        blocking = Task.create(scheduler=ts).run(fn_wait_for_gate, gate)
+        queued = [ Task.create(scheduler=ts).run(fn_return_value, 0) ]
+
+        results: list[int] = []
+        producer = Thread(target = lambda: results.append(Task.create(scheduler=ts).run(fn_return_value, 1).result))
+        producer.start()
+        producer.join(0.1)
+        assert producer.is_alive() # blocked on the full queue
+        assert ts.stats().queue_depth == 1
+        assert not queued[0].is_failed
+
+        gate.set()
+        producer.join()
+        assert results == [ 1 ]
+        assert Task.wait_all([ blocking, *queued ])
+
+
+def test_work_stealing_task_scheduler(internals):
+    def fn_fib(task: Task[int], n: int) -> int:
+        assert TaskScheduler.current() is ts
+        if n < 2:
+            return n
+        t1 = Task.run(fn_fib, n-1)
+        t2 = Task.run(fn_fib, n-2)
+        return t1.result + t2.result
+
+    with WorkStealingTaskScheduler(4, 0.05) as ts:
+        assert ts.max_parallelism == 4
+        assert Task.create(scheduler=ts).run(fn_fib, 15).result == 610
+
+        tasks_list = [ Task.create(scheduler=ts).run(fn_return_value_after_time, 0.05, str(i)) for i in range(10) ]
+        assert [ t.result for t in tasks_list ] == [ str(i) for i in range(10) ]
+        assert ts.suspended_threads == 0
+
+        def fn_double(task: Task[Any], item: int) -> Any:
+            assert TaskScheduler.current() is ts
+            yield item * 2
+
+        with PContext(2, scheduler=ts):
+            result = sorted(PFn(fn_double)(range(10)))
+            assert result == [ i * 2 for i in range(10) ]
+
+        w_start = datetime.now()
+        while ts.active_threads and (datetime.now()-w_start).total_seconds() < 5:
+            sleep(0.1)
+
+        assert ts.active_threads == 0
+
+    with assert_raises(ThreadingException, match="Task scheduler has been closed"):
+        Task.create(scheduler=ts).run(fn_return_value, 1)
+
+def test_work_stealing_task_scheduler_local_and_steal(internals):
+    def fn_thread(task: Task[Any]) -> Any:
+        return current_thread()
+
+    def fn_inline(task: Task[Any]) -> bool:
+        child = Task.run(fn_thread) # pushed onto the local deque, and run inline when awaited
+        return child.result is current_thread()
+
+    with WorkStealingTaskScheduler(1, 0.05) as ts:
+        assert Task.create(scheduler=ts).run(fn_inline).result
+
+    def fn_stolen(task: Task[Any], started: TEvent) -> Any:
+        started.set()
+        return current_thread()
+
+    def fn_busy(task: Task[Any]) -> bool:
+        started = TEvent()
+        child = Task.run(fn_stolen, started)
+        assert started.wait(5) # child is stolen by the idle worker, while this one is busy
+        return child.result is not current_thread()
+
+    with WorkStealingTaskScheduler(2, 0.05) as ts:
+        assert Task.create(scheduler=ts).run(fn_busy).result
+
+    def fn_inline_while_searched(task: Task[Any]) -> bool:
+        available = ts._WorkStealingTaskScheduler__available
+        child = Task.run(fn_thread)
+        available.acquire() # hold the permit of the child, as a searching worker would
+        try:
+            # the owner mustn't block on the permit, but owe it instead
+            return child.result is current_thread() and ts._WorkStealingTaskScheduler__debt == 1
+        finally:
+            available.release() # the searching worker finds nothing
+
+    with WorkStealingTaskScheduler(1, 0.05) as ts:
+        assert Task.create(scheduler=ts).run(fn_inline_while_searched).result
+        sleep(0.1)
+        assert ts._WorkStealingTaskScheduler__debt == 0 # settled by the worker, which found nothing
+        assert Task.create(scheduler=ts).run(fn_inline).result
+
+def test_work_stealing_task_scheduler_wait_timeout(internals):
+    def fn_wait(task: Task[Any]) -> float:
+        child = Task.run(fn_return_value_after_time, 0.5, "abc")
+        start = time()
+        assert not child.wait(0.05)
+        return time() - start
+
+    with WorkStealingTaskScheduler(1, 0.05) as ts:
+        assert Task.create(scheduler=ts).run(fn_wait).result < 0.4
+
+
+def test_priority_task_scheduler(internals):
+    order: list[str] = []
+
+    def fn_block(task: Task[Any], event: TEvent) -> None:
+        event.wait()
+
+    def fn_append(task: Task[Any], value: str) -> None:
+        order.append(value)
+
+    with assert_raises(ValueError, match="aging"):
+        PriorityTaskScheduler(1, aging = 0)
+
+    with PriorityTaskScheduler(1, 0.05, aging = None) as ts:
+        assert ts.aging is None
+        event = TEvent()
+        blocker = Task.create(scheduler=ts).run(fn_block, event)
+        tasks = [
+            Task.create(scheduler=ts, priority=priority).run(fn_append, value)
+            for priority, value in [ (0, "a"), (5, "b"), (1, "c"), (5, "d"), (3, "e") ]
+        ]
+        event.set()
+        Task.wait_all([ blocker, *tasks ])
+
+        assert order == [ "b", "d", "e", "c", "a" ]
+
+    order.clear()
+
+    with PriorityTaskScheduler(1, 0.05, aging = 0.01) as ts:
+        event = TEvent()
+        blocker = Task.create(scheduler=ts).run(fn_block, event)
+        low = Task.create(scheduler=ts, priority=0).run(fn_append, "low")
+        sleep(0.1) # the low priority task has gained ~10 priority levels
+        high = Task.create(scheduler=ts, priority=5).run(fn_append, "high")
+        event.set()
+        Task.wait_all([ blocker, low, high ])
+
+        assert order == [ "low", "high" ]
+
+
+def test_process_task_scheduler(internals):
+    from os import getpid
+    from runtime.threading.tasks import ContinuationOptions
+
+    with ProcessTaskScheduler(2) as ts:
+        assert ts.max_parallelism == 2
+        assert not ts.local_fallback
+
+        remote = Task.create(scheduler=ts).run(fn_return_pid)
+        assert remote.result != getpid()
+
+        unpicklable = Task.create(scheduler=ts).run(lambda task: getpid()) # lambdas can't be pickled
+        unpicklable.wait()
+        assert unpicklable.is_failed
+        assert "cannot be pickled" in str(unpicklable.exception)
+
+        failed = Task.create(scheduler=ts).run(fn_fail_immediately, "remote error")
+        failed.wait()
+        assert failed.is_failed
+        assert str(failed.exception) == "remote error"
+
+        signal = InterruptSignal()
+        interrupted = Task.create(scheduler=ts, interrupt=signal.interrupt).run(fn_wait_for_interrupt, 10)
+        sleep(0.5)
+        start = time()
+        signal.signal()
+        interrupted.wait()
+        assert interrupted.is_interrupted
+        assert time() - start < 0.05 # the interrupt reaches the worker process right away
+
+    with ProcessTaskScheduler(1, local_fallback = True) as ts:
+        assert ts.local_fallback
+        local = Task.create(scheduler=ts).run(lambda task: getpid()) # run locally instead
+        assert local.result == getpid()
+
+        value = Task.create(scheduler=ts).run(fn_return_value, 42)
+        continuation = value.continue_with(ContinuationOptions.DEFAULT, fn_continue_and_return_result_or_state)
+        assert continuation.result == 42
+
+
+def test_asyncio_task_scheduler(internals):
+    from asyncio import sleep as async_sleep, run, get_running_loop
+    from threading import active_count
+
+    async def fn_async(task: Task[str], t_sleep: float, value: str) -> str:
+        await async_sleep(t_sleep)
+        task.interrupt.raise_if_signaled()
+        return value
+
+    async def fn_async_await(task: Task[str], other: Task[str]) -> str:
+        return (await other) + "!"
+
+    def fn_sync(task: Task[str]) -> str:
+        return current_thread().name
+
+    threads = active_count()
+
+    with AsyncioTaskScheduler() as ts:
+        start = time()
+        tasks = [ Task.create(scheduler=ts).run(fn_async, 0.2, str(i)) for i in range(200) ]
+        assert active_count() == threads + 1 # a single loop thread, regardless of no. of awaiting tasks
+        Task.wait_all(tasks)
+        assert [ task.result for task in tasks ] == [ str(i) for i in range(200) ]
+        assert time() - start < 2
+
+        assert Task.create(scheduler=ts).run(fn_sync).result == "AsyncioTaskScheduler.Loop-Thread"
+
+        awaited = Task.create(scheduler=ts).run(fn_async, 0.01, "awaited")
+        assert Task.create(scheduler=ts).run(fn_async_await, awaited).result == "awaited!"
+
+        failed = Task.create(scheduler=ts).run(fn_fail_immediately, "error")
+        failed.wait()
+        assert failed.is_failed
+
+        signal = InterruptSignal()
+        interrupted = Task.create(scheduler=ts, interrupt=signal.interrupt).run(fn_async, 0.05, "interrupted")
+        signal.signal()
+        interrupted.wait()
+        assert interrupted.is_interrupted
+
+        async def fn_async_current(task: Task[tuple[bool, bool, bool]]) -> tuple[bool, bool, bool]:
+            await async_sleep(0.01) # the task is still current after resuming
+            return Task.current() is task, TaskScheduler.current_task() is task, TaskScheduler.current() is ts
+
+        currents = [ Task.create(scheduler=ts).run(fn_async_current) for _ in range(3) ]
+        assert [ task.result for task in currents ] == [ ( True, True, True ) ] * 3
+        assert TaskScheduler.current_task() is None
+
+        # the interrupt cancels an awaiting coroutine right away
+        signal = InterruptSignal()
+        interrupted = Task.create(scheduler=ts, interrupt=signal.interrupt).run(fn_async, 3, "interrupted")
+        time_sleep(0.1)
+        start = time()
+        signal.signal()
+        assert interrupted.wait(1)
+        assert interrupted.is_interrupted
+        assert time() - start < 0.5
+
+    assert ts.running_tasks == 0
+
+    with assert_raises(ThreadingException, match="Task scheduler has been closed"):
+        Task.create(scheduler=ts).run(fn_async, 0, "closed")
+
+    async def fn_main() -> str:
+        scheduler = AsyncioTaskScheduler(get_running_loop())
+        assert scheduler.loop is get_running_loop()
+        task = Task.create(scheduler=scheduler).run(fn_async, 0.01, "external")
+
+        with assert_raises(ThreadingException, match="running tasks"):
+            scheduler.close()
+
+        result = await task
+        await async_sleep(0.01)
+        scheduler.close()
+        return result
+
+    assert run(fn_main()) == "external"
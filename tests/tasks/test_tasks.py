@@ -4,14 +4,20 @@ from pytest import raises as assert_raises, fixture
 from typing import Any, Iterable, Sequence, TypeVar
 from typingutils import get_type_name
 from re import escape
+from time import time, sleep as time_sleep
+from threading import active_count
+from gc import collect
 
 from runtime.threading.tasks import (
     Task, ContinuationOptions, schedulers, AggregateException, TaskState, TaskException,
     TaskCompletedError, TaskNotScheduledError, TaskAlreadyRunningError, TaskAlreadyScheduledError,
-    AwaitedTaskInterruptedError
+    AwaitedTaskInterruptedError, TaskStream
 )
-from runtime.threading.tasks.schedulers import TaskScheduler, ConcurrentTaskScheduler
-from runtime.threading import InterruptSignal, Interrupt, InterruptException, Event, sleep
+from runtime.threading.tasks.schedulers import (
+    TaskScheduler, ConcurrentTaskScheduler, WorkStealingTaskScheduler, PriorityTaskScheduler, QueuePolicy,
+    SchedulerClosedError, SchedulerQueueFullError
+)
+from runtime.threading import InterruptSignal, Interrupt, InterruptException, Event, sleep, parallel
 
 from tests.shared_functions import (
     fn_return_parent_task, fn_return_task, fn_wait_for_signal, fn_schedule_task_after_time,
@@ -64,6 +70,36 @@ def test_basic(internals):
 #     t2.wait()
 
 
+def test_lazy_allocation(internals):
+    task = Task.plan(fn_return_value_after_time, 0, "abc")
+    assert task.name == f"Task_{task.id}"
+    assert task.target == "tests.shared_functions.fn_return_value_after_time"
+    assert getattr(task, "_Task__internal_event") is None
+
+    task.name = "named"
+    assert task.name == "named"
+    task.name = ""
+    assert task.name == f"Task_{task.id}"
+
+    task.run_synchronously()
+    assert getattr(task, "_Task__internal_event") is None # nobody waited for the task
+    assert task.wait()
+    signal = InterruptSignal()
+    signal.signal()
+    assert not task.wait(interrupt = signal.interrupt)
+    assert task.wait_event.is_signaled # allocated after completion, and thus signaled upon creation
+    assert task.target == "tests.shared_functions.fn_return_value_after_time"
+
+    def fn_create_ids(task: Task[list[int]]) -> list[int]:
+        return [ Task.plan(fn_return_task).id for _ in range(1000) ]
+
+    with ConcurrentTaskScheduler(4) as scheduler:
+        tasks = [ Task.create(scheduler = scheduler).run(fn_create_ids) for _ in range(4) ]
+        ids = [ id for task in tasks for id in task.result ]
+
+    assert len(set(ids)) == 4000 # ids are unique without locking
+
+
 def test_run_synchronously(internals):
     signal1 = Event()
     signal2 = InterruptSignal()
@@ -282,3 +318,264 @@ def test_run_after(internals):
         t1 = Task.create(scheduler=scheduler).run_after(0.01, fn_return_value_after_time, 0, "test")
         assert t1.result == "test"
 
+    start = time()
+    t1 = Task.run_after(0.05, fn_return_value_after_time, 0, "test")
+    assert t1.is_scheduled
+    assert t1.result == "test"
+    assert time() - start >= 0.05
+
+    # delayed tasks are held by the timer wheel, and occupy no threads while waiting
+    threads = active_count()
+    tasks = [ Task.run_after(0.2, fn_return_value_after_time, 0, i) for i in range(1000) ]
+    assert active_count() <= threads + 1
+    assert [ task.result for task in tasks ] == list(range(1000))
+
+    # interrupting a delayed task interrupts it immediately
+    signal = InterruptSignal()
+    t1 = Task.create(interrupt=signal.interrupt).run_after(10, fn_return_value_after_time, 0, "test")
+    start = time()
+    signal.signal()
+    t1.wait()
+    assert t1.is_interrupted
+    assert time() - start < 1
+
+    # delayed tasks fail if scheduler was closed in the meantime
+    scheduler = ConcurrentTaskScheduler(2)
+    t1 = Task.create(scheduler=scheduler).run_after(0.05, fn_return_value_after_time, 0, "test")
+    scheduler.close()
+    t1.wait()
+    assert t1.is_failed
+
+
+def test_stream(internals):
+    def fn_count(task: Task[None], count: int, fail: bool = False) -> Iterable[int]:
+        for i in range(count):
+            task.interrupt.raise_if_signaled()
+            yield i
+        if fail:
+            raise Exception("error")
+
+    stream = Task.stream(fn_count, 5000) # more than STREAM_BUFFER_SIZE items, so the producer must wait for the consumer
+    assert isinstance(stream, TaskStream)
+    assert list(stream) == list(range(5000))
+    assert stream.task.wait(1)
+    assert stream.task.is_completed_successfully
+
+    # streams are PIterables, and can be used as sources for parallel processes and pipelines
+    output = parallel.process(Task.stream(fn_count, 100), parallelism = 4).do(lambda task, item: [ item * 2 ])
+    assert sorted(output) == [ i * 2 for i in range(100) ]
+
+    # a failure of the producer is raised to the consumer
+    stream = Task.create(name = "stream").stream(fn_count, 3, True)
+    with assert_raises(Exception, match = "error"):
+        list(stream)
+    assert stream.task.name == "stream"
+    stream.task.wait(1)
+    assert stream.task.is_failed
+
+    # closing a stream interrupts the producer, even when it's blocked on a full buffer
+    stream = Task.stream(fn_count, 1000000)
+    assert next(iter(stream)) == 0
+    stream.close()
+    stream.task.wait(1)
+    assert stream.task.is_interrupted
+
+    # so does exiting a stream used as a context manager
+    with Task.stream(fn_count, 1000000) as stream:
+        assert next(iter(stream)) == 0
+    stream.task.wait(1)
+    assert stream.task.is_interrupted
+
+    # and abandoning a stream without closing it
+    stream = Task.stream(fn_count, 1000000)
+    task = stream.task
+    assert next(iter(stream)) == 0
+    del stream
+    collect()
+    task.wait(1)
+    assert task.is_interrupted
+
+def test_hedge(internals):
+    def fn_attempt(task: Task[int], attempts: list[Task[int]], delays: Sequence[float]) -> int:
+        attempt = len(attempts)
+        attempts.append(task)
+        start = time()
+        while time() - start < delays[attempt]:
+            task.interrupt.raise_if_signaled()
+            sleep(0.005)
+        if delays[attempt] < 0:
+            raise Exception(f"error {attempt}")
+        return attempt
+
+    # a fast attempt is not hedged
+    attempts: list[Task[int]] = []
+    assert Task.hedge(fn_attempt, attempts, [ 0, 0 ], after = 0.2).result == 0
+    sleep(0.3)
+    assert len(attempts) == 1
+
+    # a slow attempt is hedged, and the loser is interrupted
+    attempts = []
+    task = Task.create(name = "hedge").hedge(fn_attempt, attempts, [ 5, 0 ], after = 0.05)
+    assert task.result == 1
+    assert task.name == "hedge"
+    assert attempts[0].wait(1)
+    assert attempts[0].is_interrupted
+
+    attempts = []
+    assert Task.hedge(fn_attempt, attempts, [ 0.2, 0.2, 0.2 ], after = 0.01, max_copies = 1).result == 0
+    assert len(attempts) == 1
+
+    # attempts are not retried, so the task fails if every attempt launched fails
+    attempts = []
+    task = Task.hedge(fn_attempt, attempts, [ -1, 0 ], after = 0.2)
+    with assert_raises(Exception, match = "error 0"):
+        task.result
+    assert task.is_failed
+    assert len(attempts) == 1
+
+    attempts = []
+    task = Task.hedge(fn_attempt, attempts, [ 0.1, -1 ], after = 0.01)
+    assert task.result == 0
+
+    # an external interrupt interrupts every attempt, and the task
+    signal = InterruptSignal()
+    attempts = []
+    task = Task.create(interrupt = signal.interrupt).hedge(fn_attempt, attempts, [ 5, 5 ], after = 0.01)
+    sleep(0.1)
+    signal.signal()
+    task.wait(1)
+    assert task.is_interrupted
+    assert all(attempt.is_interrupted for attempt in attempts)
+
+    # the task is completed by the winning attempt, rather than queued behind the backlog of the scheduler
+    def fn_busy(task: Task[None], duration: float) -> None:
+        time_sleep(duration) # occupies the thread, unlike waiting on an event (which suspends the task)
+
+    with ConcurrentTaskScheduler(2) as scheduler:
+        attempts = []
+        task = Task.create(scheduler = scheduler).hedge(fn_attempt, attempts, [ 0.1 ], after = 1)
+        backlog = [ Task.create(scheduler = scheduler).run(fn_busy, 0.5) for _ in range(4) ]
+        assert task.wait_event.wait(0.4) # not task.wait(), which would run a queued task inline
+        assert task.result == 0
+        Task.wait_all(backlog)
+
+    with assert_raises(ValueError):
+        Task.hedge(fn_attempt, [], [ 0 ], after = -1)
+    with assert_raises(ValueError):
+        Task.hedge(fn_attempt, [], [ 0 ], max_copies = 0)
+
+def test_run_many(internals):
+    for scheduler in (ConcurrentTaskScheduler(2), WorkStealingTaskScheduler(2), PriorityTaskScheduler(2)):
+        with scheduler:
+            batch = Task.run_many(fn_return_value_after_time, ( (0, i) for i in range(100) ), scheduler = scheduler)
+            assert len(batch) == 100
+            assert all(task.is_scheduled for task in batch)
+            assert batch.results() == list(range(100))
+            assert batch.wait_all(1)
+
+            batch = Task.run_many(fn_return_value_after_time, [ (0.2, "slow"), (0, "fast") ], scheduler = scheduler)
+            assert [ task.result for task in batch.as_completed(5) ] == [ "fast", "slow" ]
+
+            batch = Task.run_many(fn_return_value_after_time, [ (0.2, "slow") ], scheduler = scheduler)
+            with assert_raises(TimeoutError):
+                list(batch.as_completed(0.01))
+
+    batch = Task.create(name = "batch").run_many(fn_fail_after_time, [ (0, "error") ])
+    with assert_raises(AggregateException):
+        batch.results()
+    assert batch[0].name == "batch"
+    assert Task.run_many(fn_return_value_after_time, []).results() == []
+
+    # the tasks are reverted if none could be queued
+    scheduler = ConcurrentTaskScheduler(2)
+    scheduler.close()
+    with assert_raises(TaskException, match = escape(str(SchedulerClosedError))):
+        Task.run_many(fn_return_value_after_time, [ (0, "test") ], scheduler = scheduler)
+
+    # tasks which could not be queued on a bounded scheduler are failed
+    with ConcurrentTaskScheduler(1, max_queue_size = 1, queue_policy = QueuePolicy.RAISE) as scheduler:
+        batch = Task.run_many(fn_return_value_after_time, [ (0.1, 1), (0, 2), (0, 3) ], scheduler = scheduler)
+        with assert_raises(AggregateException):
+            batch.wait_all()
+        assert [ task.result for task in batch[0:2] ] == [ 1, 2 ]
+        assert batch[2].is_failed
+        assert str(batch[2].exception) == str(SchedulerQueueFullError)
+
+
+def test_as_completed(internals):
+    tasks = [
+        Task.run(fn_return_value_after_time, 0.6, "slow"),
+        Task.run(fn_fail_after_time, 0.3, "error"),
+        Task.run(fn_return_value_after_time, 0, "fast")
+    ]
+
+    assert Task.wait_any_index(tasks) == 2
+    assert [ tasks.index(task) for task in Task.as_completed(tasks, 5) ] == [ 2, 1, 0 ]
+    assert Task.wait_any_index(tasks) == 0 # the first of the completed tasks
+
+    slow = Task.run(fn_return_value_after_time, 0.2, "slow")
+    assert Task.wait_any_index([ slow ], 0.01) is None
+    with assert_raises(TimeoutError):
+        list(Task.as_completed([ slow ], 0.01))
+
+    signal = InterruptSignal()
+    signal.signal()
+    assert Task.wait_any_index([ slow ], interrupt = signal.interrupt) is None
+    with assert_raises(InterruptException):
+        list(Task.as_completed([ slow ], interrupt = signal.interrupt))
+    slow.wait()
+
+
+def test_priority(internals):
+    t1 = Task.create(priority=3).run(fn_return_value_after_time, 0, "test")
+    t2 = Task.create(priority=7).run(fn_return_value_after_time, 0, "test")
+
+    assert Task.plan(fn_return_value_after_time, 0, "test").priority == 0
+    assert t1.continue_with(ContinuationOptions.DEFAULT, fn_continue_and_return_result_or_state).priority == 3
+    assert Task.with_all([t1, t2]).run(fn_get_count_of_tasks).priority == 7
+    assert Task.with_any([t1, t2], priority=1).run(fn_get_count_of_tasks).priority == 1
+    assert Task.create(priority=2).run_after(0.01, fn_return_value_after_time, 0, "test").priority == 2
+
+    Task.wait_all([t1, t2])
+
+def test_await(internals):
+    from asyncio import run, get_running_loop
+    from concurrent.futures import Future
+
+    async def fn_await() -> tuple[str, str]:
+        t1 = Task.run(fn_return_value_after_time, 0.05, "test")
+        t2 = Task.create(lazy=True).plan(fn_return_value_after_time, 0, "lazy")
+        return await t1, await t2.to_future()
+
+    assert run(fn_await()) == ("test", "lazy")
+
+    async def fn_await_failed() -> str:
+        return await Task.run(fn_fail_immediately, "error")
+
+    with assert_raises(Exception, match="error"):
+        run(fn_await_failed())
+
+    async def fn_await_not_scheduled() -> str:
+        return await Task.plan(fn_return_value_after_time, 0, "test")
+
+    with assert_raises(TaskException, match=escape(str(TaskNotScheduledError))):
+        run(fn_await_not_scheduled())
+
+    future: Future[str] = Future()
+    t3 = Task.from_future(future)
+    assert t3.is_scheduled
+    future.set_result("future")
+    assert t3.result == "future"
+
+    future = Future()
+    t4 = Task.from_future(future)
+    future.cancel()
+    t4.wait()
+    assert t4.is_interrupted
+
+    async def fn_from_asyncio_future() -> str:
+        future = get_running_loop().create_future()
+        get_running_loop().call_later(0.01, future.set_result, "asyncio")
+        return await Task.from_future(future)
+
+    assert run(fn_from_asyncio_future()) == "asyncio"
@@ -129,3 +129,145 @@ def test_multiple_auto_clear_events():
     assert not ev2.is_signaled
 
 
+def test_auto_clear_event_wake_one():
+    event = AutoClearEvent(wake_one = True)
+    assert event.wake_one
+
+    # a signal with no waiters is kept for the next waiter only
+    event.signal()
+    assert event.wait(0)
+    assert not event.wait(0)
+
+    results: list[bool] = []
+    threads = [ Thread(target=lambda: results.append(event.wait(5))) for _ in range(4) ]
+    for thread in threads:
+        thread.start()
+    while event.continuation_count < 4:
+        sleep(0.001)
+
+    # each signal wakes exactly one waiter
+    for expected in range(1, 5):
+        event.signal()
+        while len(results) < expected:
+            sleep(0.001)
+        sleep(0.05)
+        assert results == [ True ] * expected
+
+    for thread in threads:
+        thread.join()
+    assert not event.is_signaled
+    assert event.continuation_count == 0
+
+    # a waiter woken by its interrupt doesn't consume the signal
+    signal = InterruptSignal()
+    interrupted: list[bool] = []
+    thread = Thread(target=lambda: interrupted.append(event.wait(5, signal.interrupt)))
+    thread.start()
+    while event.continuation_count < 1:
+        sleep(0.001)
+    signal.signal()
+    thread.join()
+    assert interrupted == [ False ]
+    event.signal()
+    assert event.wait(0)
+
+
+
+def test_wait_all_counter(internals):
+    events = [ Event() for _ in range(3) ]
+    combined_event = Event(purpose = "CONTINUATION")
+    Event._add_continuation(events, EventContinuation(ContinueWhen.ALL, events, combined_event, None))
+
+    events[0].signal()
+    events[0].signal() # events are only counted once
+    events[1].signal()
+    events[0].clear()
+    events[2].signal() # all events were counted, but one was cleared in the meantime
+    assert not combined_event.is_signaled
+
+    events[0].signal()
+    assert combined_event.is_signaled
+
+    events = [ Event() for _ in range(3) ]
+    Thread(target=fn_sleep_and_set_event, args=(0.01, events[1])).start()
+    assert Event.wait_any_index(events, 1) == 1
+    assert Event.wait_any_index(events[2:], 0.01) is None
+
+    # events may be awaited more than once
+    event = Event()
+    Thread(target=fn_sleep_and_set_event, args=(0.01, event)).start()
+    assert Event.wait_all([event, event], 1)
+
+def test_waiter_reuse(internals):
+    from runtime.threading.core.waiter import Waiter
+
+    # the same waiter is reused by every wait of the thread
+    waiter = Waiter.acquire()
+    waiter.release()
+    assert Waiter.acquire() is waiter
+    waiter.release()
+
+    events = [ Event() for _ in range(2) ]
+    for _ in range(20):
+        assert not Event.wait_any(events, 0.001)
+        Thread(target=fn_sleep_and_set_event, args=(0.005, events[1])).start()
+        assert Event.wait_any_index(events, 1) == 1
+        events[1].clear()
+
+    # a waiter which timed out is not woken by events of a previous wait
+    event1, event2 = Event(), Event()
+    assert not Event.wait_all([event1], 0.01)
+    event1.signal()
+    assert not Event.wait_all([event2], 0.05)
+
+    # interrupts wake the waiter
+    signal = InterruptSignal()
+    Thread(target=lambda: ( sleep(0.01), signal.signal() )).start()
+    assert Event.wait_any_index([event2], 1, signal.interrupt) is None
+    assert not Event.wait_all([event1, event2], 1, signal.interrupt)
+
+def test_continuation_cleanup(internals):
+    from gc import collect
+    from runtime.threading.tasks import Task
+
+    # timed out waits are deregistered
+    event = Event()
+    signal = InterruptSignal()
+    assert not Event.wait_any([event], 0.01, signal.interrupt)
+    assert not Event.wait_all([event], 0.01, signal.interrupt)
+    assert event.continuation_count == 0
+    assert signal.interrupt.wait_event.continuation_count == 0
+
+    # interrupts only hold continuations weakly, so abandoned continuations are released with the awaited tasks
+    tasks = [ Task.create(interrupt = signal.interrupt).plan(lambda task: None) for _ in range(100) ]
+    continuations = [ Task.with_any([ task ], interrupt = signal.interrupt).run(lambda task, tasks: None) for task in tasks ]
+    assert tasks[0].wait_event.continuation_count == 1
+    assert signal.interrupt.wait_event.continuation_count == 100
+    del tasks, continuations
+    collect()
+    assert signal.interrupt.wait_event.continuation_count == 0
+
+    # delayed tasks deregister from the interrupt when they're scheduled
+    task = Task.create(interrupt = signal.interrupt).run_after(0.01, lambda task: 1)
+    assert signal.interrupt.wait_event.continuation_count == 1
+    assert task.result == 1
+    assert signal.interrupt.wait_event.continuation_count == 0
+
+def test_signal_fast_path(internals):
+    signal = InterruptSignal()
+
+    # continuations added while the event is signaled, are never missed
+    for _ in range(200):
+        event = Event()
+        results: list[bool] = []
+        thread = Thread(target=lambda: results.append(Event.wait_all([event], 1, signal.interrupt)))
+        thread.start()
+        event.signal()
+        thread.join()
+        assert results == [ True ]
+        assert event.continuation_count == 0
+
+    event = AutoClearEvent()
+    event.signal()
+    assert event.wait(0)
+    assert not event.is_signaled
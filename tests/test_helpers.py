@@ -8,8 +8,17 @@ from runtime.threading import InterruptSignal, Lock, acquire_or_fail, signal_aft
 def test_signal_after():
     sig = InterruptSignal()
     st = time()
-    signal_after(sig, 0.025)
+    timer = signal_after(sig, 0.025)
+    assert not sig.interrupt.is_signaled # signal_after doesn't block
+    assert sig.interrupt.wait(1)
     assert time()-st > 0.02
+    assert not timer.is_pending
+    assert not timer.cancel()
+
+    sig = InterruptSignal()
+    timer = signal_after(sig, 0.01)
+    assert timer.cancel()
+    assert not sig.interrupt.wait(0.05)
 
 def test_acquire_or_fail():
     lock = Lock(False)
@@ -1,7 +1,7 @@
 # pyright: basic
 # ruff: noqa
 from pytest import raises as assert_raises, fixture
-from typing import cast
+from typing import Any, cast
 from threading import Lock as TLock
 
 from runtime.threading.core.defaults import TASK_SUSPEND_AFTER
@@ -126,3 +126,56 @@ def test_acquire_or_fail(internals):
     assert not int_lock.locked()
     assert acquire_or_fail(l1, 0, lambda: Exception("Fail"))
 
+
+def test_interruptible_acquire_without_polling(internals):
+    from threading import Thread
+    from time import perf_counter
+
+    l1 = Lock(False)
+    signal = InterruptSignal()
+    results: list[Any] = []
+
+    def acquire(lock: Lock | Semaphore, interrupt: Interrupt):
+        try:
+            results.append(lock.acquire(None, interrupt))
+        except InterruptException as ex:
+            results.append(ex)
+        results.append(perf_counter())
+
+    # an interrupted acquisition returns right away, rather than after a poll interval
+    l1.acquire()
+    thread = Thread(target=acquire, args=(l1, signal.interrupt))
+    thread.start()
+    sleep(TASK_SUSPEND_AFTER * 2)
+    t_signal = perf_counter()
+    signal.signal()
+    thread.join()
+    assert isinstance(results[0], InterruptException)
+    assert results[1] - t_signal < 0.05
+
+    # an acquisition is woken right away by a release
+    results.clear()
+    thread = Thread(target=acquire, args=(l1, InterruptSignal().interrupt))
+    thread.start()
+    sleep(TASK_SUSPEND_AFTER * 2)
+    t_release = perf_counter()
+    l1.release()
+    thread.join()
+    assert results[0] is True
+    assert results[1] - t_release < 0.05
+    l1.release()
+
+    # each release of a semaphore wakes a separate waiter
+    results.clear()
+    s1 = Semaphore(2)
+    s1.acquire()
+    s1.acquire()
+    threads = [ Thread(target=acquire, args=(s1, InterruptSignal().interrupt)) for _ in range(2) ]
+    for thread in threads:
+        thread.start()
+    sleep(0.05)
+    s1.release()
+    s1.release()
+    for thread in threads:
+        thread.join(1)
+    assert results.count(True) == 2
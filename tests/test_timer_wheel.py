@@ -0,0 +1,69 @@
+# pyright: basic
+# ruff: noqa
+from pytest import raises as assert_raises
+from time import perf_counter
+from threading import Event, Lock, active_count
+
+from runtime.threading import TimerWheel, Timer
+
+def test_timer_wheel():
+    with assert_raises(ValueError):
+        TimerWheel(0)
+
+    assert TimerWheel.default() is TimerWheel.default()
+
+    # with a resolution of 10µs, delays of up to 0.5s span the three lowest levels of the wheel
+    wheel = TimerWheel(0.00001)
+    lock = Lock()
+    fired: list[tuple[float, float]] = []
+    done = Event()
+    delays = [ 0.5, 0.0001, 0.03, 0.2, 0, 0.002, 0.07, 0.3, 0.0005, -1 ]
+
+    def fn_fire(due: float):
+        with lock:
+            fired.append((due, perf_counter()))
+            if len(fired) == len(delays) - 1:
+                done.set()
+
+    for timer in [ wheel.schedule(delay, lambda: None) for delay in delays ]:
+        assert timer.cancel()
+    assert wheel.pending == 0
+
+    timers = []
+    for delay in delays:
+        timers.append(wheel.schedule(delay, (lambda d: lambda: fn_fire(d))(perf_counter() + max(delay, 0))))
+
+    assert wheel.pending == len(delays)
+    assert timers[3].cancel() # cancel the 0.2s timer
+    assert not timers[3].cancel()
+    assert not timers[3].is_pending
+    assert wheel.pending == len(delays) - 1
+
+    assert done.wait(5)
+    assert wheel.pending == 0
+    assert all( fired_at >= due for due, fired_at in fired ) # timers never fire early
+    assert all( a <= b + wheel.resolution for (a, _), (b, _) in zip(fired, fired[1:]) ) # timers fire in order (of ticks)
+    assert all( not timer.is_pending for timer in timers )
+
+def test_timer_wheel_many_timers():
+    wheel = TimerWheel()
+    threads = active_count()
+    done = Event()
+    count = [ 0 ]
+    n = 100_000
+
+    def fn_fire():
+        count[0] += 1
+        if count[0] == n // 2:
+            done.set()
+
+    timers = [ wheel.schedule(2 + (i % 100) / 1000, fn_fire) for i in range(n) ]
+    assert wheel.pending == n
+    assert active_count() <= threads + 1 # a single service thread holds all timers
+
+    for timer in timers[::2]:
+        timer.cancel()
+
+    assert done.wait(10)
+    assert count[0] == n // 2
+    assert wheel.pending == 0